@@ -0,0 +1,4 @@
+import time
+
+# Recorded as early as possible (this is the first of our modules to get imported), to measure the startup time
+STARTED_AT = time.perf_counter()
@@ -2,12 +2,13 @@ import asyncio
 
 import aiohttp
 import discord
-from aiocache import SimpleMemoryCache
+from aiocache import BaseCache, SimpleMemoryCache
 
 from src.bot import Bot
-from src.settings import BOT_TOKEN, SQLITE_DATABASE_FILE
+from src.settings import BOT_TOKEN, CACHE_BACKEND, CACHE_SQLITE_FILE, LAZY_EXTENSIONS, SQLITE_DATABASE_FILE
 from src.utils.database import apply_db_migrations, engine, get_db_session, load_db_models
 from src.utils.log import get_logger
+from src.utils.sqlite_cache import SQLiteCache
 
 log = get_logger(__name__)
 
@@ -37,6 +38,18 @@ async def _init_database(*, retries: int = 5, retry_time: float = 3) -> None:
     log.debug("Database connection established")
 
 
+def _create_cache() -> BaseCache:
+    """Create the cache instance, based on the configured cache backend."""
+    match CACHE_BACKEND:
+        case "memory":
+            return SimpleMemoryCache()
+        case "sqlite":
+            log.debug(f"Using a persistent SQLite cache: {CACHE_SQLITE_FILE}")
+            return SQLiteCache(CACHE_SQLITE_FILE)
+        case _:
+            raise ValueError(f"Unknown cache backend: {CACHE_BACKEND!r} (expected 'memory' or 'sqlite')")
+
+
 async def main() -> None:
     """Main entrypoint of the application.
 
@@ -47,10 +60,14 @@ async def main() -> None:
 
     await _init_database()
 
-    cache = SimpleMemoryCache()
-
-    async with aiohttp.ClientSession() as http_session, get_db_session() as db_session:
-        bot = Bot(intents=intents, http_session=http_session, db_session=db_session, cache=cache)
+    async with _create_cache() as cache, aiohttp.ClientSession() as http_session, get_db_session() as db_session:
+        bot = Bot(
+            intents=intents,
+            http_session=http_session,
+            db_session=db_session,
+            cache=cache,
+            lazy_extensions=LAZY_EXTENSIONS,
+        )
         bot.load_all_extensions()
 
         log.info("Starting the bot...")
@@ -1,4 +1,7 @@
-from collections.abc import Sequence
+import asyncio
+import importlib
+import time
+from collections.abc import Collection, Sequence
 from sys import exception
 from typing import Any, ClassVar, override
 
@@ -7,6 +10,7 @@ import discord
 from aiocache import BaseCache
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src import STARTED_AT
 from src.utils.log import get_logger
 
 log = get_logger(__name__)
@@ -27,6 +31,8 @@ class Bot(discord.Bot):
         "src.exts.help",
         "src.exts.tvdb_info",
     ]
+    DEFERRED_EXTENSIONS: ClassVar[Collection[str]] = {"src.exts.tvdb_info"}
+    """Extensions which are slow to import, these are only loaded once the bot is ready, in the lazy mode."""
 
     def __init__(
         self,
@@ -34,27 +40,80 @@ class Bot(discord.Bot):
         http_session: aiohttp.ClientSession,
         db_session: AsyncSession,
         cache: BaseCache,
+        lazy_extensions: bool = False,
         **kwargs: object,
     ) -> None:
-        """Initialize the bot instance, containing various state variables."""
+        """Initialize the bot instance, containing various state variables.
+
+        :param lazy_extensions:
+            Only load the `DEFERRED_EXTENSIONS` once the bot is ready, so that it can connect faster.
+            The commands are then only synced once these get loaded, as syncing them before would
+            unregister the commands of the extensions which aren't loaded yet. The commands of these
+            extensions used while they're being loaded are answered with a "still starting" message.
+        """
+        if lazy_extensions:
+            kwargs.setdefault("auto_sync_commands", False)
         super().__init__(*args, **kwargs)
         self.http_session = http_session
         self.db_session = db_session
         self.cache = cache
+        self.lazy_extensions = lazy_extensions
+        self._deferred_load_task: asyncio.Task[None] | None = None
 
         self.event(self.on_ready)
+        self.event(self.on_unknown_application_command)
 
     async def on_ready(self) -> None:
         """The `on_ready` event handler."""
-        log.info(f"{self.user} is ready and online!")
+        log.info(f"{self.user} is ready and online! (startup took {time.perf_counter() - STARTED_AT:.2f}s)")
+        if self.lazy_extensions and self._deferred_load_task is None:
+            self._deferred_load_task = asyncio.create_task(self._load_deferred_extensions())
+
+    async def on_unknown_application_command(self, interaction: discord.Interaction) -> None:
+        """The `on_unknown_application_command` event handler.
+
+        In the lazy mode, the commands of the deferred extensions are already registered on Discord (from
+        the previous runs), but the bot doesn't know them until the extensions are loaded. Rather than
+        letting such commands fail silently, the users are told to try again in a moment.
+        """
+        loading = self.lazy_extensions and (self._deferred_load_task is None or not self._deferred_load_task.done())
+        if not loading or interaction.type is not discord.InteractionType.application_command:
+            return
+        await interaction.response.send_message(
+            "The bot is still starting up, please try again in a few seconds.", ephemeral=True
+        )
+
+    def _load_extension_timed(self, extension: str) -> None:
+        started_at = time.perf_counter()
+        self.load_extension(extension)
+        log.debug(f"Loaded extension {extension} in {(time.perf_counter() - started_at) * 1000:.0f}ms")
 
     def load_all_extensions(self) -> None:
         """Load all of our bot extensions.
 
-        This relies on the `EXTENSIONS` class variable.
+        This relies on the `EXTENSIONS` class variable. In the lazy mode, the `DEFERRED_EXTENSIONS`
+        are skipped here, these get loaded in the background once the bot is ready.
         """
         log.info("Loading extensions...")
-        self.load_extensions(*self.EXTENSIONS)
+        for extension in self.EXTENSIONS:
+            if not (self.lazy_extensions and extension in self.DEFERRED_EXTENSIONS):
+                self._load_extension_timed(extension)
+
+    async def _load_deferred_extensions(self) -> None:
+        """Load the deferred extensions and sync the commands (of all extensions) afterwards."""
+        started_at = time.perf_counter()
+        for extension in self.EXTENSIONS:
+            if extension not in self.DEFERRED_EXTENSIONS:
+                continue
+            try:
+                # Import the modules in a thread, so that the bot can keep handling the gateway events meanwhile
+                await asyncio.to_thread(importlib.import_module, extension)
+                self._load_extension_timed(extension)
+            except Exception:
+                log.exception(f"Failed to load the deferred extension {extension}")
+
+        await self.sync_commands()
+        log.info(f"Loaded the deferred extensions in {time.perf_counter() - started_at:.2f}s")
 
     @override
     def on_error(self, event_method: str, *args: Any, **kwargs: Any) -> None:
@@ -0,0 +1,28 @@
+from datetime import UTC, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db_tables.api_token import ApiToken
+
+
+async def api_token_get(session: AsyncSession, service: str, api_key_hash: str) -> tuple[str, datetime] | None:
+    """Get the stored auth token of given service and its expiry, if there is one for given API key."""
+    api_token = await session.get(ApiToken, service)
+    if api_token is None or api_token.api_key_hash != api_key_hash:
+        return None
+
+    # SQLite doesn't keep the timezone, the stored times are always in UTC
+    expires_at = api_token.expires_at
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=UTC)
+    return api_token.token, expires_at
+
+
+async def api_token_set(
+    session: AsyncSession, service: str, api_key_hash: str, token: str, expires_at: datetime
+) -> None:
+    """Store the auth token of given service, replacing the previously stored one."""
+    await session.merge(
+        ApiToken(service=service, api_key_hash=api_key_hash, token=token, expires_at=expires_at.astimezone(UTC))
+    )
+    await session.commit()
@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.utils.database import Base
+
+
+class ApiToken(Base):
+    """Table to store the auth tokens obtained from external APIs, so that they survive restarts."""
+
+    __tablename__ = "api_tokens"
+
+    service: Mapped[str] = mapped_column(primary_key=True)
+    # Hash of the API key that the token was obtained with (tokens of a different key are not reused)
+    api_key_hash: Mapped[str] = mapped_column()
+    token: Mapped[str] = mapped_column()
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
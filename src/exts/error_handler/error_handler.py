@@ -9,6 +9,7 @@ from src.bot import Bot
 from src.settings import FAIL_EMOJI
 from src.utils.log import get_logger
 from src.utils.ratelimit import RateLimitExceededError
+from src.utils.resilience import CircuitOpenError
 
 from .utils import build_error_embed, build_unhandled_application_embed
 
@@ -107,6 +108,12 @@ class ErrorHandler(Cog):
                 fields=[EmbedField(name="", value=time_remaining)],
                 footer=footer,
             )
+        elif isinstance(original_exception, CircuitOpenError):
+            embed = build_error_embed(
+                title="Service unavailable",
+                description=f"{FAIL_EMOJI} TheTVDB API is currently failing, please try again later.",
+                fields=[EmbedField(name="", value=f"Next attempt: <t:{round(original_exception.retry_at)}:R>")],
+            )
         else:
             embed = build_unhandled_application_embed(ctx, original_exception)
             log.exception("Unhandled exception occurred.", exc_info=original_exception)
@@ -1,15 +1,21 @@
-from typing import Literal
+import asyncio
+from typing import Literal, override
 
-from discord import ApplicationContext, Cog, Member, User, option, slash_command
+from discord import ApplicationContext, AutocompleteContext, Cog, Member, User, option, slash_command
+from discord.ext import commands, tasks
 
 from src.bot import Bot
 from src.db_adapters.user import user_get_list_safe, user_get_safe
+from src.settings import TVDB_LOCAL_SEARCH, TVDB_TITLE_INDEX_FILE, TVDB_UPDATES_SYNC_INTERVAL
 from src.tvdb import FetchMeta, Movie, Series, TvdbClient
-from src.tvdb.errors import InvalidIdError
+from src.tvdb.errors import InvalidIdError, NotFoundError
+from src.tvdb.title_index import TitleIndex
+from src.tvdb.updates import UpdatesSync
 from src.utils.log import get_logger
 from src.utils.ratelimit import rate_limited
+from src.utils.timing import StageTimer, StageTimings
 
-from .ui import ProfileView, search_view
+from .ui import ProfileView, SearchResults, search_view
 
 log = get_logger(__name__)
 
@@ -22,7 +28,44 @@ class InfoCog(Cog):
 
     def __init__(self, bot: Bot) -> None:
         self.bot = bot
-        self.tvdb_client = TvdbClient(self.bot.http_session, self.bot.cache)
+        title_index = TitleIndex(TVDB_TITLE_INDEX_FILE) if TVDB_LOCAL_SEARCH else None
+        self.tvdb_client = TvdbClient(self.bot.cache, title_index=title_index)
+        self._close_task: asyncio.Task[None] | None = None
+        self._completions_task = asyncio.create_task(self._load_title_completions())
+        self.updates_sync = UpdatesSync(self.tvdb_client)
+        self.search_timings = StageTimings()
+        if TVDB_UPDATES_SYNC_INTERVAL > 0:
+            self.sync_updates.start()
+
+    @override
+    def cog_unload(self) -> None:
+        self.sync_updates.cancel()
+        self._completions_task.cancel()
+        # Unloading can't be awaited, so the client (with its connections) gets closed in the background
+        self._close_task = asyncio.create_task(self.tvdb_client.close())
+
+    async def _load_title_completions(self) -> None:
+        try:
+            loaded = await self.tvdb_client.load_title_completions()
+        except Exception:
+            log.exception("Failed to load the title completions")
+        else:
+            log.debug(f"Loaded {loaded} title completions")
+
+    async def _complete_query(self, ctx: AutocompleteContext) -> list[str]:
+        """Suggest the titles of the already seen movies and series, matching the typed query."""
+        if ctx.options.get("by_id") or not ctx.value:
+            return []
+        # Discord doesn't allow longer choices
+        return [title for title in self.tvdb_client.complete_title(ctx.value) if len(title) <= 100]
+
+    @tasks.loop(seconds=TVDB_UPDATES_SYNC_INTERVAL or 60)
+    async def sync_updates(self) -> None:
+        """Periodically invalidate the cached TVDB data that changed upstream."""
+        try:
+            await self.updates_sync.sync()
+        except Exception:
+            log.exception("Failed to sync the TVDB updates")
 
     @slash_command()
     @option("user", input_type=User, description="The user to show the profile for.", required=False)
@@ -53,7 +96,7 @@ class InfoCog(Cog):
         await view.send(ctx.interaction)
 
     @slash_command()
-    @option("query", input_type=str, description="The query to search for.")
+    @option("query", input_type=str, description="The query to search for.", autocomplete=_complete_query)
     @option(
         "type",
         input_type=str,
@@ -73,7 +116,9 @@ class InfoCog(Cog):
         by_id: bool = False,
     ) -> None:
         """Search for a movie or series."""
-        await ctx.defer()
+        timer = StageTimer(self.search_timings)
+        with timer.stage("defer"):
+            await ctx.defer()
 
         if by_id:
             if query.startswith("movie-"):
@@ -89,11 +134,9 @@ class InfoCog(Cog):
                             await Movie.fetch(query, self.tvdb_client, extended=True, meta=FetchMeta.TRANSLATIONS)
                         ]
                     case "series":
-                        series = await Series.fetch(
-                            query, self.tvdb_client, extended=True, meta=FetchMeta.TRANSLATIONS
-                        )
-                        await series.fetch_episodes()
-                        response = [series]
+                        response = [
+                            await Series.fetch(query, self.tvdb_client, extended=True, meta=FetchMeta.TRANSLATIONS)
+                        ]
                     case None:
                         await ctx.respond(
                             "You must specify a type (movie or series) when searching by ID.", ephemeral=True
@@ -105,18 +148,32 @@ class InfoCog(Cog):
                     ephemeral=True,
                 )
                 return
+            except NotFoundError:
+                await ctx.respond("No results found.")
+                return
         else:
-            response = await self.tvdb_client.search(query, limit=5, entity_type=entity_type)
-            for element in response:
-                await element.ensure_translations()
-                if isinstance(element, Series):
-                    await element.fetch_episodes()
+            with timer.stage("search"):
+                response = await self.tvdb_client.search(query, limit=5, entity_type=entity_type)
             if not response:
                 await ctx.respond("No results found.")
                 return
 
-        view = await search_view(self.bot, ctx.user.id, ctx.user.id, response)
-        await view.send(ctx.interaction)
+        results = SearchResults(response, timings=self.search_timings)
+        # Only the first result is hydrated here, the next ones are prefetched once it's sent
+        with timer.stage("view"):
+            view = await search_view(self.bot, ctx.user.id, ctx.user.id, results)
+        with timer.stage("send"):
+            await view.send(ctx.interaction)
+        results.prefetch_after(0)
+        log.debug(f"Search for {query!r} took: {timer}")
+
+    @slash_command(name="tvdb-stats")
+    @commands.is_owner()
+    async def tvdb_stats(self, ctx: ApplicationContext) -> None:
+        """Show the metrics of the TVDB client and of the searches (bot owner only)."""
+        lines = self.tvdb_client.stats_summary()
+        lines.append(f"search stages: {self.search_timings.summary() or 'no searches yet'}")
+        await ctx.respond("\n".join(f"- {line}" for line in lines), ephemeral=True)
 
 
 def setup(bot: Bot) -> None:
@@ -1,12 +1,13 @@
 from .episode_view import EpisodeView
 from .movie_series_view import MovieView, SeriesView
 from .profile_view import ProfileView
-from .search_view import search_view
+from .search_view import SearchResults, search_view
 
 __all__ = [
     "MovieView",
     "SeriesView",
     "EpisodeView",
     "ProfileView",
+    "SearchResults",
     "search_view",
 ]
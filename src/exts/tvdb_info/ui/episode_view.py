@@ -1,4 +1,6 @@
+import asyncio
 import warnings
+from collections.abc import AsyncIterator
 from typing import final, override
 
 import discord
@@ -8,10 +10,14 @@ from src.db_adapters.lists import get_list_item, list_put_item, list_remove_item
 from src.db_tables.user_list import UserList, UserListItemKind
 from src.settings import THETVDB_COPYRIGHT_FOOTER, THETVDB_LOGO
 from src.tvdb.client import Episode, Series
-from src.utils.tvdb import by_season
+from src.tvdb.episode_index import format_episode_name
+from src.tvdb.generated_models import EpisodeBaseRecord
+from src.utils.log import get_logger
 
 from ._media_view import DynamicMediaView
 
+log = get_logger(__name__)
+
 
 @final
 class EpisodeView(DynamicMediaView):
@@ -41,6 +47,9 @@ class EpisodeView(DynamicMediaView):
 
         self.season_idx = season_idx
         self.episode_idx = episode_idx
+        self._current_episode: tuple[int, Episode] | None = None
+        self._episode_loader: asyncio.Task[None] | None = None
+        self._english_loader: asyncio.Task[None] | None = None
 
         self.episode_dropdown = discord.ui.Select(placeholder="Select an episode")
         self.episode_dropdown.callback = self._episode_dropdown_callback
@@ -62,12 +71,22 @@ class EpisodeView(DynamicMediaView):
 
     @override
     async def _initialize(self) -> None:
-        await self.series.ensure_seasons_and_episodes()
-        if self.series.episodes is None:
+        # Fetched alongside the episodes themselves, so that it doesn't delay the view
+        english_pages = self.series.iter_episode_pages(language="eng")
+        first_english_page = asyncio.create_task(self._load_first_english_episodes(english_pages))
+        try:
+            if self.series.episode_index is None:
+                await self._load_first_episodes()
+        except BaseException:
+            first_english_page.cancel()
+            raise
+        if await first_english_page:
+            self._english_loader = asyncio.create_task(self._load_remaining_english_episodes(english_pages))
+        if self.series.episode_index is None:
             raise ValueError("Series has no episodes")
-        self.episodes = by_season(self.series.episodes)
+        self.episode_index = self.series.episode_index
 
-        # Make the super call (must happen after we set self.episodes)
+        # Make the super call (must happen after we set self.episode_index)
         # This assumes is_favorite works properly, however, since we don't actually have
         # this implemented for episodes, to make this call work, we'll need to temporarily
         # set is_favorite to a dummy method.
@@ -80,38 +99,133 @@ class EpisodeView(DynamicMediaView):
         await super()._initialize()
         self.is_favorite = _old_is_favorite
 
+    async def _load_first_episodes(self) -> None:
+        """Fetch the first page of the episodes of the series, loading the rest in the background.
+
+        This allows the view to be shown right away, even for series with a lot of episodes.
+        """
+        pages = self.series.iter_episode_pages()
+        first_page = await anext(pages, None)
+        if first_page is None:
+            return
+
+        self.series.set_episode_records(first_page)
+        self._episode_loader = asyncio.create_task(self._load_remaining_episodes(pages, first_page))
+
+    async def _load_first_english_episodes(self, pages: AsyncIterator[list[EpisodeBaseRecord]]) -> bool:
+        """Fetch the English overviews of the first page of the episodes (without them, the original ones are shown).
+
+        The first page holds the episodes that are shown first, the remaining pages are loaded in the background
+        (see :meth:`_load_remaining_english_episodes`), once the view is shown.
+
+        :return: Whether the remaining pages should be loaded.
+        """
+        try:
+            first_page = await anext(pages, None)
+        except Exception:
+            log.exception(f"Failed to load the English episodes of series {self.series.id}")
+            return False
+        if first_page is None:
+            return False
+        self.series.add_english_episodes(first_page)
+        return True
+
+    async def _load_remaining_english_episodes(self, pages: AsyncIterator[list[EpisodeBaseRecord]]) -> None:
+        """Load the remaining pages of the English episodes, updating the view after each one."""
+        try:
+            async for page in pages:
+                self.series.add_english_episodes(page)
+                # The current episode was constructed without its English record
+                self._current_episode = None
+
+                await self._update_state()
+                if self.message:
+                    await self._refresh()
+        except Exception:
+            log.exception(f"Failed to load the remaining English episodes of series {self.series.id}")
+
+    async def _load_remaining_episodes(
+        self,
+        pages: AsyncIterator[list[EpisodeBaseRecord]],
+        loaded: list[EpisodeBaseRecord],
+    ) -> None:
+        """Load the remaining pages of the episodes, updating the view after each one."""
+        records = list(loaded)
+        try:
+            async for page in pages:
+                records.extend(page)
+                self.series.set_episode_records(records)
+                if self.series.episode_index is not None:
+                    self.episode_index = self.series.episode_index
+                self._current_episode = None
+
+                await self._update_state()
+                if self.message:
+                    await self._refresh()
+        except Exception:
+            log.exception(f"Failed to load the remaining episodes of series {self.series.id}")
+
     @override
-    async def _update_state(self) -> None:
-        self.episode_dropdown.options = [
-            discord.SelectOption(
-                label=episode.formatted_name,
-                value=str(episode.number),
-                description=episode.overview[:100] if episode.overview else None,
-            )
-            for episode in self.episodes[self.season_idx]
-        ]
+    async def on_timeout(self) -> None:
+        for loader in (self._episode_loader, self._english_loader):
+            if loader is not None:
+                loader.cancel()
+        await super().on_timeout()
 
-        self.season_dropdown.options = [
-            discord.SelectOption(label=f"Season {season}", value=str(season)) for season in self.episodes
-        ]
+    @override
+    async def _update_state(self) -> None:
+        index = self.episode_index
+        episode_rows = index.season_rows(self.season_idx)
+        season_numbers = index.season_numbers
 
         # TODO: This is not ideal, we should support some way to paginate this, however
         # implementing that isn't trivial. For now, just trim the list to prevent errors.
 
-        if len(self.episode_dropdown.options) > 25:
-            self.episode_dropdown.options = self.episode_dropdown.options[:25]
+        if len(episode_rows) > 25:
+            episode_rows = episode_rows[:25]
             warnings.warn("Too many episodes to display, truncating to 25", UserWarning, stacklevel=1)
 
-        if len(self.season_dropdown.options) > 25:
-            self.season_dropdown.options = self.season_dropdown.options[:25]
+        if len(season_numbers) > 25:
+            season_numbers = season_numbers[:25]
             warnings.warn("Too many seasons to display, truncating to 25", UserWarning, stacklevel=1)
 
+        self.episode_dropdown.options = [
+            discord.SelectOption(
+                label=format_episode_name(
+                    index.seasons[row], index.numbers[row], self.series.episode_record(row).name
+                ),
+                value=str(index.numbers[row]),
+                description=overview[:100] if (overview := self._episode_overview(row)) else None,
+            )
+            for row in episode_rows
+        ]
+
+        self.season_dropdown.options = [
+            discord.SelectOption(label=f"Season {season}", value=str(season)) for season in season_numbers
+        ]
+
         self.watched_button.set_state(await self.is_watched())
 
+    def _episode_overview(self, row: int) -> str | None:
+        """Get the overview of the episode in given row of the episode index, in English if it's known."""
+        record = self.series.episode_record(row)
+        english = self.series.english_episode(record.id)
+        return (english.overview if english else None) or record.overview
+
     @property
     def current_episode(self) -> "Episode":
-        """Get the current episode being displayed."""
-        return self.episodes[self.season_idx][self.episode_idx - 1]
+        """Get the current episode being displayed.
+
+        Only this episode is ever constructed (as an :class:`Episode`), the rest is read from the episode index.
+        """
+        row = self.episode_index.find(self.season_idx, self.episode_idx)
+        if row is None:
+            # The season doesn't have an episode with this number (e.g. it doesn't start at 1)
+            row = self.episode_index.season_rows(self.season_idx)[0]
+
+        if self._current_episode is None or self._current_episode[0] != row:
+            self._current_episode = (row, self.series.episode_at(row))
+        return self._current_episode[1]
 
     @override
     async def is_favorite(self) -> bool:
@@ -200,8 +314,7 @@ class EpisodeView(DynamicMediaView):
 
     @override
     def _get_embed(self) -> discord.Embed:
-        if self.current_episode.overview:
-            description = self.current_episode.overview
+        if description := self.current_episode.overview_eng or self.current_episode.overview:
             if len(description) > 1000:
                 description = description[:1000] + "..."
         else:
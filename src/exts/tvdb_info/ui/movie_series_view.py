@@ -1,3 +1,4 @@
+import asyncio
 from typing import Literal, final, override
 
 import discord
@@ -14,11 +15,13 @@ from src.db_adapters.lists import (
 from src.db_tables.user_list import UserList, UserListItemKind
 from src.settings import MOVIE_EMOJI, SERIES_EMOJI, THETVDB_COPYRIGHT_FOOTER, THETVDB_LOGO
 from src.tvdb.client import Movie, Series
-from src.utils.iterators import get_first
+from src.utils.log import get_logger
 
 from ._media_view import MediaView
 from .episode_view import EpisodeView
 
+log = get_logger(__name__)
+
 
 class _SeriesOrMovieView(MediaView):
     """View for displaying details about a movie or a series."""
@@ -33,7 +36,15 @@ class _SeriesOrMovieView(MediaView):
         watched_list: UserList,
         favorite_list: UserList,
         media_data: Movie | Series,
+        loading: asyncio.Future[None] | None = None,
     ) -> None:
+        """Initialize the view.
+
+        :param loading:
+            If set, the details of the media are still being fetched by this task (see
+            :class:`~src.exts.tvdb_info.ui.search_view.SearchResults`). The view is shown with the data
+            it has meanwhile, without fetching anything itself, and gets reloaded once the task finishes.
+        """
         super().__init__(
             bot=bot,
             user_id=user_id,
@@ -43,6 +54,8 @@ class _SeriesOrMovieView(MediaView):
         )
 
         self.media_data = media_data
+        self.loading = loading
+        self._reload_task: asyncio.Task[None] | None = None
 
     @property
     def _db_item_kind(self) -> Literal[UserListItemKind.MOVIE, UserListItemKind.SERIES]:
@@ -51,6 +64,34 @@ class _SeriesOrMovieView(MediaView):
             return UserListItemKind.SERIES
         return UserListItemKind.MOVIE
 
+    @override
+    async def send(self, interaction: discord.Interaction) -> None:
+        await super().send(interaction)
+        if self.loading is not None:
+            self._reload_task = asyncio.create_task(self._reload_when_loaded(self.loading))
+
+    async def _reload_when_loaded(self, loading: asyncio.Future[None]) -> None:
+        """Reload the (already sent) view, once the details of the media are fetched."""
+        try:
+            # Shielded, the task is shared with the other views of the same media
+            await asyncio.shield(loading)
+        except Exception as exc:  # noqa: BLE001
+            log.debug(f"Not reloading the view of {self.media_data.entity_type} {self.media_data.id}: {exc!r}")
+            return
+        self.loading = None
+        if self.is_finished():
+            return
+
+        self.watched_button.set_state(await self.is_watched())
+        self.favorite_button.set_state(await self.is_favorite())
+        await self._refresh()
+
+    @override
+    async def on_timeout(self) -> None:
+        if self._reload_task is not None:
+            self._reload_task.cancel()
+        await super().on_timeout()
+
     @override
     async def is_favorite(self) -> bool:
         if not self.media_data.id:
@@ -151,6 +192,7 @@ class SeriesView(_SeriesOrMovieView):
         watched_list: UserList,
         favorite_list: UserList,
         media_data: Series,
+        loading: asyncio.Future[None] | None = None,
     ) -> None:
         super().__init__(
             bot=bot,
@@ -159,6 +201,7 @@ class SeriesView(_SeriesOrMovieView):
             watched_list=watched_list,
             favorite_list=favorite_list,
             media_data=media_data,
+            loading=loading,
         )
 
         self.episodes_button = discord.ui.Button(
@@ -171,7 +214,8 @@ class SeriesView(_SeriesOrMovieView):
 
     @override
     async def _initialize(self) -> None:
-        await self.media_data.ensure_seasons_and_episodes()
+        if self.loading is None:
+            await self.media_data.ensure_seasons_and_episodes()
         await super()._initialize()
 
     @override
@@ -200,15 +244,17 @@ class SeriesView(_SeriesOrMovieView):
         # This approach uses the last episode of the series to determine if the series is watched.
 
         # If the series has no episodes, fall back to marking the series itself as watched.
-        if self.media_data.episodes is None:
+        index = self.media_data.episode_index
+        if index is None:
             return await super().is_watched()
 
-        last_ep = get_first(episode for episode in reversed(self.media_data.episodes) if episode.aired)
-
-        if not last_ep or last_ep.id is None:
+        last_ep_row = index.last_aired()
+        if last_ep_row is None or not index.ids[last_ep_row]:
             raise ValueError("Episode has no ID")
 
-        item = await get_list_item(self.bot.db_session, self.watched_list, last_ep.id, UserListItemKind.EPISODE)
+        item = await get_list_item(
+            self.bot.db_session, self.watched_list, index.ids[last_ep_row], UserListItemKind.EPISODE
+        )
         return item is not None
 
     @override
@@ -217,34 +263,34 @@ class SeriesView(_SeriesOrMovieView):
         # Similarly, unmarking will unmark all episodes (aired or not).
 
         # If the series has no episodes, fall back to marking the season itself as watched / unwatched.
-        if self.media_data.episodes is None:
+        index = self.media_data.episode_index
+        if index is None:
             await super().set_watched(state)
             return
 
         if state is False:
-            for episode in self.media_data.episodes:
-                if not episode.id:
+            for episode_id in index.ids:
+                if not episode_id:
                     raise ValueError("Episode has no ID")
 
                 await list_remove_item_safe(
                     self.bot.db_session,
                     self.watched_list,
-                    episode.id,
+                    episode_id,
                     UserListItemKind.EPISODE,
                 )
 
             await refresh_list_items(self.bot.db_session, self.watched_list)
         else:
-            for episode in self.media_data.episodes:
-                if not episode.id:
+            for row in index.aired_rows():
+                episode_id = index.ids[row]
+                if not episode_id:
                     raise ValueError("Episode has no ID")
-                if not episode.aired:
-                    continue
 
                 await list_put_item_safe(
                     self.bot.db_session,
                     self.watched_list,
-                    episode.id,
+                    episode_id,
                     UserListItemKind.EPISODE,
                     self.media_data.id,
                 )
@@ -267,6 +313,7 @@ class MovieView(_SeriesOrMovieView):
         watched_list: UserList,
         favorite_list: UserList,
         media_data: Movie,
+        loading: asyncio.Future[None] | None = None,
     ) -> None:
         super().__init__(
             bot=bot,
@@ -275,4 +322,5 @@ class MovieView(_SeriesOrMovieView):
             watched_list=watched_list,
             favorite_list=favorite_list,
             media_data=media_data,
+            loading=loading,
         )
@@ -1,4 +1,5 @@
 import textwrap
+from collections.abc import Sequence
 from itertools import groupby
 from typing import final
 
@@ -73,16 +74,23 @@ class ProfileView(ErrorHandledView):
         # We don't actually care about episodes in the profile view, however, we need them
         # because of the way shows are marked as watched (last episode watched -> show watched).
 
-        for series_id, episodes in groupby(
-            sorted(watched_episodes, key=lambda x: x.series_id), key=lambda x: x.series_id
+        watched_episodes.sort(key=lambda x: x.series_id)
+        series_ids = [series_id for series_id, _ in groupby(watched_episodes, key=lambda x: x.series_id)]
+        fetched_series = await self.tvdb_client.fetch_many(Series, series_ids, extended=True, meta=FetchMeta.EPISODES)
+
+        for (series_id, episodes), series in zip(
+            groupby(watched_episodes, key=lambda x: x.series_id), fetched_series, strict=True
         ):
-            series = await Series.fetch(series_id, client=self.tvdb_client, extended=True, meta=FetchMeta.EPISODES)
-            if series.episodes is None:
+            if isinstance(series, Exception):
+                log.warning(f"Failed to fetch series {series_id} with watched episodes", exc_info=series)
+                continue
+            if series.episode_index is None:
                 raise ValueError("Found an episode in watched list for a series with no episodes")
 
-            last_episode = get_first(episode for episode in reversed(series.episodes) if episode.aired)
-            if not last_episode or last_episode.id is None:
+            last_episode_row = series.episode_index.last_aired()
+            if last_episode_row is None or not series.episode_index.ids[last_episode_row]:
                 raise ValueError("Episode has no ID or is None")
+            last_episode_id = series.episode_index.ids[last_episode_row]
 
             episodes_it = iter(episodes)
             first_db_episode = get_first(episodes_it)
@@ -97,7 +105,7 @@ class ProfileView(ErrorHandledView):
                 manual = await self.bot.db_session.get(SeriesTable, first_db_episode.series_id)
                 raise ValueError(f"DB series is None id={first_db_episode.series_id}, manual={manual}")
 
-            if last_episode.id in group_episode_ids:
+            if last_episode_id in group_episode_ids:
                 watched_shows.append(first_db_episode.series)
             else:
                 partially_watched_shows.append(first_db_episode.series)
@@ -117,42 +125,42 @@ class ProfileView(ErrorHandledView):
                     raise TypeError("Found an episode in favorite list")
 
         # Fetch the data about all favorite & watched items from tvdb
-        # TODO: This is a lot of API calls, we should probably limit this to some maximum
-        self.fetched_favorite_movies = [
-            await Movie.fetch(media_db_data.tvdb_id, client=self.tvdb_client) for media_db_data in favorite_movies
-        ]
-        self.fetched_favorite_shows = [
-            await Series.fetch(
-                media_db_data.tvdb_id, client=self.tvdb_client, extended=True, meta=FetchMeta.TRANSLATIONS
-            )
-            for media_db_data in favorite_shows
-        ]
-        self.fetched_watched_movies = [
-            await Movie.fetch(media_db_data.tvdb_id, client=self.tvdb_client) for media_db_data in watched_movies
-        ]
-        self.fetched_watched_shows = [
-            await Series.fetch(
-                media_db_data.tvdb_id,
-                client=self.tvdb_client,
-                extended=True,
-                meta=FetchMeta.TRANSLATIONS,
-            )
-            for media_db_data in watched_shows
-        ]
-        self.fetched_partially_watched_shows = [
-            await Series.fetch(
-                media_db_data.tvdb_id,
-                client=self.tvdb_client,
-                extended=True,
-                meta=FetchMeta.TRANSLATIONS,
-            )
-            for media_db_data in partially_watched_shows
-        ]
+        self.fetched_favorite_movies = await self._fetch_all(Movie, favorite_movies)
+        self.fetched_favorite_shows = await self._fetch_all(Series, favorite_shows)
+        self.fetched_watched_movies = await self._fetch_all(Movie, watched_movies)
+        self.fetched_watched_shows = await self._fetch_all(Series, watched_shows)
+        self.fetched_partially_watched_shows = await self._fetch_all(Series, partially_watched_shows)
 
         # Instead of fetching all episodes, just store the total number of episodes that the user has added
         # as that's the only thing we need here and while it is a bit inconsistent, it's a LOT more efficient.
         self.episodes_total = len(watched_episodes)
 
+    async def _fetch_all[M: (Movie, Series)](
+        self,
+        kind: type[M],
+        items: Sequence[MovieTable | SeriesTable],
+    ) -> list[M]:
+        """Fetch the data about given media items from tvdb.
+
+        Items that failed to be fetched are skipped (and logged), so that a single
+        bad item doesn't prevent the whole profile from being shown.
+        """
+        # Series use translations, to show the english names, movies only need the base records
+        if kind is Series:
+            fetched = await self.tvdb_client.fetch_many(
+                kind, [item.tvdb_id for item in items], extended=True, meta=FetchMeta.TRANSLATIONS
+            )
+        else:
+            fetched = await self.tvdb_client.fetch_many(kind, [item.tvdb_id for item in items])
+
+        results: list[M] = []
+        for item, media in zip(items, fetched, strict=True):
+            if isinstance(media, Exception):
+                log.warning(f"Failed to fetch {kind.__name__} {item.tvdb_id} for the profile", exc_info=media)
+                continue
+            results.append(media)
+        return results
+
     async def _ensure_correct_invoker(self, interaction: discord.Interaction) -> bool:
         """Ensure that the interaction was invoked by the author of this view."""
         if interaction.user is None:
@@ -1,3 +1,5 @@
+import asyncio
+import time
 from collections.abc import Sequence
 
 import discord
@@ -6,21 +8,106 @@ from src.bot import Bot
 from src.db_adapters.lists import refresh_list_items
 from src.db_adapters.user import user_get_list_safe, user_get_safe
 from src.db_tables.user_list import UserList
+from src.settings import TVDB_SEARCH_HYDRATION_TIMEOUT, TVDB_SEARCH_PREFETCH
 from src.tvdb.client import Movie, Series
+from src.utils.log import get_logger
+from src.utils.ratelimit import RateLimitPriority
+from src.utils.timing import StageTimings
 
 from .movie_series_view import MovieView, SeriesView
 
+log = get_logger(__name__)
 
-def _search_view(
+
+class SearchResults:
+    """Results of a search, hydrated (with their translations and episodes fetched) only once they're needed.
+
+    Until a result is hydrated, it only holds the data from the search, which is enough to list it among
+    the other results. Each result is hydrated at most once, the concurrent requests for it share a task.
+    """
+
+    def __init__(self, results: Sequence[Movie | Series], *, timings: StageTimings | None = None) -> None:
+        """Initialize the search results.
+
+        :param timings: If set, the durations of the hydrations are recorded into it (as "hydrate_result").
+        """
+        self.results = results
+        self.timings = timings
+        self._hydrations: dict[int, asyncio.Task[None]] = {}
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __getitem__(self, index: int) -> Movie | Series:
+        return self.results[index]
+
+    async def _hydrate(self, result: Movie | Series, priority: RateLimitPriority) -> None:
+        start = time.perf_counter()
+        try:
+            await result.ensure_translations(priority=priority)
+            # Only once the translations are there, replacing the data of a series resets its episodes
+            if isinstance(result, Series):
+                await result.fetch_episodes(priority=priority)
+        finally:
+            if self.timings is not None:
+                self.timings.record("hydrate_result", time.perf_counter() - start)
+
+    def _hydration(self, index: int, priority: RateLimitPriority) -> asyncio.Task[None]:
+        """Get the task hydrating the result at given index, starting it if there isn't one (or if it failed)."""
+        task = self._hydrations.get(index)
+        if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+            task = asyncio.create_task(self._hydrate(self.results[index], priority))
+            self._hydrations[index] = task
+        return task
+
+    async def hydrate(self, index: int) -> Movie | Series:
+        """Hydrate the result at given index, waiting at most `TVDB_SEARCH_HYDRATION_TIMEOUT` for it.
+
+        If the hydration fails (or doesn't finish in time), the result is returned as it is, with the data
+        from the search. A timed out hydration keeps going in the background (see :meth:`pending`), while
+        after a failed one, the views fetch whatever they're missing once the result is shown.
+        """
+        result = self.results[index]
+        task = self._hydration(index, RateLimitPriority.INTERACTIVE)
+        try:
+            async with asyncio.timeout(TVDB_SEARCH_HYDRATION_TIMEOUT or None):
+                # Shielded, so that the hydration keeps going in the background if it times out
+                await asyncio.shield(task)
+        except TimeoutError:
+            log.debug(f"Timed out hydrating search result {result.entity_type} {result.id}")
+        except Exception as exc:  # noqa: BLE001
+            log.debug(f"Failed to hydrate search result {result.entity_type} {result.id}: {exc!r}")
+        return result
+
+    def pending(self, index: int) -> asyncio.Task[None] | None:
+        """Get the task hydrating the result at given index, if it's still running."""
+        task = self._hydrations.get(index)
+        return task if task is not None and not task.done() else None
+
+    def prefetch_after(self, index: int) -> None:
+        """Start hydrating the `TVDB_SEARCH_PREFETCH` results following the given one, in the background.
+
+        These are the results the user is the most likely to pick next, the requests for them go
+        through the rate-limit with background priority, so that they never hold up the others.
+        """
+        for next_index in range(index + 1, min(index + 1 + TVDB_SEARCH_PREFETCH, len(self.results))):
+            task = self._hydration(next_index, RateLimitPriority.BACKGROUND)
+            # The failures are only logged once (if ever) the result gets picked, see `hydrate`
+            task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+
+async def _search_view(
     bot: Bot,
     user_id: int,
     invoker_user_id: int,
     watched_list: UserList,
     favorite_list: UserList,
-    results: Sequence[Movie | Series],
+    results: SearchResults,
     cur_index: int = 0,
 ) -> MovieView | SeriesView:
-    result = results[cur_index]
+    result = await results.hydrate(cur_index)
+    # A result that didn't get hydrated in time is shown right away, the view reloads once it's hydrated
+    loading = results.pending(cur_index)
 
     if isinstance(result, Movie):
         view = MovieView(
@@ -30,6 +117,7 @@ def _search_view(
             watched_list=watched_list,
             favorite_list=favorite_list,
             media_data=result,
+            loading=loading,
         )
     else:
         view = SeriesView(
@@ -39,6 +127,7 @@ def _search_view(
             watched_list=watched_list,
             favorite_list=favorite_list,
             media_data=result,
+            loading=loading,
         )
 
     if len(results) == 1:
@@ -53,7 +142,7 @@ def _search_view(
                 value=str(i),
                 description=result.overview[:100] if result.overview else None,
             )
-            for i, result in enumerate(results)
+            for i, result in enumerate(results.results)
         ],
         row=2,
     )
@@ -65,9 +154,12 @@ def _search_view(
         if not search_result_dropdown.values or not isinstance(search_result_dropdown.values[0], str):
             raise ValueError("Dropdown values are empty or not a string but callback was triggered.")
 
+        # Hydrating the picked result can take longer than Discord waits for the interaction to be responded to
+        await interaction.response.defer()
         index = int(search_result_dropdown.values[0])
-        new_view = _search_view(bot, user_id, invoker_user_id, watched_list, favorite_list, results, index)
+        new_view = await _search_view(bot, user_id, invoker_user_id, watched_list, favorite_list, results, index)
         await new_view.send(interaction)
+        results.prefetch_after(index)
 
     search_result_dropdown.callback = _search_dropdown_callback
 
@@ -79,12 +171,15 @@ async def search_view(
     bot: Bot,
     user_id: int,
     invoker_user_id: int,
-    results: Sequence[Movie | Series],
+    results: SearchResults,
 ) -> MovieView | SeriesView:
     """Construct a view showing the search results.
 
     This uses specific views to render a single result. This view is then modified to
     add support for switching between the search results.
+
+    Only the first result is hydrated here, the others are hydrated once they're picked. Once the
+    view is sent, call :meth:`SearchResults.prefetch_after` to hydrate the next likely picks.
     """
     user = await user_get_safe(bot.db_session, user_id)
     watched_list = await user_get_list_safe(bot.db_session, user, "watched")
@@ -92,4 +187,4 @@ async def search_view(
     await refresh_list_items(bot.db_session, watched_list)
     await refresh_list_items(bot.db_session, favorite_list)
 
-    return _search_view(bot, user_id, invoker_user_id, watched_list, favorite_list, results, 0)
+    return await _search_view(bot, user_id, invoker_user_id, watched_list, favorite_list, results, 0)
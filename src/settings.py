@@ -5,10 +5,45 @@ from src.utils.config import get_config
 GITHUB_REPO = "https://github.com/ItsDrike/code-jam-2024"
 BOT_TOKEN = get_config("BOT_TOKEN")
 TVDB_API_KEY = get_config("TVDB_API_KEY")
+# The root of the TVDB API, can be pointed to a local stand-in of the API (see tools/tvdb_stand_in.py)
+TVDB_BASE_URL = get_config("TVDB_BASE_URL", default="https://api4.thetvdb.com/v4/")
 
 SQLITE_DATABASE_FILE = get_config("SQLITE_DATABASE_FILE", cast=Path, default=Path("./database.db"))
 ECHO_SQL = get_config("ECHO_SQL", cast=bool, default=False)
 DB_ALWAYS_MIGRATE = get_config("DB_ALWAYS_MIGRATE", cast=bool, default=False)
+# Load the heavy extensions (TVDB) only once the bot is connected, to make it come online faster
+LAZY_EXTENSIONS = get_config("LAZY_EXTENSIONS", cast=bool, default=False)
+
+# Either "memory" (cache is lost on restart) or "sqlite" (cache is persisted in CACHE_SQLITE_FILE)
+CACHE_BACKEND = get_config("CACHE_BACKEND", default="memory")
+CACHE_SQLITE_FILE = get_config("CACHE_SQLITE_FILE", cast=Path, default=Path("./cache.db"))
+# Maximum amount of already validated TVDB responses to keep around in memory
+TVDB_MODEL_CACHE_SIZE = get_config("TVDB_MODEL_CACHE_SIZE", cast=int, default=256)
+# The IDs which don't exist upstream and the searches without any results are remembered (in memory, separately
+# from the cached responses) for a short time, so that repeating them doesn't hit the TVDB API each time
+TVDB_NEGATIVE_CACHE_TTL = get_config("TVDB_NEGATIVE_CACHE_TTL", cast=float, default=5 * 60)  # seconds
+TVDB_NEGATIVE_CACHE_SIZE = get_config("TVDB_NEGATIVE_CACHE_SIZE", cast=int, default=4096)
+# Cached TVDB responses older than the soft TTL are still used, but they get refreshed in the background.
+# Responses older than the hard TTL are dropped from the cache, and have to be fetched again.
+# The records that change upstream are invalidated by polling the TVDB updates feed, so these can be fairly
+# long. If the updates sync is disabled (by setting its interval to 0), consider making them shorter.
+TVDB_CACHE_SOFT_TTL = get_config("TVDB_CACHE_SOFT_TTL", cast=float, default=24 * 60 * 60)  # seconds
+TVDB_CACHE_HARD_TTL = get_config("TVDB_CACHE_HARD_TTL", cast=float, default=7 * 24 * 60 * 60)  # seconds
+TVDB_UPDATES_SYNC_INTERVAL = get_config("TVDB_UPDATES_SYNC_INTERVAL", cast=float, default=15 * 60)  # seconds
+# The titles of all of the fetched movies and series are indexed locally (in TVDB_TITLE_INDEX_FILE), and
+# the searches are answered from this index, if it has enough (as many as requested) results scoring at least
+# the minimum score (between 0 and 1, where 1 is an exact match of the title). Otherwise, the TVDB API is
+# searched, with the exact local matches ranked first and the other strong ones filling in the missing results.
+TVDB_LOCAL_SEARCH = get_config("TVDB_LOCAL_SEARCH", cast=bool, default=True)
+TVDB_TITLE_INDEX_FILE = get_config("TVDB_TITLE_INDEX_FILE", cast=Path, default=Path("./titles.db"))
+TVDB_LOCAL_SEARCH_MIN_SCORE = get_config("TVDB_LOCAL_SEARCH_MIN_SCORE", cast=float, default=0.8)
+# The results of /search are only hydrated (their translations and episodes are fetched) once they're shown,
+# with a time limit, the results that don't make it in time are shown with the data from the search. Once the
+# first result is shown, the next few results are prefetched in the background.
+TVDB_SEARCH_HYDRATION_TIMEOUT = get_config("TVDB_SEARCH_HYDRATION_TIMEOUT", cast=float, default=5)  # seconds
+TVDB_SEARCH_PREFETCH = get_config("TVDB_SEARCH_PREFETCH", cast=int, default=2)
+# Maximum amount of titles kept in memory for the autocompletion of the search queries
+TVDB_AUTOCOMPLETE_SIZE = get_config("TVDB_AUTOCOMPLETE_SIZE", cast=int, default=20_000)
 
 FAIL_EMOJI = "❌"
 SUCCESS_EMOJI = "✅"
@@ -26,3 +61,33 @@ THETVDB_LOGO = "https://www.thetvdb.com/images/attribution/logo1.png"
 # but we should still be careful not to spam the API too much and be on the safe side.
 TVDB_RATE_LIMIT_REQUESTS = get_config("TVDB_RATE_LIMIT_REQUESTS", cast=int, default=100)
 TVDB_RATE_LIMIT_PERIOD = get_config("TVDB_RATE_LIMIT_PERIOD", cast=float, default=5)  # seconds
+# When the rate-limit is reached, requests will wait in a queue for up to this many seconds,
+# before giving up (erroring). Set to 0 to wait for as long as necessary.
+TVDB_RATE_LIMIT_MAX_WAIT = get_config("TVDB_RATE_LIMIT_MAX_WAIT", cast=float, default=10)  # seconds
+
+# The TVDB client uses its own pool of connections, so that slow TVDB responses can't hold up other requests.
+TVDB_HTTP_MAX_CONNECTIONS = get_config("TVDB_HTTP_MAX_CONNECTIONS", cast=int, default=20)
+TVDB_HTTP_MAX_CONNECTIONS_PER_HOST = get_config("TVDB_HTTP_MAX_CONNECTIONS_PER_HOST", cast=int, default=10)
+TVDB_HTTP_KEEPALIVE = get_config("TVDB_HTTP_KEEPALIVE", cast=float, default=30)  # seconds
+# Includes the time spent waiting for a free connection, when all of them are in use
+TVDB_HTTP_CONNECT_TIMEOUT = get_config("TVDB_HTTP_CONNECT_TIMEOUT", cast=float, default=5)  # seconds
+TVDB_HTTP_READ_TIMEOUT = get_config("TVDB_HTTP_READ_TIMEOUT", cast=float, default=20)  # seconds
+TVDB_HTTP_DNS_CACHE_TTL = get_config("TVDB_HTTP_DNS_CACHE_TTL", cast=int, default=300)  # seconds
+# Time limit for a single attempt of a TVDB request (including its hedge, if it's hedged), 0 for no limit
+TVDB_REQUEST_TIMEOUT = get_config("TVDB_REQUEST_TIMEOUT", cast=float, default=15)  # seconds
+# The TVDB requests which fail due to an upstream issue (429 and 5xx responses, timeouts, connection errors) are
+# retried, after a random delay of up to the base delay, doubling with each retry (up to the max delay).
+# Only the GET requests are retried on the other errors than 429 (these might've been processed already).
+TVDB_RETRY_ATTEMPTS = get_config("TVDB_RETRY_ATTEMPTS", cast=int, default=2)
+TVDB_RETRY_BASE_DELAY = get_config("TVDB_RETRY_BASE_DELAY", cast=float, default=0.5)  # seconds
+TVDB_RETRY_MAX_DELAY = get_config("TVDB_RETRY_MAX_DELAY", cast=float, default=5)  # seconds
+# GET requests taking longer than this get a second copy sent alongside them, using whichever response arrives
+# first (0 to disable this). The copies go through the rate-limit with the lowest priority, and only up to the
+# max inflight of them can run at once (so that they can't overload an already slow API).
+TVDB_HEDGE_DELAY = get_config("TVDB_HEDGE_DELAY", cast=float, default=2)  # seconds
+TVDB_HEDGE_MAX_INFLIGHT = get_config("TVDB_HEDGE_MAX_INFLIGHT", cast=int, default=2)
+# Once the requests to a TVDB endpoint (e.g. /series) fail this many times in a row (including the retries),
+# the requests to it are rejected right away for the reset timeout, after which a single probe request is let
+# through. Meanwhile, the cached responses (even the stale ones) are still served.
+TVDB_CIRCUIT_FAILURE_THRESHOLD = get_config("TVDB_CIRCUIT_FAILURE_THRESHOLD", cast=int, default=5)
+TVDB_CIRCUIT_RESET_TIMEOUT = get_config("TVDB_CIRCUIT_RESET_TIMEOUT", cast=float, default=30)  # seconds
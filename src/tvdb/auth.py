@@ -0,0 +1,142 @@
+"""Obtaining and keeping the auth token for the TVDB API.
+
+The TVDB API tokens are valid for a month, so rather than logging in on every start of the bot,
+the token is stored in the database and reused for as long as it's valid.
+"""
+
+import base64
+import hashlib
+from datetime import UTC, datetime, timedelta
+from typing import ClassVar
+
+import aiohttp
+from yarl import URL
+
+from src.db_adapters.api_token import api_token_get, api_token_set
+from src.tvdb.errors import InvalidApiKeyError
+from src.utils import json_codec
+from src.utils.database import get_db_session
+from src.utils.log import get_logger
+from src.utils.singleflight import SingleFlight
+
+log = get_logger(__name__)
+
+__all__ = ["TokenManager"]
+
+
+def _token_expiry(token: str) -> datetime | None:
+    """Get the expiry of given token from its claims (the TVDB tokens are JWTs), if it can be obtained."""
+    try:
+        payload = token.split(".")[1]
+        claims = json_codec.decode(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return datetime.fromtimestamp(claims["exp"], UTC)
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class TokenManager:
+    """Provides the auth token for the TVDB API, logging in only when necessary.
+
+    Concurrent callers needing a new token share a single login request. The obtained token
+    is stored in the database along with its expiry, and it gets replaced by a new one shortly
+    before it expires, so that the requests don't have to fail first to find out.
+    """
+
+    SERVICE: ClassVar[str] = "tvdb"
+    DEFAULT_VALIDITY: ClassVar[timedelta] = timedelta(days=30)
+    """Validity assumed for the tokens which don't carry their expiry."""
+    REFRESH_MARGIN: ClassVar[timedelta] = timedelta(days=1)
+    """How long before the expiry of the token a new one is obtained."""
+
+    def __init__(self, http_session: aiohttp.ClientSession, login_url: URL, api_key: str, *, persist: bool = True):
+        """Initialize the token manager.
+
+        :param login_url: URL of the login endpoint of the TVDB API.
+        :param persist: Whether to store the token in the database (and reuse the stored one).
+        """
+        self.http_session = http_session
+        self.login_url = login_url
+        self.api_key = api_key
+        self.persist = persist
+        self.token: str | None = None
+        self.expires_at: datetime | None = None
+        self.logins = 0
+        self._api_key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+        self._loaded = not persist
+        self._flight: SingleFlight[str, str] = SingleFlight()
+
+    def _is_usable(self) -> bool:
+        """Check whether the current token can be used, without it needing to be refreshed first."""
+        return (
+            self.token is not None
+            and self.expires_at is not None
+            and datetime.now(UTC) < self.expires_at - self.REFRESH_MARGIN
+        )
+
+    async def get_token(self) -> str:
+        """Get a valid auth token, logging in first if there is none (or if it's about to expire)."""
+        if self.token is not None and self._is_usable():
+            return self.token
+
+        token, _ = await self._flight.do("token", self._obtain)
+        return token
+
+    def invalidate(self, token: str) -> None:
+        """Mark given token as rejected by the API, so that a new one gets obtained on the next use.
+
+        This does nothing if the token was already replaced (e.g. by a concurrent request which got rejected too).
+        """
+        if self.token == token:
+            self.token = None
+            self.expires_at = None
+
+    async def _obtain(self) -> str:
+        if not self._loaded:
+            self._loaded = True
+            await self._load()
+            if self.token is not None and self._is_usable():
+                log.debug("Using the stored TVDB API token")
+                return self.token
+
+        token = await self._login()
+        self.token = token
+        self.expires_at = _token_expiry(token) or datetime.now(UTC) + self.DEFAULT_VALIDITY
+        if self.persist:
+            await self._store()
+        return token
+
+    async def _load(self) -> None:
+        """Load the token stored in the database (the failures are only logged, the token is just obtained again)."""
+        try:
+            async with get_db_session() as session:
+                stored = await api_token_get(session, self.SERVICE, self._api_key_hash)
+        except Exception:
+            log.exception("Failed to load the stored TVDB API token")
+            return
+
+        if stored is not None:
+            self.token, self.expires_at = stored
+
+    async def _store(self) -> None:
+        """Store the current token in the database (the failures are only logged)."""
+        if self.token is None or self.expires_at is None:
+            return
+        try:
+            async with get_db_session() as session:
+                await api_token_set(session, self.SERVICE, self._api_key_hash, self.token, self.expires_at)
+        except Exception:
+            log.exception("Failed to store the TVDB API token")
+
+    async def _login(self) -> str:
+        """Obtain a new auth token from the TVDB API."""
+        log.debug("Requesting TVDB API login")
+        self.logins += 1
+        async with self.http_session.post(self.login_url, json={"apikey": self.api_key}) as response:
+            if response.status == 401:
+                log.error("Invalid TVDB API key, login request failed.")
+                response_txt = await response.text()
+                raise InvalidApiKeyError(response, response_txt)
+
+            response.raise_for_status()
+            data = json_codec.decode(await response.read())
+            return data["data"]["token"]
@@ -1,19 +1,56 @@
+import asyncio
+import time
+import unicodedata
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from enum import Enum
-from typing import ClassVar, Literal, Self, final, overload, override
+from typing import Any, ClassVar, Literal, Self, cast, final, overload, override
 
 import aiohttp
 from aiocache import BaseCache
+from pydantic import BaseModel
 from yarl import URL
 
-from src.settings import TVDB_API_KEY, TVDB_RATE_LIMIT_PERIOD, TVDB_RATE_LIMIT_REQUESTS
-from src.tvdb.errors import BadCallError, InvalidApiKeyError, InvalidIdError
+from src.settings import (
+    TVDB_API_KEY,
+    TVDB_AUTOCOMPLETE_SIZE,
+    TVDB_BASE_URL,
+    TVDB_CACHE_HARD_TTL,
+    TVDB_CACHE_SOFT_TTL,
+    TVDB_CIRCUIT_FAILURE_THRESHOLD,
+    TVDB_CIRCUIT_RESET_TIMEOUT,
+    TVDB_HEDGE_DELAY,
+    TVDB_HEDGE_MAX_INFLIGHT,
+    TVDB_HTTP_CONNECT_TIMEOUT,
+    TVDB_HTTP_DNS_CACHE_TTL,
+    TVDB_HTTP_KEEPALIVE,
+    TVDB_HTTP_MAX_CONNECTIONS,
+    TVDB_HTTP_MAX_CONNECTIONS_PER_HOST,
+    TVDB_HTTP_READ_TIMEOUT,
+    TVDB_LOCAL_SEARCH_MIN_SCORE,
+    TVDB_MODEL_CACHE_SIZE,
+    TVDB_NEGATIVE_CACHE_SIZE,
+    TVDB_NEGATIVE_CACHE_TTL,
+    TVDB_RATE_LIMIT_MAX_WAIT,
+    TVDB_RATE_LIMIT_PERIOD,
+    TVDB_RATE_LIMIT_REQUESTS,
+    TVDB_REQUEST_TIMEOUT,
+    TVDB_RETRY_ATTEMPTS,
+    TVDB_RETRY_BASE_DELAY,
+    TVDB_RETRY_MAX_DELAY,
+)
+from src.tvdb.auth import TokenManager
+from src.tvdb.episode_index import EpisodeIndex, format_episode_name
+from src.tvdb.errors import BadCallError, InvalidIdError, NotFoundError, TVDBError, TokenRejectedError
 from src.tvdb.generated_models import (
     EpisodeBaseRecord,
     EpisodeExtendedRecord,
     EpisodesIdExtendedGetResponse,
     EpisodesIdGetResponse,
+    Links,
     MovieBaseRecord,
     MovieExtendedRecord,
     MoviesIdExtendedGetResponse,
@@ -27,9 +64,17 @@ from src.tvdb.generated_models import (
     SeriesIdExtendedGetResponse,
     SeriesIdGetResponse,
 )
+from src.tvdb.title_index import TitleIndex, TitleMatch, normalize_title
+from src.utils import json_codec
+from src.utils.http import ConnectionStats, create_pooled_session
 from src.utils.iterators import get_first
+from src.utils.lazy import reset_cached_properties, slot_cached_property
 from src.utils.log import get_logger
-from src.utils.ratelimit import rate_limit
+from src.utils.lru import LRUCache
+from src.utils.prefix_index import PrefixIndex
+from src.utils.ratelimit import RateLimitPriority, RateLimitQueue
+from src.utils.resilience import CircuitBreaker, CircuitOpenError, Hedger, backoff_delay
+from src.utils.singleflight import SingleFlight
 
 log = get_logger(__name__)
 
@@ -38,6 +83,65 @@ type JSON_DATA = dict[str, JSON_DATA] | list[JSON_DATA] | str | int | float | bo
 type SeriesRecord = SeriesBaseRecord | SeriesExtendedRecord
 type MovieRecord = MovieBaseRecord | MovieExtendedRecord
 type AnyRecord = SeriesRecord | MovieRecord
+type MediaResponse = (
+    MoviesIdGetResponse | SeriesIdGetResponse | MoviesIdExtendedGetResponse | SeriesIdExtendedGetResponse
+)
+
+
+@dataclass
+class CacheStats:
+    """Counters tracking how the cached TVDB requests were resolved."""
+
+    model_hits: int = 0
+    """Requests that were answered from the in-process cache of already validated responses."""
+    hits: int = 0
+    """Requests that were answered from the (response) cache."""
+    stale_hits: int = 0
+    """Requests that were answered with a stale cached response, while it's being refreshed in the background."""
+    misses: int = 0
+    """Requests that had to be sent to the TVDB API."""
+    coalesced: int = 0
+    """Requests that joined an identical in-flight request, instead of sending their own."""
+    local_hits: int = 0
+    """Searches that were answered from the local title index."""
+    negative_hits: int = 0
+    """Requests for missing records, or searches without results, that were answered from the negative cache."""
+
+    @property
+    def saved(self) -> int:
+        """Total amount of requests that didn't reach the TVDB API."""
+        return self.model_hits + self.hits + self.stale_hits + self.coalesced + self.local_hits + self.negative_hits
+
+
+@dataclass
+class RefreshStats:
+    """Counters tracking the background refreshes of the stale cached TVDB responses."""
+
+    scheduled: int = 0
+    """Refreshes that were started."""
+    deduplicated: int = 0
+    """Refreshes that weren't started, as a refresh (or a fetch) for the same key was already running."""
+    completed: int = 0
+    """Refreshes that finished successfully."""
+    failed: int = 0
+    """Refreshes that failed (e.g. due to the rate-limit), leaving the stale response in the cache."""
+
+
+@dataclass
+class RetryStats:
+    """Counters tracking the retries of the failed TVDB requests."""
+
+    retried: int = 0
+    """Failed attempts that were followed by a retry."""
+    gave_up: int = 0
+    """Requests that still failed after all of the retries."""
+
+
+def _is_upstream_failure(exc: BaseException) -> bool:
+    """Check whether the exception raised by a TVDB request means that the API is failing (or overloaded)."""
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status == 429 or exc.status >= 500
+    return isinstance(exc, (TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError))
 
 
 class FetchMeta(Enum):
@@ -47,6 +151,203 @@ class FetchMeta(Enum):
     EPISODES = "episodes"
 
 
+_SHORT_OMITTED_FIELDS = frozenset({"characters", "artworks"})
+"""Fields of the extended records which are omitted from the short responses."""
+
+_FULL_RECORD_PART = "full"
+"""Part of a :class:`CachedMediaRecord` holding the fields omitted from the short responses."""
+
+
+class SeriesEpisodesPageResponse(SeriesIdEpisodesSeasonTypeGetResponse):
+    """A page of the episodes of a series.
+
+    The generated model lacks the pagination links, even though the API does send them.
+    """
+
+    links: Links | None = None
+
+
+SEASON_TYPES = ("official", "dvd", "absolute", "alternate", "regional", "altdvd", "alttwo")
+"""Season types, by which the episodes of a series can be ordered."""
+
+EPISODE_LANGUAGES = ("eng",)
+"""Languages in which the episode lists are fetched (see :meth:`Series.fetch_english_episodes`)."""
+
+
+@dataclass(frozen=True)
+class MediaVariant:
+    """Describes which parts of a movie or series record were requested (or are held in the cache).
+
+    The variants form a hierarchy: an extended record contains everything that's in the base record,
+    the full (non-short) extended record contains everything that's in the short one, and a record
+    with some metas contains everything that's in a record with any subset of those metas.
+    """
+
+    extended: bool = False
+    short: bool = False
+    metas: frozenset[FetchMeta] = frozenset()
+
+    @classmethod
+    def from_fetch_args(cls, *, extended: bool, short: bool | None, meta: FetchMeta | None) -> "MediaVariant":
+        """Get the variant requested by the given :meth:`_Media.fetch` arguments."""
+        if not extended:
+            if meta:
+                raise BadCallError("Meta can only be used with extended=True.")
+            if short:
+                raise BadCallError("Short can only be enabled with extended=True.")
+            return cls()
+        return cls(extended=True, short=bool(short), metas=frozenset({meta}) if meta else frozenset())
+
+    def cache_key(self, media_id: int) -> str:
+        """Get the key identifying this exact variant of given media."""
+        if not self.extended:
+            return f"{media_id}"
+        return "_".join([f"{media_id}", str(self.short), *sorted(meta.value for meta in self.metas)])
+
+    def query(self) -> dict[str, str] | None:
+        """Get the query parameters for fetching this variant from the API."""
+        if not self.extended:
+            return None
+        query = {"short": "true" if self.short else "false"}
+        if self.metas:
+            # Only the merged (cached) variants can hold multiple metas, requested ones always have just one
+            query["meta"] = ",".join(sorted(meta.value for meta in self.metas))
+        return query
+
+    def covers(self, other: "MediaVariant") -> bool:
+        """Check whether a record of this variant contains everything that a record of the `other` variant does."""
+        if not other.extended:
+            return True
+        if not self.extended:
+            return False
+        return (other.short or not self.short) and other.metas <= self.metas
+
+    def merge(self, other: "MediaVariant") -> "MediaVariant":
+        """Get the variant of a record obtained by merging records of this and the `other` variant."""
+        if not self.extended:
+            return other
+        if not other.extended:
+            return self
+        return MediaVariant(extended=True, short=self.short and other.short, metas=self.metas | other.metas)
+
+    @property
+    def parts(self) -> frozenset[str]:
+        """Parts of an extended record that only the records of this variant (or richer ones) hold."""
+        parts = {meta.value for meta in self.metas}
+        if self.extended and not self.short:
+            parts.add(_FULL_RECORD_PART)
+        return frozenset(parts)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A TVDB API response, stored in the cache along with the time it was fetched at.
+
+    The response is kept as the raw JSON bytes, which are a lot more compact than the decoded objects.
+    """
+
+    response: bytes
+    fetched_at: float
+    """Unix timestamp of when the response was fetched."""
+
+    @property
+    def age(self) -> float:
+        """Time in seconds since the response was fetched."""
+        return time.time() - self.fetched_at
+
+    @property
+    def stale(self) -> bool:
+        """Whether the response is older than the soft TTL, and should be refreshed."""
+        return self.age >= TVDB_CACHE_SOFT_TTL
+
+
+@dataclass(frozen=True)
+class CachedMediaRecord(CachedResponse):
+    """An extended movie or series response, stored in the cache along with the variant it covers.
+
+    All of the extended variants of a single media are merged into one such record, so that e.g.
+    fetching the translations and then the episodes of a series results in a record holding both.
+    """
+
+    variant: MediaVariant
+    parts_fetched_at: Mapping[str, float]
+    """Unix timestamps of when the parts (see :attr:`MediaVariant.parts`) kept from older responses were fetched.
+
+    The parts that aren't listed here were fetched along with the rest of the record, at `fetched_at`.
+    """
+
+    def fetched_at_for(self, variant: MediaVariant) -> float:
+        """Get the time at which the oldest part of this record needed for given variant was fetched."""
+        parts = [self.parts_fetched_at[part] for part in variant.parts if part in self.parts_fetched_at]
+        return min([self.fetched_at, *parts])
+
+    def for_variant(self, variant: MediaVariant) -> "CachedMediaRecord":
+        """Get this record, as fresh as the parts needed for given variant are.
+
+        A part kept from an older response only makes the record stale for the variants which need that
+        part, so that e.g. stale episodes of a series don't cause refreshes of its translations.
+        """
+        fetched_at = self.fetched_at_for(variant)
+        if fetched_at == self.fetched_at:
+            return self
+        return replace(self, fetched_at=fetched_at)
+
+    def merge(self, newer: "CachedMediaRecord") -> "CachedMediaRecord":
+        """Merge a newer response for the same media into this record.
+
+        The fields of the newer response take precedence, except for those that it doesn't cover
+        (omitted by `short`, or belonging to a meta that it wasn't fetched with), which are kept,
+        along with the times they were fetched at (see :attr:`parts_fetched_at`).
+        """
+        old_response, new_response = json_codec.decode(self.response), json_codec.decode(newer.response)
+        if not isinstance(old_response, dict) or not isinstance(new_response, dict):
+            return newer
+        old_data, new_data = old_response.get("data"), new_response.get("data")
+        if not isinstance(old_data, dict) or not isinstance(new_data, dict):
+            return newer
+
+        kept_parts = self.variant.parts - newer.variant.parts
+        kept_fields = kept_parts - {_FULL_RECORD_PART}
+        if _FULL_RECORD_PART in kept_parts:
+            kept_fields |= _SHORT_OMITTED_FIELDS
+        data = new_data | {field: old_data[field] for field in kept_fields if field in old_data}
+        return CachedMediaRecord(
+            response=json_codec.encode(new_response | {"data": data}),
+            fetched_at=newer.fetched_at,
+            variant=self.variant.merge(newer.variant),
+            # A part can't be fresher than the whole record (which could've been invalidated since)
+            parts_fetched_at={
+                part: min(self.fetched_at, self.parts_fetched_at.get(part, self.fetched_at)) for part in kept_parts
+            },
+        )
+
+
+@dataclass(frozen=True)
+class CachedSearchResponse(CachedResponse):
+    """A search response, stored in the cache along with the limit it was fetched with.
+
+    Only a single response is cached for each (canonical) query and entity type, fetched with the largest
+    limit requested so far. The searches with smaller limits are then answered with its first results.
+    """
+
+    limit: int
+    results: int
+    """Amount of the results in the response."""
+
+    def covers(self, limit: int) -> bool:
+        """Check whether the response holds all of the results of a search with given limit."""
+        # Getting fewer results than requested means that there aren't any more of them
+        return limit <= self.limit or self.results < self.limit
+
+
+def canonical_search_query(query: str) -> str:
+    """Canonicalize the search query (Unicode normalized, casefolded and with collapsed whitespace).
+
+    The queries differing only in these are sent to the API (and cached) as the same query.
+    """
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
 def parse_media_id(media_id: int | str) -> int:
     """Parse the media ID from a string."""
     try:
@@ -57,8 +358,61 @@ def parse_media_id(media_id: int | str) -> int:
         return media_id
 
 
+def _title_index_entry(data: AnyRecord | SearchResult) -> tuple[list[str | None], dict[str, Any]]:
+    """Get the titles of the movie or series, and its record for the title index.
+
+    The record has the same shape as a :class:`SearchResult` (by alias), so that the matches
+    of the index can be used in place of the search results from the TVDB API.
+    """
+    if isinstance(data, SearchResult):
+        translations = data.translations.root if data.translations and data.translations.root else {}
+        titles = [data.name, *(data.aliases or []), *translations.values()]
+        return titles, data.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+    kind = "series" if isinstance(data, (SeriesBaseRecord, SeriesExtendedRecord)) else "movie"
+    aliases = [alias.name for alias in data.aliases or [] if alias.name]
+    translations: dict[str, str] = {}
+    overviews: dict[str, str] = {}
+    if isinstance(data, (SeriesExtendedRecord, MovieExtendedRecord)) and data.translations:
+        for translation in data.translations.name_translations or []:
+            if translation.language and translation.name:
+                translations[translation.language] = translation.name
+        for translation in data.translations.overview_translations or []:
+            if translation.language and translation.overview:
+                overviews[translation.language] = translation.overview
+
+    record = {
+        "id": f"{kind}-{data.id}",
+        "tvdb_id": str(data.id),
+        "type": kind,
+        "name": data.name,
+        "slug": data.slug,
+        "image_url": data.image,
+        "overview": data.overview if isinstance(data, SeriesExtendedRecord) else None,
+        "aliases": aliases or None,
+        "translations": translations or None,
+        "overviews": overviews or None,
+    }
+    return [data.name, *aliases, *translations.values()], record
+
+
 class _Media(ABC):
+    __slots__ = (
+        "client",
+        "data",
+        "name",
+        "overview",
+        "entity_type",
+        "slug",
+        "_id",
+        "_name_eng",
+        "_overview_eng",
+        "_image_url",
+    )
+
     ENDPOINT: ClassVar[str]
+    SEARCH_TYPE: ClassVar[Literal["movie", "series"]]
+    """Type of the media in the search results."""
 
     ResponseType: ClassVar[type[MoviesIdGetResponse | SeriesIdGetResponse]]
     ExtendedResponseType: ClassVar[type[MoviesIdExtendedGetResponse | SeriesIdExtendedGetResponse]]
@@ -71,6 +425,10 @@ class _Media(ABC):
 
     def set_attributes(self, data: AnyRecord | SearchResult) -> None:
         """Setting attributes."""
+        # The derived attributes are only computed once they're accessed, so if the data is being
+        # replaced, the already computed ones have to be forgotten
+        if hasattr(self, "data"):
+            reset_cached_properties(self)
         self.data = data
         self.name: str | None = self.data.name
         self.overview: str | None = None
@@ -83,36 +441,55 @@ class _Media(ABC):
             self.slug = self.data.slug
         self.id = self.data.id
 
-        self.name_eng: str | None = None
-        self.overview_eng: str | None = None
-
-        self.image_url: URL | None = None
-        if isinstance(self.data, SearchResult) and self.data.image_url:
-            self.image_url = URL(self.data.image_url)
-        elif not isinstance(self.data, SearchResult) and self.data.image:
-            self.image_url = URL(self.data.image)
-
+    @slot_cached_property
+    def name_eng(self) -> str | None:
+        """English name of the media, if known."""
         if isinstance(self.data, SearchResult):
             if self.data.translations and self.data.translations.root:
-                self.name_eng = self.data.translations.root.get("eng")
+                return self.data.translations.root.get("eng")
+            return None
+
+        name_eng: str | None = None
+        if self.data.aliases:
+            name_eng = get_first(alias.name for alias in self.data.aliases if alias.language == "eng")
+        if (
+            isinstance(self.data, (SeriesExtendedRecord, MovieExtendedRecord))
+            and self.data.translations
+            and self.data.translations.name_translations
+        ):
+            name_eng = get_first(
+                translation.name
+                for translation in self.data.translations.name_translations
+                if translation.language == "eng"
+            )
+        return name_eng
+
+    @slot_cached_property
+    def overview_eng(self) -> str | None:
+        """English overview of the media, if known."""
+        if isinstance(self.data, SearchResult):
             if self.data.overviews and self.data.overviews.root:
-                self.overview_eng = self.data.overviews.root.get("eng")
-        else:
-            if self.data.aliases:
-                self.name_eng = get_first(alias.name for alias in self.data.aliases if alias.language == "eng")
-            if isinstance(self.data, (SeriesExtendedRecord, MovieExtendedRecord)) and self.data.translations:
-                if self.data.translations.name_translations:
-                    self.name_eng = get_first(
-                        translation.name
-                        for translation in self.data.translations.name_translations
-                        if translation.language == "eng"
-                    )
-                if self.data.translations.overview_translations:
-                    self.overview_eng = get_first(
-                        translation.overview
-                        for translation in self.data.translations.overview_translations
-                        if translation.language == "eng"
-                    )
+                return self.data.overviews.root.get("eng")
+            return None
+
+        if (
+            isinstance(self.data, (SeriesExtendedRecord, MovieExtendedRecord))
+            and self.data.translations
+            and self.data.translations.overview_translations
+        ):
+            return get_first(
+                translation.overview
+                for translation in self.data.translations.overview_translations
+                if translation.language == "eng"
+            )
+        return None
+
+    @slot_cached_property
+    def image_url(self) -> URL | None:
+        """URL of the (poster) image of the media."""
+        if isinstance(self.data, SearchResult):
+            return URL(self.data.image_url) if self.data.image_url else None
+        return URL(self.data.image) if self.data.image else None
 
     @property
     def bilingual_name(self) -> str | None:
@@ -144,6 +521,7 @@ class _Media(ABC):
         extended: Literal[False] = False,
         short: Literal[False] | None = None,
         meta: None = None,
+        priority: RateLimitPriority = RateLimitPriority.INTERACTIVE,
     ) -> Self: ...
 
     @classmethod
@@ -156,6 +534,7 @@ class _Media(ABC):
         extended: Literal[True],
         short: bool | None = None,
         meta: FetchMeta | None = None,
+        priority: RateLimitPriority = RateLimitPriority.INTERACTIVE,
     ) -> Self: ...
 
     @classmethod
@@ -167,6 +546,7 @@ class _Media(ABC):
         extended: bool = False,
         short: bool | None = None,
         meta: FetchMeta | None = None,
+        priority: RateLimitPriority = RateLimitPriority.INTERACTIVE,
     ) -> Self:
         """Fetch a movie by its ID.
 
@@ -175,46 +555,33 @@ class _Media(ABC):
         :param extended:  Whether to fetch extended information.
         :param short:  Whether to omit characters and artworks from the response. Requires extended=True to work.
         :param meta:  The meta to fetch. Requires extended=True to work.
+        :param priority:  Rate-limit priority of the request, if it has to be sent to the API.
         :return:
         """
-        media_id = parse_media_id(media_id)
-        cache_key: str = f"{media_id}"
-        if extended:
-            cache_key += f"_{bool(short)}"
-            if meta:
-                cache_key += f"_{meta.value}"
-        response = await client.cache.get(cache_key, namespace=f"tvdb_{cls.ENDPOINT}")
-        query: dict[str, str] = {}
-        if extended:
-            if meta:
-                query["meta"] = meta.value
-            if short:
-                query["short"] = "true"
-            else:
-                query["short"] = "false"
-        elif meta:
-            raise BadCallError("Meta can only be used with extended=True.")
-        elif short:
-            raise BadCallError("Short can only be enabled with extended=True.")
-        if not response:
-            response = await client.request(
-                "GET",
-                f"{cls.ENDPOINT}/{media_id}" + ("/extended" if extended else ""),
-                query=query if query else None,
-            )
-            await client.cache.set(key=cache_key, value=response, ttl=60 * 60, namespace=f"tvdb_{cls.ENDPOINT}")
-            log.trace(f"Stored into cache: {cache_key}")
-        else:
-            log.trace(f"Loaded from cache: {cache_key}")
-        response = cls.ResponseType(**response) if not extended else cls.ExtendedResponseType(**response)  # pyright: ignore[reportCallIssue]
-
+        variant = MediaVariant.from_fetch_args(extended=extended, short=short, meta=meta)
+        response = await client.cached_media_response(cls, parse_media_id(media_id), variant, priority=priority)
         return cls(client, response.data)
 
-    async def ensure_translations(self) -> None:
+    @classmethod
+    def cache_namespace(cls) -> str:
+        """Get the cache namespace used to store the responses for this kind of media."""
+        return f"tvdb_{cls.ENDPOINT}"
+
+    @classmethod
+    def _response_type(cls, *, extended: bool) -> type[MediaResponse]:
+        """Get the response model of the fetch request."""
+        return cls.ExtendedResponseType if extended else cls.ResponseType
+
+    async def ensure_translations(self, *, priority: RateLimitPriority = RateLimitPriority.INTERACTIVE) -> None:
         """Ensure that response contains translations."""
         if not isinstance(self.data, SeriesExtendedRecord):
             series = await self.fetch(
-                media_id=self.id, client=self.client, extended=True, short=True, meta=FetchMeta.TRANSLATIONS
+                media_id=self.id,
+                client=self.client,
+                extended=True,
+                short=True,
+                meta=FetchMeta.TRANSLATIONS,
+                priority=priority,
             )
             self.set_attributes(series.data)
 
@@ -223,7 +590,10 @@ class _Media(ABC):
 class Movie(_Media):
     """Class to interact with the TVDB API for movies."""
 
+    __slots__ = ("url",)
+
     ENDPOINT: ClassVar[str] = "movies"
+    SEARCH_TYPE: ClassVar[Literal["movie", "series"]] = "movie"
     data: SearchResult | MovieBaseRecord | MovieExtendedRecord
 
     ResponseType = MoviesIdGetResponse
@@ -245,49 +615,168 @@ class Movie(_Media):
 class Series(_Media):
     """Class to interact with the TVDB API for series."""
 
+    __slots__ = ("url", "seasons", "_episode_records", "_episodes", "_episode_index", "_english_episodes")
+
     ENDPOINT: ClassVar[str] = "series"
+    SEARCH_TYPE: ClassVar[Literal["movie", "series"]] = "series"
     data: SearchResult | SeriesBaseRecord | SeriesExtendedRecord
 
     ResponseType = SeriesIdGetResponse
     ExtendedResponseType = SeriesIdExtendedGetResponse
 
     def __init__(self, client: "TvdbClient", data: AnyRecord | SearchResult | None):
+        self._english_episodes: dict[int, EpisodeBaseRecord] = {}
         super().__init__(client, data)
 
     @override
     def set_attributes(self, data: SearchResult | SeriesBaseRecord | SeriesExtendedRecord) -> None:
         super().set_attributes(data)
-        self.episodes: list[Episode] | None = None
         self.seasons: list[SeasonBaseRecord] | None = None
+        self._episode_records: list[EpisodeBaseRecord] | None = None
         if isinstance(self.data, SeriesExtendedRecord):
             self.seasons = self.data.seasons
-            if self.data.episodes:
-                self.episodes = [Episode(episode, client=self.client) for episode in self.data.episodes]
+            self._episode_records = self.data.episodes
         self.url: str | None = f"https://www.thetvdb.com/series/{self.slug}" if self.slug else None
 
+    @slot_cached_property
+    def episodes(self) -> "list[Episode] | None":
+        """Episodes of the series, if they were fetched.
+
+        The episode objects are only constructed once this is first accessed.
+        """
+        if not self._episode_records:
+            return None
+        return [Episode(episode, client=self.client) for episode in self._episode_records]
+
+    @slot_cached_property
+    def episode_index(self) -> EpisodeIndex | None:
+        """Compact index of the episodes of the series, if they were fetched.
+
+        Unlike :attr:`episodes`, this doesn't construct an :class:`Episode` for each episode,
+        use :meth:`episode_at` to only get those that are actually needed. The episode records are
+        kept by the series, see :meth:`episode_record`.
+        """
+        if not self._episode_records:
+            return None
+        return EpisodeIndex(self._episode_records)
+
+    def episode_record(self, row: int) -> EpisodeBaseRecord:
+        """Get the record of the episode in given row of the :attr:`episode_index`."""
+        if self.episode_index is None or self._episode_records is None:
+            raise ValueError("Series has no episodes")
+        return self._episode_records[self.episode_index.positions[row]]
+
+    def episode_at(self, row: int) -> "Episode":
+        """Get the episode in given row of the :attr:`episode_index`."""
+        record = self.episode_record(row)
+        return Episode(record, client=self.client, english=self.english_episode(record.id))
+
+    def english_episode(self, episode_id: int | None) -> EpisodeBaseRecord | None:
+        """Get the English record of given episode, if it was fetched (see :meth:`fetch_english_episodes`)."""
+        if episode_id is None:
+            return None
+        return self._english_episodes.get(episode_id)
+
     @override
     @classmethod
     async def supports_meta(cls, meta: FetchMeta) -> bool:
         """Check if the class supports a specific meta."""
         return meta in {FetchMeta.TRANSLATIONS, FetchMeta.EPISODES}
 
-    async def fetch_episodes(self, season_type: str = "official") -> None:
-        """Fetch episodes for the series based on the season type."""
-        cache_key: str = f"{self.id}_{season_type}"
+    def set_episode_records(self, records: list[EpisodeBaseRecord]) -> None:
+        """Replace the episodes of the series with given episode records."""
+        self._episode_records = records
+        Series.episodes.reset(self)
+        Series.episode_index.reset(self)
+
+    async def iter_episode_pages(
+        self,
+        season_type: str = "official",
+        *,
+        language: str | None = None,
+        priority: RateLimitPriority = RateLimitPriority.INTERACTIVE,
+    ) -> AsyncIterator[list[EpisodeBaseRecord]]:
+        """Fetch the episodes of the series based on the season type, yielding them page by page.
+
+        Each page is yielded as soon as it's fetched (and each one is cached separately), so the
+        first episodes can already be used while the later pages are still being fetched.
+
+        :param language:
+            If set, the names and overviews of the episodes are translated to this language (they're
+            empty for the episodes without such translation), otherwise they're in the original language.
+        :param priority: Rate-limit priority of the requests, for the pages that have to be fetched from the API.
+        """
         endpoint = f"series/{self.id}/episodes/{season_type}"
-        response = await self.client.cache.get(cache_key, namespace="tvdb_episodes")
-        if not response:
-            response = await self.client.request("GET", endpoint)
-            await self.client.cache.set(cache_key, value=response, namespace="tvdb_episodes", ttl=60 * 60)
-            log.trace(f"Stored into cache: {cache_key}")
-        else:
-            log.trace(f"Loaded from cache: {cache_key}")
+        cache_prefix = f"{self.id}_{season_type}"
+        if language is not None:
+            endpoint += f"/{language}"
+            cache_prefix += f"_{language}"
+
+        page = 0
+        while True:
+            # The generated model of the translated variant lacks the episodes, but the response is the same
+            response = await self.client.cached_model(
+                SeriesEpisodesPageResponse,
+                endpoint,
+                query={"page": str(page)},
+                cache_key=f"{cache_prefix}_{page}",
+                namespace="tvdb_episodes",
+                priority=priority,
+            )
+            episodes = response.data.episodes if response.data else None
+            if not episodes:
+                return
+            yield episodes
 
-        # Assuming 'episodes' field contains the list of episodes
-        response = SeriesIdEpisodesSeasonTypeGetResponse(**response)  # pyright: ignore[reportCallIssue]
+            if not response.links or not response.links.next:
+                return
+            page += 1
 
-        if response.data and response.data.episodes:
-            self.episodes = [Episode(episode, client=self.client) for episode in response.data.episodes]
+    async def iter_episodes(self, season_type: str = "official") -> AsyncIterator["Episode"]:
+        """Fetch the episodes of the series based on the season type, yielding them as they arrive.
+
+        See :meth:`iter_episode_pages` for more details.
+        """
+        async for records in self.iter_episode_pages(season_type):
+            for record in records:
+                yield Episode(record, client=self.client)
+
+    async def fetch_episodes(
+        self,
+        season_type: str = "official",
+        *,
+        priority: RateLimitPriority = RateLimitPriority.INTERACTIVE,
+    ) -> None:
+        """Fetch all of the episodes (from all of the pages) for the series based on the season type."""
+        pages = self.iter_episode_pages(season_type, priority=priority)
+        records = [record async for records in pages for record in records]
+        if records:
+            self.set_episode_records(records)
+
+    async def fetch_english_episodes(
+        self,
+        season_type: str = "official",
+        *,
+        priority: RateLimitPriority = RateLimitPriority.INTERACTIVE,
+    ) -> None:
+        """Fetch the English names and overviews of all of the episodes of the series.
+
+        These are fetched as translated episode lists (a few hundred episodes per request), rather than
+        as the translations of each episode, which would take a request per episode (and include all of
+        the other languages too). The :class:`Episode` objects created afterwards (see :meth:`episode_at`)
+        then have their :attr:`Episode.name_eng` and :attr:`Episode.overview_eng` filled from these.
+        """
+        pages = self.iter_episode_pages(season_type, language="eng", priority=priority)
+        self._english_episodes = {}
+        async for records in pages:
+            self.add_english_episodes(records)
+
+    def add_english_episodes(self, records: Iterable[EpisodeBaseRecord]) -> None:
+        """Add the English records of some of the episodes (a page of the English episode list).
+
+        This allows using the English episodes page by page, see :meth:`fetch_english_episodes`.
+        """
+        self._english_episodes.update((record.id, record) for record in records if record.id is not None)
 
     async def ensure_seasons_and_episodes(self) -> None:
         """Ensure that reponse contains seasons."""
@@ -301,69 +790,139 @@ class Series(_Media):
 class Episode:
     """Represents an episode from Tvdb."""
 
-    def __init__(self, data: EpisodeBaseRecord | EpisodeExtendedRecord, client: "TvdbClient") -> None:
+    __slots__ = (
+        "client",
+        "data",
+        "id",
+        "name",
+        "overview",
+        "number",
+        "season_number",
+        "series_id",
+        "english",
+        "_name_eng",
+        "_overview_eng",
+        "_air_date",
+        "_aired",
+        "_image_url",
+    )
+
+    CACHE_NAMESPACE: ClassVar[str] = "tvdb_episode"
+    """Cache namespace of the responses of the single episode fetches (see :meth:`fetch`)."""
+
+    def __init__(
+        self,
+        data: EpisodeBaseRecord | EpisodeExtendedRecord,
+        client: "TvdbClient",
+        *,
+        english: EpisodeBaseRecord | None = None,
+    ) -> None:
+        """Initialize the episode.
+
+        :param english:
+            English record of the episode (see :meth:`Series.fetch_english_episodes`), used for the English
+            name and overview, unless the data holds the translations itself.
+        """
         self.client = client
+        self.english = english
         self.set_attributes(data)
 
     def set_attributes(self, data: EpisodeBaseRecord | EpisodeExtendedRecord) -> None:
         """Set attributes."""
+        # The derived attributes are only computed once they're accessed, so if the data is being
+        # replaced, the already computed ones have to be forgotten
+        if hasattr(self, "data"):
+            reset_cached_properties(self)
         self.data = data
         self.id: int | None = self.data.id
-        self.image_url: str | None = self.data.image if self.data.image else None
         self.name: str | None = self.data.name
         self.overview: str | None = self.data.overview
         self.number: int | None = self.data.number
         self.season_number: int | None = self.data.season_number
-        self.name_eng: str | None = None
-        self.overview_eng: str | None = None
         self.series_id: int | None = self.data.series_id
-        self.air_date: datetime | None = None
-        if self.data.aired:
-            self.air_date = datetime.strptime(self.data.aired, "%Y-%m-%d").replace(tzinfo=UTC)
-        self.aired: bool = self.air_date is not None and self.air_date <= datetime.now(UTC)
-
-        if isinstance(self.data, EpisodeExtendedRecord):
-            if self.data.translations and self.data.translations.name_translations:
-                self.name_eng = get_first(
+
+    @slot_cached_property
+    def image_url(self) -> str | None:
+        """URL of the image (thumbnail) of the episode."""
+        return self.data.image if self.data.image else None
+
+    @slot_cached_property
+    def air_date(self) -> datetime | None:
+        """Date when the episode was (or will be) first aired."""
+        if not self.data.aired:
+            return None
+        return datetime.strptime(self.data.aired, "%Y-%m-%d").replace(tzinfo=UTC)
+
+    @slot_cached_property
+    def aired(self) -> bool:
+        """Whether the episode was already aired (at the time of the first access)."""
+        return self.air_date is not None and self.air_date <= datetime.now(UTC)
+
+    @slot_cached_property
+    def name_eng(self) -> str | None:
+        """English name of the episode, if known."""
+        if isinstance(self.data, EpisodeExtendedRecord) and self.data.translations:
+            if self.data.translations.name_translations:
+                return get_first(
                     translation.name
                     for translation in self.data.translations.name_translations
                     if translation.language == "eng"
                 )
-
-            if self.data.translations and self.data.translations.overview_translations:
-                self.overview_eng = get_first(
+        return self.english.name if self.english else None
+
+    @slot_cached_property
+    def overview_eng(self) -> str | None:
+        """English overview of the episode, if known."""
+        if isinstance(self.data, EpisodeExtendedRecord) and self.data.translations:
+            if self.data.translations.overview_translations:
+                return get_first(
                     translation.overview
                     for translation in self.data.translations.overview_translations
                     if translation.language == "eng"
                 )
+        return self.english.overview if self.english else None
 
     @property
     def formatted_name(self) -> str:
         """Returns the name in format SxxEyy - Name."""
-        return f"S{self.season_number:02}E{self.number:02} - {self.name}"
+        return format_episode_name(self.season_number, self.number, self.name)
 
     @classmethod
-    async def fetch(cls, media_id: str | int, *, client: "TvdbClient", extended: bool = True) -> "Episode":
-        """Fetch episode."""
-        endpoint = f"/episodes/{parse_media_id(media_id)}"
-        query: dict[str, str] | None = None
-
-        if extended:
-            endpoint += "/extended"
-            query = {"meta": "translations"}
-        response = await client.request("GET", endpoint=endpoint, query=query)
-        response = EpisodesIdGetResponse(**response) if not extended else EpisodesIdExtendedGetResponse(**response)  # pyright: ignore[reportCallIssue]
+    async def fetch(
+        cls,
+        media_id: str | int,
+        *,
+        client: "TvdbClient",
+        extended: bool = True,
+        priority: RateLimitPriority = RateLimitPriority.INTERACTIVE,
+    ) -> "Episode":
+        """Fetch episode, going through the cache.
+
+        :param extended: Whether to fetch the extended record, with the translations.
+        :param priority: Rate-limit priority of the request, if it has to be sent to the API.
+        :raises NotFoundError: If the episode doesn't exist.
+        """
+        episode_id = parse_media_id(media_id)
+        response_type = EpisodesIdExtendedGetResponse if extended else EpisodesIdGetResponse
+        response = await client.cached_model(
+            response_type,
+            f"episodes/{episode_id}/extended" if extended else f"episodes/{episode_id}",
+            query={"meta": "translations"} if extended else None,
+            cache_key=f"{episode_id}_extended" if extended else f"{episode_id}",
+            namespace=cls.CACHE_NAMESPACE,
+            priority=priority,
+        )
 
         if not response.data:
             raise ValueError("No data found for Episode")
         return cls(response.data, client=client)
 
-    async def ensure_translations(self) -> None:
+    async def ensure_translations(self, *, priority: RateLimitPriority = RateLimitPriority.INTERACTIVE) -> None:
         """Ensure that response contains translations."""
         if not isinstance(self.data, EpisodeExtendedRecord):
             if not self.id:
                 raise ValueError("Episode has no ID")
-            episode = await self.fetch(self.id, client=self.client, extended=True)
+            episode = await self.fetch(self.id, client=self.client, extended=True, priority=priority)
             self.set_attributes(episode.data)
 
     async def fetch_series(
@@ -391,12 +950,78 @@ class Episode:
 class TvdbClient:
     """Class to interact with the TVDB API."""
 
-    BASE_URL: ClassVar[URL] = URL("https://api4.thetvdb.com/v4/")
+    BASE_URL: ClassVar[URL] = URL(TVDB_BASE_URL)
 
-    def __init__(self, http_session: aiohttp.ClientSession, cache: BaseCache):
+    def __init__(
+        self,
+        cache: BaseCache,
+        *,
+        http_session: aiohttp.ClientSession | None = None,
+        persist_token: bool = True,
+        title_index: TitleIndex | None = None,
+    ):
+        """Initialize the TVDB client.
+
+        This has to be called from within a running event loop.
+
+        :param http_session:
+            Session to use for the requests. By default, the client creates (and owns) its own session,
+            with a separate pool of connections, configured by the `TVDB_HTTP_*` settings.
+        :param persist_token: Whether to store the auth token in the database, to reuse it after a restart.
+        :param title_index:
+            If set, the titles of all of the fetched movies and series are added to this index, and the
+            searches are answered from it when possible (see :meth:`search`). It's closed with the client.
+        """
+        self.connection_stats = ConnectionStats()
+        self._owns_http_session = http_session is None
+        if http_session is None:
+            http_session = create_pooled_session(
+                max_connections=TVDB_HTTP_MAX_CONNECTIONS,
+                max_connections_per_host=TVDB_HTTP_MAX_CONNECTIONS_PER_HOST,
+                keepalive_timeout=TVDB_HTTP_KEEPALIVE,
+                connect_timeout=TVDB_HTTP_CONNECT_TIMEOUT or None,
+                read_timeout=TVDB_HTTP_READ_TIMEOUT or None,
+                dns_cache_ttl=TVDB_HTTP_DNS_CACHE_TTL,
+                stats=self.connection_stats,
+            )
         self.http_session = http_session
-        self.auth_token = None
+        self.token_manager = TokenManager(http_session, self.BASE_URL / "login", TVDB_API_KEY, persist=persist_token)
         self.cache = cache
+        self.cache_stats = CacheStats()
+        self.model_cache: LRUCache[tuple[str, str], BaseModel] = LRUCache(TVDB_MODEL_CACHE_SIZE)
+        self.negative_cache: LRUCache[str, float] = LRUCache(TVDB_NEGATIVE_CACHE_SIZE)
+        """Keys of the records that don't exist upstream, and of the searches without any results.
+
+        The values are the times when these were found to be missing (or empty). This is kept apart from
+        the response cache, so that these short-lived entries can't evict the actual responses.
+        """
+        self.rate_limiter = RateLimitQueue(
+            "tvdb",
+            limit=TVDB_RATE_LIMIT_REQUESTS,
+            period=TVDB_RATE_LIMIT_PERIOD,
+            max_wait=TVDB_RATE_LIMIT_MAX_WAIT or None,
+            err_msg="Bot wide rate-limit for TheTVDB API was exceeded.",
+        )
+        self.refresh_stats = RefreshStats()
+        self.retry_stats = RetryStats()
+        self.hedger = Hedger(delay=TVDB_HEDGE_DELAY, max_inflight=TVDB_HEDGE_MAX_INFLIGHT)
+        self.circuit_breakers: dict[str, CircuitBreaker] = {}
+        """Circuit breakers of the TVDB endpoints (keyed by the first segment of the path, e.g. "series")."""
+        self._inflight: SingleFlight[str, CachedResponse] = SingleFlight()
+        self._refreshes: dict[str, asyncio.Task[None]] = {}
+        self.title_index = title_index
+        self._index_tasks: set[asyncio.Task[None]] = set()
+        self._indexed_entries: LRUCache[tuple[str, int, str], int] = LRUCache(TVDB_AUTOCOMPLETE_SIZE)
+        """Hashes of the entries last added to the title index (keyed by media kind, ID and the record type)."""
+        self.title_completions = PrefixIndex(TVDB_AUTOCOMPLETE_SIZE, normalize=normalize_title)
+
+    async def close(self) -> None:
+        """Close the HTTP session of the client, if it's owned by it, and the title index."""
+        if self._owns_http_session:
+            await self.http_session.close()
+        if self.title_index is not None:
+            await asyncio.gather(*self._index_tasks)
+            await self.title_index.close()
 
     @overload
     async def request(
@@ -405,11 +1030,19 @@ class TvdbClient:
         endpoint: str,
         body: None = None,
         query: dict[str, str] | None = None,
+        *,
+        priority: RateLimitPriority = RateLimitPriority.INTERACTIVE,
     ) -> JSON_DATA: ...
 
     @overload
     async def request(
-        self, method: Literal["POST"], endpoint: str, body: JSON_DATA, query: None = None
+        self,
+        method: Literal["POST"],
+        endpoint: str,
+        body: JSON_DATA,
+        query: None = None,
+        *,
+        priority: RateLimitPriority = RateLimitPriority.INTERACTIVE,
     ) -> JSON_DATA: ...
 
     async def request(
@@ -418,79 +1051,794 @@ class TvdbClient:
         endpoint: str,
         body: JSON_DATA = None,
         query: dict[str, str] | None = None,
+        *,
+        priority: RateLimitPriority = RateLimitPriority.INTERACTIVE,
     ) -> JSON_DATA:
-        """Make an authorized request to the TVDB API."""
-        log.trace(f"Making TVDB {method} request to {endpoint}")
+        """Make an authorized request to the TVDB API, returning the decoded JSON response.
 
-        # TODO: It would be better to instead use a queue to handle rate-limits
-        # and block until the next request can be made.
-        await rate_limit(
-            self.cache,
-            "tvdb",
-            limit=TVDB_RATE_LIMIT_REQUESTS,
-            period=TVDB_RATE_LIMIT_PERIOD,
-            err_msg="Bot wide rate-limit for TheTVDB API was exceeded.",
-        )
+        See :meth:`request_raw` for more details.
+        """
+        return json_codec.decode(await self.request_raw(method, endpoint, body, query, priority=priority))
 
-        if self.auth_token is None:
-            log.trace("No auth token found, requesting initial login.")
-            await self._login()
-        headers = {"Authorization": f"Bearer {self.auth_token}", "Accept": "application/json"}
+    async def request_raw(
+        self,
+        method: Literal["GET", "POST"],
+        endpoint: str,
+        body: JSON_DATA = None,
+        query: dict[str, str] | None = None,
+        *,
+        priority: RateLimitPriority = RateLimitPriority.INTERACTIVE,
+    ) -> bytes:
+        """Make an authorized request to the TVDB API, returning the raw JSON response.
+
+        If the bot-wide TVDB rate-limit is reached, this will wait until the request can be made.
+
+        If the API rejects the auth token, the request is retried once, with a newly obtained token.
+        The requests failing due to an upstream issue are retried too (see :meth:`_retry_delay`), and
+        the slow GET requests are hedged (see :meth:`_send_attempt`). Each endpoint has its own circuit
+        breaker, so once the API keeps failing, its requests are rejected right away for a while.
+
+        :param priority: Priority of this request, used to determine the order of the waiting requests.
+        :raises RateLimitExceededError: If the request had to wait for the rate-limit for too long.
+        :raises TokenRejectedError: If the API rejected even the newly obtained auth token.
+        :raises NotFoundError: If the requested record doesn't exist.
+        :raises CircuitOpenError: If the circuit breaker of the endpoint is open.
+        """
+        log.trace(f"Making TVDB {method} request to {endpoint}")
 
         url = self.BASE_URL / endpoint.removeprefix("/")
         if method == "GET" and query:
             url = url.with_query(query)
+
+        breaker = self._circuit_breaker(endpoint)
+        token_rejected = False
+        attempt = 0
+        while True:
+            try:
+                with breaker.attempt():
+                    await self.rate_limiter.acquire(priority)
+                    token = await self.token_manager.get_token()
+                    try:
+                        return await self._send_attempt(method, url, body, token)
+                    except TokenRejectedError:
+                        if token_rejected:
+                            raise
+                        log.debug("TVDB API token was rejected, requesting new token.")
+                        self.token_manager.invalidate(token)
+                        token_rejected = True
+            except Exception as exc:  # noqa: BLE001
+                delay = self._retry_delay(method, exc, attempt)
+                if delay is None:
+                    if _is_upstream_failure(exc):
+                        self.retry_stats.gave_up += 1
+                    raise
+                self.retry_stats.retried += 1
+                log.debug(f"TVDB {method} request to {endpoint} failed ({exc!r}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def _circuit_breaker(self, endpoint: str) -> CircuitBreaker:
+        """Get the circuit breaker of the endpoint, shared by all of the paths with the same first segment."""
+        name = endpoint.removeprefix("/").split("/", 1)[0]
+        breaker = self.circuit_breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                f"tvdb/{name}",
+                failure_threshold=TVDB_CIRCUIT_FAILURE_THRESHOLD,
+                reset_timeout=TVDB_CIRCUIT_RESET_TIMEOUT,
+                is_failure=_is_upstream_failure,
+            )
+            self.circuit_breakers[name] = breaker
+        return breaker
+
+    @staticmethod
+    def _retry_delay(method: str, exc: Exception, attempt: int) -> float | None:
+        """Get the delay in seconds before retrying a failed request, or ``None`` if it shouldn't be retried.
+
+        Only the failures caused by an upstream issue are retried (with a jittered exponential backoff), up to
+        `TVDB_RETRY_ATTEMPTS` times. Other than the 429 responses, these are only retried for GET requests.
+
+        :param attempt: The number of the failed attempt, starting from 0.
+        """
+        if attempt >= TVDB_RETRY_ATTEMPTS or not _is_upstream_failure(exc):
+            return None
+        rate_limited = isinstance(exc, aiohttp.ClientResponseError) and exc.status == 429
+        if method != "GET" and not rate_limited:
+            return None
+
+        delay = backoff_delay(attempt, base=TVDB_RETRY_BASE_DELAY, cap=TVDB_RETRY_MAX_DELAY)
+        if isinstance(exc, aiohttp.ClientResponseError) and exc.headers and "Retry-After" in exc.headers:
+            try:
+                retry_after = float(exc.headers["Retry-After"])
+            except ValueError:
+                return delay
+            # Retrying sooner than requested would only get rejected again
+            return retry_after if retry_after <= TVDB_RETRY_MAX_DELAY else None
+        return delay
+
+    async def _send_attempt(self, method: str, url: URL, body: JSON_DATA, token: str) -> bytes:
+        """Send a single attempt of the request, within the `TVDB_REQUEST_TIMEOUT`.
+
+        The GET requests which don't finish within `TVDB_HEDGE_DELAY` are hedged: a second copy of the
+        request is sent alongside them, with whichever response arrives first being used (see :class:`Hedger`).
+        """
+        async with asyncio.timeout(TVDB_REQUEST_TIMEOUT or None):
+            if method != "GET" or not self.hedger.delay:
+                return await self._send(method, url, body, token)
+
+            async def _hedge() -> bytes:
+                # The hedge is an extra request, so it gives way to all of the others
+                await self.rate_limiter.acquire(RateLimitPriority.BACKGROUND)
+                return await self._send(method, url, body, token)
+
+            return await self.hedger.run(lambda: self._send(method, url, body, token), _hedge)
+
+    async def _send(self, method: str, url: URL, body: JSON_DATA, token: str) -> bytes:
+        """Send a single request to the TVDB API, authorized with given token."""
+        headers = {"Authorization": f"Bearer {token}", "Accept": "application/json"}
         async with self.http_session.request(method, url, headers=headers, json=body) as response:
             if response.status == 401:
-                log.debug("TVDB API token expired, requesting new token.")
-                self.auth_token = None
-                # TODO: might be an infinite loop
-                return await self.request(method, endpoint, body)  # pyright: ignore[reportCallIssue,reportArgumentType]
+                raise TokenRejectedError(response)
+            if response.status == 404:
+                raise NotFoundError(url.path)
             response.raise_for_status()
-            return await response.json()
+            return await response.read()
+
+    async def cached_request(
+        self,
+        endpoint: str,
+        *,
+        cache_key: str,
+        namespace: str,
+        query: dict[str, str] | None = None,
+        priority: RateLimitPriority = RateLimitPriority.INTERACTIVE,
+    ) -> JSON_DATA:
+        """Make a GET request to the TVDB API, going through the cache.
+
+        Concurrent cache misses for the same key are coalesced into a single request, with
+        all of the callers sharing its response. This means that only that one request will
+        count against the TVDB rate-limit.
+
+        Cached responses older than the soft TTL are still returned right away, but they're
+        refreshed in the background (see :meth:`_schedule_refresh`).
+
+        :raises NotFoundError: If the requested record doesn't exist (remembered, see :meth:`_remember_missing`).
+        """
+        cached = await self._cached_request(
+            endpoint, cache_key=cache_key, namespace=namespace, query=query, priority=priority
+        )
+        return json_codec.decode(cached.response)
+
+    async def _cached_request(
+        self,
+        endpoint: str,
+        *,
+        cache_key: str,
+        namespace: str,
+        query: dict[str, str] | None,
+        priority: RateLimitPriority,
+    ) -> CachedResponse:
+        """Same as :meth:`cached_request`, but also returning the time the response was fetched at."""
+        key = f"{namespace}:{cache_key}"
+
+        async def _fetch(priority: RateLimitPriority) -> CachedResponse:
+            with self._remember_missing(key):
+                response = await self.request_raw("GET", endpoint, query=query, priority=priority)
+            cached = CachedResponse(response, fetched_at=time.time())
+            await self.cache.set(key=cache_key, value=cached, ttl=TVDB_CACHE_HARD_TTL, namespace=namespace)
+            log.trace(f"Stored into cache: {cache_key}")
+            return cached
+
+        cached = await self.cache.get(cache_key, namespace=namespace)
+        if isinstance(cached, CachedResponse):
+            self._record_hit(key, cached, lambda: _fetch(RateLimitPriority.BACKGROUND))
+            return cached
+
+        if self._known_missing(key):
+            raise NotFoundError(endpoint)
+        return await self._coalesced_fetch(key, lambda: _fetch(priority))
+
+    @contextmanager
+    def _remember_missing(self, key: str) -> Iterator[None]:
+        """Store the key into the negative cache, if the request made within this context finds the record missing."""
+        try:
+            yield
+        except NotFoundError:
+            self.negative_cache.set(key, time.time(), ttl=TVDB_NEGATIVE_CACHE_TTL)
+            log.trace(f"Stored into negative cache: {key}")
+            raise
+
+    def _known_missing(self, key: str) -> bool:
+        """Check whether the key is in the negative cache (the record is missing, or the search had no results)."""
+        if self.negative_cache.get(key) is None:
+            return False
+        self.cache_stats.negative_hits += 1
+        log.trace(f"Loaded from negative cache: {key}")
+        return True
+
+    async def _coalesced_fetch(self, key: str, fetch: Callable[[], Awaitable[CachedResponse]]) -> CachedResponse:
+        """Run the `fetch` call, unless one for the same key is already in-flight, in which case join it.
+
+        The `fetch` call should store its response into the cache before returning, so that there's no
+        window in which a new caller would neither see the cached value, nor join the in-flight call.
+        """
+        response, shared = await self._inflight.do(key, fetch)
+        if shared:
+            self.cache_stats.coalesced += 1
+            log.trace(f"Coalesced with an in-flight request: {key}")
+        else:
+            self.cache_stats.misses += 1
+        return response
+
+    def _record_hit(self, key: str, cached: CachedResponse, refresh: Callable[[], Awaitable[CachedResponse]]) -> None:
+        """Account for a response served from the cache, scheduling its refresh if it's stale."""
+        if not cached.stale:
+            self.cache_stats.hits += 1
+            log.trace(f"Loaded from cache: {key}")
+            return
+
+        self.cache_stats.stale_hits += 1
+        log.trace(f"Loaded stale response from cache: {key} (age: {cached.age:.0f}s)")
+        self._schedule_refresh(key, refresh)
+
+    @property
+    def refresh_queue_depth(self) -> int:
+        """Amount of the background refreshes that are currently pending."""
+        return len(self._refreshes)
+
+    def stats_summary(self) -> list[str]:
+        """Get a human readable summary of the metrics collected by this client, one line per component."""
+        cache, refresh, retry = self.cache_stats, self.refresh_stats, self.retry_stats
+        connections, queue, hedge = self.connection_stats, self.rate_limiter.stats, self.hedger.stats
+        lines = [
+            f"cache: {cache.saved} saved of {cache.saved + cache.misses} requests (model {cache.model_hits}, "
+            f"fresh {cache.hits}, stale {cache.stale_hits}, coalesced {cache.coalesced}, local {cache.local_hits}, "
+            f"negative {cache.negative_hits}, misses {cache.misses})",
+            f"refreshes: {refresh.scheduled} scheduled, {refresh.deduplicated} deduplicated, "
+            f"{refresh.completed} completed, {refresh.failed} failed, {self.refresh_queue_depth} pending",
+            f"retries: {retry.retried} retried, {retry.gave_up} gave up",
+            f"connections: {connections.created} created, {connections.reused} reused "
+            f"({connections.reuse_ratio:.0%}), {connections.queued} queued",
+            f"rate-limit: {queue.admitted} admitted, {queue.waited} waited "
+            f"(mean {queue.avg_wait_time * 1000:.0f}ms, max {queue.max_wait_time * 1000:.0f}ms), "
+            f"{queue.rejected} rejected, {self.rate_limiter.queue_depth} queued (max {queue.max_queue_depth})",
+            f"hedging: {hedge.sent} sent, {hedge.won} won, {hedge.skipped} skipped",
+        ]
+        lines.extend(
+            f"circuit {name}: {breaker.state.value}, opened {breaker.stats.opened} times, "
+            f"{breaker.stats.rejected} rejected"
+            for name, breaker in self.circuit_breakers.items()
+        )
+        return lines
+
+    def _schedule_refresh(self, key: str, refresh: Callable[[], Awaitable[CachedResponse]]) -> None:
+        """Refresh a stale cached response in the background.
+
+        The refreshes are deduplicated, both against each other and against the regular fetches for
+        the same key. They go through the rate-limit with background priority, so they will always
+        give way to the interactive requests.
+        """
+        if key in self._refreshes or key in self._inflight:
+            self.refresh_stats.deduplicated += 1
+            return
+
+        async def _refresh() -> None:
+            try:
+                await self._inflight.do(key, refresh)
+            except Exception as exc:  # noqa: BLE001
+                self.refresh_stats.failed += 1
+                log.debug(f"Failed to refresh stale cached response {key}: {exc!r}")
+            else:
+                self.refresh_stats.completed += 1
+                log.trace(f"Refreshed stale cached response: {key}")
+
+        self.refresh_stats.scheduled += 1
+        task = asyncio.create_task(_refresh())
+        self._refreshes[key] = task
+        task.add_done_callback(lambda _: self._refreshes.pop(key, None))
+
+    def _parse_model[T: BaseModel](
+        self,
+        model: type[T],
+        cached: CachedResponse,
+        *,
+        cache_key: str,
+        namespace: str,
+    ) -> T:
+        """Validate the cached API response into given model.
+
+        The result is stored in the model cache until the response becomes stale (stale responses
+        are validated on each use, until they're refreshed).
+        """
+        parsed = json_codec.validate(model, cached.response)
+        fresh_for = TVDB_CACHE_SOFT_TTL - cached.age
+        if fresh_for > 0:
+            self.model_cache.set((namespace, cache_key), parsed, ttl=fresh_for)
+        return parsed
+
+    async def cached_model[T: BaseModel](
+        self,
+        model: type[T],
+        endpoint: str,
+        *,
+        cache_key: str,
+        namespace: str,
+        query: dict[str, str] | None = None,
+        priority: RateLimitPriority = RateLimitPriority.INTERACTIVE,
+    ) -> T:
+        """Make a GET request to the TVDB API through the cache, validating the response into given model.
+
+        On top of the (shared) response cache, the validated models are kept in an in-process LRU
+        cache, so that a warm hit doesn't need to go through the (expensive) pydantic validation again.
+
+        See :meth:`cached_request` for the description of the other parameters.
+        """
+        parsed = self.model_cache.get((namespace, cache_key))
+        if isinstance(parsed, model):
+            self.cache_stats.model_hits += 1
+            log.trace(f"Loaded from model cache: {cache_key}")
+            return parsed
+
+        cached = await self._cached_request(
+            endpoint, cache_key=cache_key, namespace=namespace, query=query, priority=priority
+        )
+
+        # Another caller (sharing the same in-flight request) might've already validated it
+        parsed = self.model_cache.get((namespace, cache_key))
+        if isinstance(parsed, model):
+            return parsed
+        return self._parse_model(model, cached, cache_key=cache_key, namespace=namespace)
+
+    @staticmethod
+    def _media_cache_keys(media_id: int, variant: MediaVariant) -> list[str]:
+        """Get the keys of the cached responses that could satisfy a request for given variant.
+
+        The base responses are stored under the plain media ID, while all of the extended ones
+        are merged into a single :class:`CachedMediaRecord`, stored under a separate key.
+        """
+        if variant.extended:
+            return [f"{media_id}_extended"]
+        return [f"{media_id}", f"{media_id}_extended"]
+
+    @staticmethod
+    def _resolve_media_response(variant: MediaVariant, cached: Sequence[Any]) -> CachedResponse | None:
+        """Pick the response satisfying given variant out of the values cached under :meth:`_media_cache_keys`."""
+        for value in cached:
+            if isinstance(value, CachedMediaRecord):
+                if value.variant.covers(variant):
+                    return value.for_variant(variant)
+            elif isinstance(value, CachedResponse):
+                return value
+        return None
+
+    async def _store_media_response(
+        self,
+        namespace: str,
+        media_id: int,
+        variant: MediaVariant,
+        response: bytes,
+    ) -> CachedResponse:
+        """Store the response into the cache, merging extended responses into the already cached record."""
+        if not variant.extended:
+            cached = CachedResponse(response, fetched_at=time.time())
+            await self.cache.set(key=f"{media_id}", value=cached, ttl=TVDB_CACHE_HARD_TTL, namespace=namespace)
+            return cached
+
+        cache_key = f"{media_id}_extended"
+        record = CachedMediaRecord(response, fetched_at=time.time(), variant=variant, parts_fetched_at={})
+        cached = await self.cache.get(cache_key, namespace=namespace)
+        if isinstance(cached, CachedMediaRecord):
+            record = cached.merge(record)
+        await self.cache.set(key=cache_key, value=record, ttl=TVDB_CACHE_HARD_TTL, namespace=namespace)
+        log.trace(f"Stored into cache: {cache_key} ({record.variant})")
+        return record
+
+    async def cached_media_response(
+        self,
+        kind: type["_Media"],
+        media_id: int,
+        variant: MediaVariant,
+        *,
+        cached: Sequence[Any] | None = None,
+        priority: RateLimitPriority = RateLimitPriority.INTERACTIVE,
+    ) -> MediaResponse:
+        """Get the (validated) response for given variant of a movie or series, going through the caches.
+
+        A cached response of a richer variant (see :meth:`MediaVariant.covers`) is used to satisfy
+        the requests for the cheaper ones, e.g. an already cached extended series is also used for
+        base fetches of that series. The responses validated this way are then kept in the model
+        cache, under the exact requested variant.
+
+        :param cached:
+            The values already loaded from the cache under :meth:`_media_cache_keys`.
+            If not passed, they're loaded here.
+        :param priority: Rate-limit priority of the request, if it has to be sent to the API.
+        :raises NotFoundError: If the media doesn't exist (remembered, see :meth:`_remember_missing`).
+        """
+        namespace = kind.cache_namespace()
+        cache_key = variant.cache_key(media_id)
+        response_type = kind._response_type(extended=variant.extended)  # pyright: ignore[reportPrivateUsage]
+
+        parsed = self.model_cache.get((namespace, cache_key))
+        if isinstance(parsed, response_type):
+            self.cache_stats.model_hits += 1
+            log.trace(f"Loaded from model cache: {cache_key}")
+            return parsed
+
+        endpoint = f"{kind.ENDPOINT}/{media_id}" + ("/extended" if variant.extended else "")
+
+        # A missing movie or series is missing in all of the variants
+        missing_key = f"{namespace}:{media_id}"
+
+        async def _fetch(priority: RateLimitPriority) -> CachedResponse:
+            with self._remember_missing(missing_key):
+                response = await self.request_raw("GET", endpoint, query=variant.query(), priority=priority)
+            return await self._store_media_response(namespace, media_id, variant, response)
+
+        key = f"{namespace}:{cache_key}"
+        if cached is None:
+            cached = await self.cache.multi_get(self._media_cache_keys(media_id, variant), namespace=namespace)
+        response = self._resolve_media_response(variant, cached)
+
+        if response is not None:
+            self._record_hit(key, response, lambda: _fetch(RateLimitPriority.BACKGROUND))
+        elif self._known_missing(missing_key):
+            raise NotFoundError(endpoint)
+        else:
+            response = await self._coalesced_fetch(key, lambda: _fetch(priority))
+
+        parsed = self._parse_model(response_type, response, cache_key=cache_key, namespace=namespace)
+        if parsed.data is not None:
+            self._index_titles(kind.SEARCH_TYPE, parsed.data)
+        return parsed
+
+    def _index_titles(self, kind: str, data: AnyRecord | SearchResult) -> None:
+        """Add the titles of the movie or series to the title completions, and to the title index (if there's one).
+
+        The title index is updated in the background, unless it was already given the same entry. The failures
+        are only logged, the media will simply be missing from the index until it's fetched again.
+        """
+        titles, record = _title_index_entry(data)
+        self.title_completions.update(title for title in titles if title)
+        if self.title_index is None:
+            return
+        title_index = self.title_index
+        media_id = parse_media_id(data.id)
+
+        # The search results and the fetched records hold different fields, so they're tracked separately
+        entry_key = (kind, media_id, type(data).__name__)
+        entry_hash = hash((*titles, json_codec.encode(record)))
+        if self._indexed_entries.get(entry_key) == entry_hash:
+            return
+        self._indexed_entries.set(entry_key, entry_hash)
+
+        async def _index() -> None:
+            try:
+                await title_index.add(kind, media_id, titles, record)
+            except Exception:
+                self._indexed_entries.pop(entry_key)
+                log.exception(f"Failed to add {kind} {media_id} to the title index")
+
+        task = asyncio.create_task(_index())
+        self._index_tasks.add(task)
+        task.add_done_callback(self._index_tasks.discard)
+
+    async def load_title_completions(self) -> int:
+        """Fill the title completions with the titles of the most recently indexed movies and series.
+
+        The completions are built in a separate thread, so that a large index doesn't block the bot.
+
+        :return: The amount of the loaded titles.
+        """
+        if self.title_index is None:
+            return 0
+        records = await self.title_index.recent_records(TVDB_AUTOCOMPLETE_SIZE)
+
+        def _build() -> PrefixIndex:
+            # From the least recent one, so that the most recent titles are the last to be evicted
+            results = [json_codec.validate(SearchResult, record) for record in reversed(records)]
+            completions = PrefixIndex(TVDB_AUTOCOMPLETE_SIZE, normalize=normalize_title)
+            completions.update(title for result in results for title in _title_index_entry(result)[0] if title)
+            return completions
+
+        completions = await asyncio.to_thread(_build)
+        # Keep the titles that were added in the meantime
+        completions.update(self.title_completions)
+        self.title_completions = completions
+        return len(completions)
+
+    def complete_title(self, prefix: str, limit: int = 25) -> list[str]:
+        """Get up to `limit` titles of the already seen movies and series, with a word starting with the prefix.
+
+        This only looks at the in-memory title completions, it never makes any requests.
+        """
+        return self.title_completions.complete(prefix, limit)
+
+    async def invalidate(self, kind: type["_Media"], media_ids: Iterable[int], *, evict: bool = False) -> None:
+        """Invalidate all of the cached responses for given movies or series.
+
+        By default, the cached responses are only marked as stale, so if they're needed again, they'll
+        still be served right away, while getting refreshed in the background.
+
+        :param evict: Remove the cached responses completely, instead of marking them as stale.
+        """
+        media_ids = set(media_ids)
+        if not media_ids:
+            return
+        namespace = kind.cache_namespace()
+        for media_id in media_ids:
+            self.negative_cache.pop(f"{namespace}:{media_id}")
+        # The model cache keys start with the media ID (see MediaVariant.cache_key)
+        prefixes = {f"{media_id}" for media_id in media_ids}
+        self.model_cache.discard_where(lambda key: key[0] == namespace and key[1].split("_", 1)[0] in prefixes)
+        keys = [key for media_id in media_ids for key in self._media_cache_keys(media_id, MediaVariant())]
+        await self._invalidate_keys(namespace, keys, evict=evict)
+        if evict and self.title_index is not None:
+            self._indexed_entries.discard_where(lambda key: key[0] == kind.SEARCH_TYPE and key[1] in media_ids)
+            await self.title_index.remove_many(kind.SEARCH_TYPE, media_ids)
+
+    async def invalidate_episode_lists(self, series_ids: Iterable[int], *, evict: bool = False) -> None:
+        """Invalidate the cached episode lists (see :meth:`Series.fetch_episodes`) of given series.
+
+        This includes the translated episode lists (see :meth:`Series.fetch_english_episodes`).
+        See :meth:`invalidate` for the description of the `evict` parameter.
+        """
+        series_ids = set(series_ids)
+        if not series_ids:
+            return
+        prefixes = {f"{series_id}" for series_id in series_ids}
+        self.model_cache.discard_where(lambda key: key[0] == "tvdb_episodes" and key[1].split("_", 1)[0] in prefixes)
+
+        # Each page is cached separately, go through the pages of each list until one isn't cached,
+        # looking up the same page of all of the lists at once
+        page = 0
+        lists = [f"{series_id}_{season_type}" for series_id in series_ids for season_type in SEASON_TYPES]
+        lists += [f"{prefix}_{language}" for prefix in lists for language in EPISODE_LANGUAGES]
+        while lists:
+            keys = [f"{prefix}_{page}" for prefix in lists]
+            found = await self._invalidate_keys("tvdb_episodes", keys, evict=evict)
+            lists = [prefix for prefix, key in zip(lists, keys, strict=True) if key in found]
+            page += 1
+
+    async def invalidate_episodes(self, episode_ids: Iterable[int], *, evict: bool = False) -> None:
+        """Invalidate the cached responses of given episodes (see :meth:`Episode.fetch`).
+
+        See :meth:`invalidate` for the description of the `evict` parameter.
+        """
+        keys = {key for episode_id in episode_ids for key in (f"{episode_id}", f"{episode_id}_extended")}
+        if not keys:
+            return
+        for key in keys:
+            self.negative_cache.pop(f"{Episode.CACHE_NAMESPACE}:{key}")
+        self.model_cache.discard_where(lambda key: key[0] == Episode.CACHE_NAMESPACE and key[1] in keys)
+        await self._invalidate_keys(Episode.CACHE_NAMESPACE, list(keys), evict=evict)
+
+    async def _invalidate_keys(self, namespace: str, keys: list[str], *, evict: bool) -> set[str]:
+        """Invalidate the cached responses under given keys, returning the keys that were cached.
+
+        All of the keys are looked up at once, only the cached ones are then updated (or deleted).
+        """
+        cached = await self.cache.multi_get(keys, namespace=namespace)
+        found = [(key, value) for key, value in zip(keys, cached, strict=True) if isinstance(value, CachedResponse)]
+        if not found:
+            return set()
+
+        if evict:
+            # The cache backends can only delete a single key at a time
+            await asyncio.gather(*(self.cache.delete(key, namespace=namespace) for key, _ in found))
+        else:
+            stale = [(key, replace(value, fetched_at=0)) for key, value in found]
+            await self.cache.multi_set(stale, ttl=TVDB_CACHE_HARD_TTL, namespace=namespace)
+        return {key for key, _ in found}
+
+    async def fetch_many[M: _Media](
+        self,
+        kind: type[M],
+        media_ids: Iterable[int | str],
+        *,
+        extended: bool = False,
+        short: bool | None = None,
+        meta: FetchMeta | None = None,
+        concurrency: int = 10,
+    ) -> list[M | Exception]:
+        """Fetch multiple movies or series concurrently.
+
+        All of the items are first looked up in the cache at once, the remaining ones are then
+        fetched from the API, with at most `concurrency` requests running at the same time. All
+        of these requests still go through the TVDB rate-limit.
+
+        See :meth:`_Media.fetch` for the description of the `extended`, `short` and `meta` parameters.
+
+        :param kind: The kind of media to fetch (`Movie` or `Series`).
+        :param media_ids: The IDs of the media to fetch.
+        :param concurrency: Maximum number of requests to the TVDB API made at the same time.
+        :return:
+            The fetched media, in the same order as `media_ids`. If fetching an item fails,
+            the exception is placed at its position instead, without affecting the other items.
+        """
+        namespace = kind.cache_namespace()
+        variant = MediaVariant.from_fetch_args(extended=extended, short=short, meta=meta)
+        media_ids = list(media_ids)
+        results: list[M | Exception | None] = [None] * len(media_ids)
+
+        # Go through the already validated responses first, only look up the rest in the cache
+        response_type = kind._response_type(extended=extended)  # pyright: ignore[reportPrivateUsage]
+        uncached: list[tuple[int, int]] = []
+        for index, media_id in enumerate(media_ids):
+            try:
+                parsed_id = parse_media_id(media_id)
+            except TVDBError as exc:
+                results[index] = exc
+                continue
+
+            parsed = self.model_cache.get((namespace, variant.cache_key(parsed_id)))
+            if isinstance(parsed, response_type):
+                self.cache_stats.model_hits += 1
+                results[index] = kind(self, parsed.data)
+            else:
+                uncached.append((index, parsed_id))
+
+        keys_per_item = len(self._media_cache_keys(0, variant))
+        cache_keys = [key for _, media_id in uncached for key in self._media_cache_keys(media_id, variant)]
+        cached = await self.cache.multi_get(cache_keys, namespace=namespace) if cache_keys else []
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _fetch_one(index: int, media_id: int, cached: Sequence[Any]) -> None:
+            try:
+                response = await self.cached_media_response(kind, media_id, variant, cached=cached)
+                results[index] = kind(self, response.data)
+            except Exception as exc:  # noqa: BLE001
+                log.debug(f"Failed to fetch {kind.__name__} ({variant.cache_key(media_id)}): {exc!r}")
+                results[index] = exc
+
+        async def _fetch_one_limited(index: int, media_id: int, cached: Sequence[Any]) -> None:
+            async with semaphore:
+                await _fetch_one(index, media_id, cached)
+
+        tasks: list[Awaitable[None]] = []
+        for position, (index, media_id) in enumerate(uncached):
+            item_cached = cached[position * keys_per_item : (position + 1) * keys_per_item]
+            if self._resolve_media_response(variant, item_cached) is None:
+                tasks.append(_fetch_one_limited(index, media_id, item_cached))
+            else:
+                # Satisfied by the already loaded cache entries, this won't reach the API
+                await _fetch_one(index, media_id, item_cached)
+
+        if tasks:
+            log.trace(f"Fetching {len(tasks)}/{len(results)} {kind.__name__} items from TVDB")
+            await asyncio.gather(*tasks)
+
+        return cast(list[M | Exception], results)
 
     async def search(
         self, search_query: str, entity_type: Literal["series", "movie", None] = None, limit: int = 1
     ) -> list[Movie | Series]:
-        """Search for a series or movie in the TVDB database."""
-        cache_key: str = f"{search_query}_{entity_type}_{limit}"
-        data = await self.cache.get(cache_key, namespace="tvdb_search")
-        if not data:
-            query: dict[str, str] = {"query": search_query, "limit": str(limit)}
+        """Search for a series or movie in the TVDB database.
+
+        If the client has a title index, the search is answered from it, as long as it has `limit` matches
+        scoring at least `TVDB_LOCAL_SEARCH_MIN_SCORE`. Otherwise, the TVDB API is searched (and its results
+        are added to the index), with the exact local matches ranked first, and the other strong local matches
+        only filling in the results that the API didn't return.
+
+        The query is canonicalized (see :func:`canonical_search_query`) before being sent to the API.
+        """
+        local: list[SearchResult] = []
+        exact: list[SearchResult] = []
+        if self.title_index is not None:
+            matches = await self._local_search(self.title_index, search_query, entity_type, limit)
+            local = [json_codec.validate(SearchResult, match.record) for match in matches]
+            if len(matches) >= limit:
+                self.cache_stats.local_hits += 1
+                log.trace(f"Answered search from the title index: {search_query!r}")
+                return [self._search_result_media(result) for result in local]
+            exact = [result for result, match in zip(local, matches, strict=True) if match.score == 1]
+
+        response = await self._cached_search(canonical_search_query(search_query), entity_type, limit)
+        api_results = [result for result in response.data or [] if result.type in {"movie", "series"}][:limit]
+        for result in api_results:
+            self._index_titles(cast(Literal["movie", "series"], result.type), result)
+
+        results: list[SearchResult] = []
+        found: set[tuple[str | None, str | None]] = set()
+        for result in [*exact, *api_results, *local]:
+            if (result.type, result.tvdb_id) not in found:
+                found.add((result.type, result.tvdb_id))
+                results.append(result)
+        return [self._search_result_media(result) for result in results[:limit]]
+
+    def _search_result_media(self, result: SearchResult) -> "Movie | Series":
+        """Get the (not yet fetched) movie or series of the search result."""
+        return Movie(self, result) if result.type == "movie" else Series(self, result)
+
+    async def _cached_search(
+        self,
+        search_query: str,
+        entity_type: Literal["series", "movie", None],
+        limit: int,
+    ) -> SearchGetResponse:
+        """Search the TVDB API through the caches.
+
+        The responses are cached per query and entity type, with the smaller limits being answered from the
+        responses fetched with larger ones (see :class:`CachedSearchResponse`). So the returned response can
+        hold more than `limit` results.
+
+        The searches without any results are only kept in the (short-lived) negative cache, as new movies and
+        series can start matching them at any time.
+        """
+        namespace = "tvdb_search"
+        cache_key = f"{search_query}_{entity_type}"
+
+        parsed = self.model_cache.get((namespace, cache_key))
+        if isinstance(parsed, SearchGetResponse) and len(parsed.data or []) >= limit:
+            self.cache_stats.model_hits += 1
+            log.trace(f"Loaded from model cache: {cache_key}")
+            return parsed
+
+        key = f"{namespace}:{cache_key}"
+
+        async def _fetch(fetch_limit: int, priority: RateLimitPriority) -> CachedResponse:
+            query = {"query": search_query, "limit": str(fetch_limit)}
             if entity_type:
                 query["type"] = entity_type
-            data = await self.request("GET", "search", query=query)
-            await self.cache.set(key=cache_key, value=data, ttl=60 * 60, namespace="tvdb_search")
-            log.trace(f"Stored into cache: {cache_key}")
+            response = await self.request_raw("GET", "search", query=query, priority=priority)
+            decoded = json_codec.decode(response)
+            results = decoded.get("data") if isinstance(decoded, dict) else None
+            cached = CachedSearchResponse(
+                response,
+                fetched_at=time.time(),
+                limit=fetch_limit,
+                results=len(results) if isinstance(results, list) else 0,
+            )
+            if not cached.results:
+                self.negative_cache.set(key, time.time(), ttl=TVDB_NEGATIVE_CACHE_TTL)
+                log.trace(f"Stored into negative cache: {key}")
+                return cached
+
+            # Don't replace a fresh response with more results, which was fetched in the meantime
+            current = await self.cache.get(cache_key, namespace=namespace)
+            if isinstance(current, CachedSearchResponse) and current.limit > fetch_limit and not current.stale:
+                return cached
+            await self.cache.set(key=cache_key, value=cached, ttl=TVDB_CACHE_HARD_TTL, namespace=namespace)
+            log.trace(f"Stored into cache: {cache_key} (limit {fetch_limit})")
+            return cached
+
+        cached = await self.cache.get(cache_key, namespace=namespace)
+        if isinstance(cached, CachedSearchResponse) and cached.covers(limit):
+            cached_limit = cached.limit
+            self._record_hit(
+                f"{key}_{cached_limit}", cached, lambda: _fetch(cached_limit, RateLimitPriority.BACKGROUND)
+            )
+            response = cached
+        elif self._known_missing(key):
+            return SearchGetResponse(data=[])
         else:
-            log.trace(f"Loaded from cache: {cache_key}")
-        response = SearchGetResponse(**data)  # pyright: ignore[reportCallIssue]
-        returnable: list[Movie | Series] = []
-        if not response.data:
-            return returnable
-        for result in response.data:
-            match result.type:
-                case "movie":
-                    returnable.append(Movie(self, result))
-                case "series":
-                    returnable.append(Series(self, result))
-                case _:
-                    pass
-        return returnable
-
-    async def _login(self) -> None:
-        """Obtain the auth token from the TVDB API.
-
-        This token has one month of validity.
-        """
-        log.debug("Requesting TVDB API login")
-        url = self.BASE_URL / "login"
-        async with self.http_session.post(url, json={"apikey": TVDB_API_KEY}) as response:
-            if response.status == 401:
-                log.error("Invalid TVDB API key, login request failed.")
-                response_txt = await response.text()
-                raise InvalidApiKeyError(response, response_txt)
-
-            response.raise_for_status()
-            data = await response.json()
-            self.auth_token = data["data"]["token"]
+            try:
+                response = await self._coalesced_fetch(
+                    f"{key}_{limit}", lambda: _fetch(limit, RateLimitPriority.INTERACTIVE)
+                )
+            except CircuitOpenError:
+                if not isinstance(cached, CachedSearchResponse):
+                    raise
+                # Fewer results are still better than none, while the API is failing
+                log.debug(f"Serving a search with fewer results ({cached.limit}), as the API is failing: {key}")
+                response = cached
+        return self._parse_model(SearchGetResponse, response, cache_key=cache_key, namespace=namespace)
+
+    async def _local_search(
+        self,
+        title_index: TitleIndex,
+        search_query: str,
+        entity_type: Literal["series", "movie", None],
+        limit: int,
+    ) -> list[TitleMatch]:
+        """Search the title index, returning only the matches scoring at least `TVDB_LOCAL_SEARCH_MIN_SCORE`.
+
+        The failures are only logged (the TVDB API gets searched instead).
+        """
+        try:
+            matches = await title_index.search(search_query, kind=entity_type, limit=limit)
+        except Exception:
+            log.exception(f"Failed to search the title index for {search_query!r}")
+            return []
+        return [match for match in matches if match.score >= TVDB_LOCAL_SEARCH_MIN_SCORE]
@@ -0,0 +1,114 @@
+"""Compact table of the episodes of a series.
+
+Long running series can have thousands of episodes, most of which are never displayed. Rather than
+wrapping each one of them in an :class:`~src.tvdb.client.Episode`, the columns needed to navigate
+the episodes are kept in flat arrays, and the wrappers are only created for the displayed episodes.
+The index doesn't hold the records themselves, only their positions in the list it was built from.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from datetime import UTC, date, datetime
+
+from src.tvdb.generated_models import EpisodeBaseRecord
+
+__all__ = ["EpisodeIndex", "format_episode_name"]
+
+UNKNOWN = 0
+"""Value used in the id and air date columns for the episodes where these aren't known."""
+
+
+def format_episode_name(season_number: int | None, number: int | None, name: str | None) -> str:
+    """Format the episode name as SxxEyy - Name."""
+    return f"S{season_number:02}E{number:02} - {name}"
+
+
+def _air_date_ordinal(aired: str | None) -> int:
+    if not aired:
+        return UNKNOWN
+    try:
+        return date.fromisoformat(aired).toordinal()
+    except ValueError:
+        return UNKNOWN
+
+
+class EpisodeIndex:
+    """Array-backed table of the episodes of a series, ordered by season and episode number.
+
+    Each episode is identified by its row in the table. Besides the columns (`positions`, `ids`,
+    `seasons`, `numbers` and `air_dates`, the last holding proleptic Gregorian ordinals), the index
+    holds the row ranges of each season.
+    """
+
+    __slots__ = ("positions", "ids", "seasons", "numbers", "air_dates", "_season_rows")
+
+    def __init__(self, records: Sequence[EpisodeBaseRecord]) -> None:
+        """Initialize the episode index.
+
+        :param records: The episode records, in any order. These aren't kept, see :attr:`positions`.
+        """
+        order = sorted(range(len(records)), key=lambda i: (records[i].season_number or 0, records[i].number or 0))
+        self.positions = array("q", order)
+        """Position of the record of the episode in each row, in the sequence given to the index."""
+        self.ids = array("q", [records[i].id or UNKNOWN for i in order])
+        self.seasons = array("l", [records[i].season_number or 0 for i in order])
+        self.numbers = array("l", [records[i].number or 0 for i in order])
+        self.air_dates = array("l", [_air_date_ordinal(records[i].aired) for i in order])
+
+        self._season_rows: dict[int, range] = {}
+        start = 0
+        for row, season in enumerate(self.seasons):
+            if season != self.seasons[start]:
+                self._season_rows[self.seasons[start]] = range(start, row)
+                start = row
+        if order:
+            self._season_rows[self.seasons[start]] = range(start, len(order))
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @property
+    def season_numbers(self) -> list[int]:
+        """Numbers of all of the seasons, in order."""
+        return list(self._season_rows)
+
+    def season_rows(self, season: int) -> range:
+        """Get the rows of the episodes in given season (empty if there's no such season)."""
+        return self._season_rows.get(season, range(0))
+
+    def find(self, season: int, number: int) -> int | None:
+        """Get the row of the episode with given season and episode number, if there is one.
+
+        This is O(1) for seasons with consecutively numbered episodes (falling back to a binary search otherwise).
+        """
+        rows = self.season_rows(season)
+        if not rows:
+            return None
+
+        row = rows.start + number - self.numbers[rows.start]
+        if row not in rows or self.numbers[row] != number:
+            row = bisect_left(self.numbers, number, rows.start, rows.stop)
+        return row if row in rows and self.numbers[row] == number else None
+
+    def is_aired(self, row: int, *, today: int | None = None) -> bool:
+        """Check whether the episode in given row was already aired.
+
+        :param today: Ordinal of the current date (to avoid obtaining it repeatedly).
+        """
+        if today is None:
+            today = datetime.now(UTC).date().toordinal()
+        return self.air_dates[row] != UNKNOWN and self.air_dates[row] <= today
+
+    def aired_rows(self) -> list[int]:
+        """Get the rows of all of the already aired episodes."""
+        today = datetime.now(UTC).date().toordinal()
+        return [row for row in range(len(self)) if self.is_aired(row, today=today)]
+
+    def last_aired(self) -> int | None:
+        """Get the row of the last already aired episode, if there is one."""
+        today = datetime.now(UTC).date().toordinal()
+        for row in reversed(range(len(self))):
+            if self.is_aired(row, today=today):
+                return row
+        return None
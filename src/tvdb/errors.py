@@ -13,6 +13,14 @@ class InvalidIdError(TVDBError):
     """Exception raised when the ID provided is invalid."""
 
 
+class NotFoundError(TVDBError):
+    """Exception raised when the requested TVDB record doesn't exist (the API responded with 404)."""
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        super().__init__(f"TVDB record not found: {endpoint}")
+
+
 class InvalidApiKeyError(TVDBError):
     """Exception raised when the TVDB API key used was invalid."""
 
@@ -20,3 +28,11 @@ class InvalidApiKeyError(TVDBError):
         self.response = response
         self.response_txt = response_txt
         super().__init__("Invalid TVDB API key.")
+
+
+class TokenRejectedError(TVDBError):
+    """Exception raised when the TVDB API rejected the auth token used for the request."""
+
+    def __init__(self, response: aiohttp.ClientResponse):
+        self.response = response
+        super().__init__("TVDB API rejected the auth token.")
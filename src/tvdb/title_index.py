@@ -0,0 +1,228 @@
+"""Local full-text index of the titles of all of the movies and series that the bot has seen.
+
+Every movie and series fetched from the TVDB API (or found by its search) gets its titles (the name,
+the aliases and the translated names) stored in a SQLite FTS5 index, along with a search result like
+record of the media. This allows answering most of the searches locally, without calling the API.
+
+The titles are indexed by trigrams, so the matching is tolerant to typos: the candidates sharing the
+most trigrams with the query are picked by the FTS index, and then scored by their similarity to it.
+"""
+
+import asyncio
+import re
+import unicodedata
+from collections.abc import Iterable
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any
+
+import aiosqlite
+
+from src.utils import json_codec
+from src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+__all__ = ["TitleIndex", "TitleMatch", "normalize_title"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS media (
+    kind TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    record BLOB NOT NULL,
+    PRIMARY KEY (kind, id)
+);
+CREATE TABLE IF NOT EXISTS titles (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    media_id INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    UNIQUE (kind, media_id, title)
+);
+CREATE INDEX IF NOT EXISTS ix_titles_title ON titles (title);
+CREATE VIRTUAL TABLE IF NOT EXISTS titles_fts USING fts5(
+    title, content='titles', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS titles_after_insert AFTER INSERT ON titles BEGIN
+    INSERT INTO titles_fts (rowid, title) VALUES (new.id, new.title);
+END;
+CREATE TRIGGER IF NOT EXISTS titles_after_delete AFTER DELETE ON titles BEGIN
+    INSERT INTO titles_fts (titles_fts, rowid, title) VALUES ('delete', old.id, old.title);
+END;
+"""
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_title(title: str) -> str:
+    """Normalize the title (or query) for matching: casefolded, without accents and punctuation."""
+    decomposed = unicodedata.normalize("NFKD", title.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(_WORD_RE.findall(stripped))
+
+
+def _score(query: str, title: str) -> float:
+    """Score the similarity of the (normalized) title to the (normalized) query, between 0 and 1."""
+    if query == title:
+        return 1
+    return SequenceMatcher(None, query, title, autojunk=False).ratio()
+
+
+@dataclass(frozen=True)
+class TitleMatch:
+    """A movie or series found in the title index."""
+
+    kind: str
+    media_id: int
+    title: str
+    """The (normalized) title that matched the query the best."""
+    score: float
+    """Similarity of the title to the query, between 0 and 1 (exact match)."""
+    record: bytes
+    """The stored record of the media (see :meth:`TitleIndex.add`)."""
+
+
+class TitleIndex:
+    """Full-text index of the movie and series titles, stored in a SQLite database file."""
+
+    CANDIDATES: int = 50
+    """Maximum amount of titles picked by the FTS index, to be scored against the query."""
+    MIN_TRIGRAM_QUERY: int = 3
+    """Shorter queries don't have any trigrams, these are only matched exactly."""
+
+    def __init__(self, db_file: Path) -> None:
+        """Initialize the title index.
+
+        :param db_file: Path to the database file, it will be created if it doesn't exist yet.
+        """
+        self.db_file = db_file
+        self._db: aiosqlite.Connection | None = None
+        self._db_lock = asyncio.Lock()
+
+    async def _get_db(self) -> aiosqlite.Connection:
+        """Get the database connection, opening it (and creating the schema) on first use."""
+        if self._db is not None:
+            return self._db
+
+        async with self._db_lock:
+            if self._db is not None:
+                return self._db
+
+            log.debug(f"Opening the title index: {self.db_file}")
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            db = await aiosqlite.connect(self.db_file)
+            await db.execute("PRAGMA journal_mode = WAL")
+            await db.execute("PRAGMA synchronous = NORMAL")
+            await db.executescript(_SCHEMA)
+            await db.commit()
+
+            self._db = db
+            return db
+
+    async def close(self) -> None:
+        """Close the database connection (it's opened again on the next use)."""
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+
+    async def add(self, kind: str, media_id: int, titles: Iterable[str | None], record: dict[str, Any]) -> None:
+        """Add the titles of a movie or series to the index, along with its record.
+
+        If the media is already indexed, the new titles are added to the already known ones, and the
+        record is merged into the stored one (with the fields of the new record taking precedence).
+
+        :param kind: Kind of the media ("movie" or "series").
+        :param titles: The titles of the media (the empty ones are skipped).
+        :param record: JSON-serializable record of the media, returned with the search matches.
+        """
+        normalized = {normalize_title(title) for title in titles if title}
+        normalized.discard("")
+        if not normalized:
+            return
+
+        db = await self._get_db()
+        async with db.execute("SELECT record FROM media WHERE kind = ? AND id = ?", (kind, media_id)) as cursor:
+            row = await cursor.fetchone()
+        if row is not None:
+            stored = json_codec.decode(row[0])
+            record = stored | {key: value for key, value in record.items() if value is not None}
+
+        await db.execute(
+            "INSERT OR REPLACE INTO media (kind, id, record) VALUES (?, ?, ?)",
+            (kind, media_id, json_codec.encode(record)),
+        )
+        await db.executemany(
+            "INSERT OR IGNORE INTO titles (kind, media_id, title) VALUES (?, ?, ?)",
+            [(kind, media_id, title) for title in normalized],
+        )
+        await db.commit()
+
+    async def remove(self, kind: str, media_id: int) -> None:
+        """Remove the movie or series from the index."""
+        await self.remove_many(kind, [media_id])
+
+    async def remove_many(self, kind: str, media_ids: Iterable[int]) -> None:
+        """Remove the movies or series from the index, in a single transaction."""
+        params = [(kind, media_id) for media_id in media_ids]
+        if not params:
+            return
+        db = await self._get_db()
+        await db.executemany("DELETE FROM titles WHERE kind = ? AND media_id = ?", params)
+        await db.executemany("DELETE FROM media WHERE kind = ? AND id = ?", params)
+        await db.commit()
+
+    async def recent_records(self, limit: int) -> list[bytes]:
+        """Get the stored records of up to `limit` most recently added (or updated) movies and series."""
+        db = await self._get_db()
+        async with db.execute("SELECT record FROM media ORDER BY rowid DESC LIMIT ?", (limit,)) as cursor:
+            return [record async for (record,) in cursor]
+
+    async def search(self, query: str, *, kind: str | None = None, limit: int = 5) -> list[TitleMatch]:
+        """Search the index for the movies or series with titles similar to the query.
+
+        :param kind: Only search for this kind of media ("movie" or "series").
+        :param limit: Maximum amount of returned matches.
+        :return: The best matches (one per media), ordered by their score.
+        """
+        normalized = normalize_title(query)
+        if not normalized:
+            return []
+
+        db = await self._get_db()
+        kind_filter = " AND titles.kind = ?" if kind else ""
+        kind_params = (kind,) if kind else ()
+        if len(normalized) < self.MIN_TRIGRAM_QUERY:
+            sql = f"SELECT kind, media_id, title FROM titles WHERE title = ?{kind_filter}"  # noqa: S608
+            params: tuple[Any, ...] = (normalized, *kind_params)
+        else:
+            trigrams = {normalized[i : i + 3] for i in range(len(normalized) - 2)}
+            sql = (
+                "SELECT titles.kind, titles.media_id, titles.title FROM titles_fts"  # noqa: S608
+                " JOIN titles ON titles.id = titles_fts.rowid"
+                f" WHERE titles_fts MATCH ?{kind_filter} ORDER BY titles_fts.rank LIMIT ?"
+            )
+            # The normalized query only holds word characters and spaces, so the trigrams can be simply quoted
+            params = (" OR ".join(f'"{trigram}"' for trigram in trigrams), *kind_params, self.CANDIDATES)
+
+        best: dict[tuple[str, int], tuple[float, str]] = {}
+        async with db.execute(sql, params) as cursor:
+            async for media_kind, media_id, title in cursor:
+                score = _score(normalized, title)
+                if score > best.get((media_kind, media_id), (-1, ""))[0]:
+                    best[media_kind, media_id] = (score, title)
+
+        ranked = sorted(best.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+        if not ranked:
+            return []
+
+        placeholders = ", ".join("(?, ?)" for _ in ranked)
+        records_sql = f"SELECT kind, id, record FROM media WHERE (kind, id) IN (VALUES {placeholders})"  # noqa: S608
+        async with db.execute(records_sql, [value for key, _ in ranked for value in key]) as cursor:
+            records = {(media_kind, media_id): record async for media_kind, media_id, record in cursor}
+
+        return [
+            TitleMatch(kind=key[0], media_id=key[1], title=title, score=score, record=records[key])
+            for key, (score, title) in ranked
+            if key in records
+        ]
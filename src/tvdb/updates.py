@@ -0,0 +1,200 @@
+"""Keeping the cached TVDB data up to date, using the updates feed of the TVDB API.
+
+Rather than relying on the (short) TTLs of the cached responses alone, the feed of the records
+that changed upstream is polled periodically, invalidating only the cached responses of those
+records. This allows the unchanged responses to be cached for a lot longer.
+"""
+
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import ClassVar
+
+from src.settings import TVDB_CACHE_HARD_TTL
+from src.tvdb.client import Movie, Series, TvdbClient
+from src.tvdb.generated_models import Action, EntityUpdate, UpdatesGetResponse
+from src.utils import json_codec
+from src.utils.log import get_logger
+from src.utils.ratelimit import RateLimitPriority
+from src.utils.sqlite_cache import SQLiteCache
+
+log = get_logger(__name__)
+
+__all__ = ["UpdatesSync"]
+
+
+class _FeedTruncatedError(Exception):
+    """Raised when there are more pages of updates than what is processed in a single sync."""
+
+
+@dataclass
+class _Changes:
+    """IDs of the records that changed upstream, collected from the updates feed."""
+
+    series: set[int] = field(default_factory=set)
+    deleted_series: set[int] = field(default_factory=set)
+    movies: set[int] = field(default_factory=set)
+    deleted_movies: set[int] = field(default_factory=set)
+    episodes: set[int] = field(default_factory=set)
+    deleted_episodes: set[int] = field(default_factory=set)
+    episode_series: set[int] = field(default_factory=set)
+    """IDs of the series which had some of their episodes changed."""
+
+    def add(self, update: EntityUpdate) -> None:
+        if update.record_id is None:
+            return
+        deleted = update.method == Action.delete.value
+
+        match update.entity_type:
+            case "series" | "translatedseries":
+                (self.deleted_series if deleted else self.series).add(update.record_id)
+            case "movies" | "translatedmovies":
+                (self.deleted_movies if deleted else self.movies).add(update.record_id)
+            case "episodes" | "translatedepisodes":
+                (self.deleted_episodes if deleted else self.episodes).add(update.record_id)
+                if update.series_id is not None:
+                    self.episode_series.add(update.series_id)
+            case _:
+                pass
+
+    def __len__(self) -> int:
+        return (
+            len(self.series)
+            + len(self.deleted_series)
+            + len(self.movies)
+            + len(self.deleted_movies)
+            + len(self.episodes)
+            + len(self.deleted_episodes)
+        )
+
+
+class UpdatesSync:
+    """Invalidates the cached TVDB responses of the records that changed since the last sync.
+
+    The time up to which the feed (of each entity type) was processed is stored in the cache itself,
+    so that with a persistent cache, the changes that happened while the bot was offline are picked
+    up after a restart too.
+
+    Changed records have their cached responses marked as stale (to get refreshed in the background
+    when they're next used), deleted records have them removed from the cache completely. Changed
+    movies and series are also removed from the title index, until they're fetched again.
+
+    The cached search responses aren't invalidated, as there's no telling which searches a changed
+    record appeared in, they're only refreshed once they get stale (see `TVDB_CACHE_SOFT_TTL`).
+    """
+
+    ENTITY_TYPES: ClassVar[tuple[str, ...]] = (
+        "series",
+        "translatedseries",
+        "movies",
+        "translatedmovies",
+        "episodes",
+        "translatedepisodes",
+    )
+    """Types of the updated records that the cached responses depend on."""
+
+    CACHE_NAMESPACE: ClassVar[str] = "tvdb_updates"
+    MAX_PAGES: ClassVar[int] = 100
+    """Maximum amount of pages of a single entity type that are processed in one sync."""
+    OVERLAP: ClassVar[int] = 60
+    """Seconds by which the consecutive syncs overlap, to not miss updates due to clock differences."""
+
+    def __init__(self, client: TvdbClient) -> None:
+        self.client = client
+
+    async def _may_hold_records(self) -> bool:
+        """Check whether the cache could hold any records from before the bot was started."""
+        if isinstance(self.client.cache, SQLiteCache):
+            return not await self.client.cache.is_empty()
+        # The other (in-memory) caches start out empty
+        return False
+
+    async def _get_since(self, entity_type: str, started_at: int) -> int:
+        """Get the timestamp from which to process the updates of given entity type."""
+        synced_until = await self.client.cache.get(f"synced_until_{entity_type}", namespace=self.CACHE_NAMESPACE)
+        if isinstance(synced_until, int):
+            return synced_until - self.OVERLAP
+
+        if await self._may_hold_records():
+            # Nothing older than the hard TTL could still be in the cache
+            return int(time.time() - TVDB_CACHE_HARD_TTL)
+        return started_at
+
+    async def _iter_pages(self, since: int, entity_type: str) -> AsyncIterator[list[EntityUpdate]]:
+        """Go through the pages of the updates of given entity type since given timestamp.
+
+        At most :attr:`MAX_PAGES` pages are fetched.
+        """
+        for page in range(self.MAX_PAGES):
+            response = await self.client.request_raw(
+                "GET",
+                "updates",
+                query={"since": str(since), "type": entity_type, "page": str(page)},
+                priority=RateLimitPriority.BACKGROUND,
+            )
+            parsed = json_codec.validate(UpdatesGetResponse, response)
+            if parsed.data:
+                yield parsed.data
+
+            if not parsed.data or not parsed.links or not parsed.links.next:
+                return
+
+        raise _FeedTruncatedError
+
+    async def _collect(self, changes: _Changes, entity_type: str, started_at: int) -> int:
+        """Collect the changes of given entity type since the last sync.
+
+        :return: The timestamp up to which the updates were processed.
+        """
+        since = await self._get_since(entity_type, started_at)
+        if since >= started_at:
+            return started_at
+
+        synced_until = since
+        try:
+            async for updates in self._iter_pages(since, entity_type):
+                for update in updates:
+                    changes.add(update)
+                # The feed is ordered by time, everything up to this page was processed
+                synced_until = max([synced_until, *(update.time_stamp or 0 for update in updates)])
+        except _FeedTruncatedError:
+            log.warning(
+                f"More than {self.MAX_PAGES} pages of TVDB {entity_type} updates,"
+                f" the rest will be processed in the next sync"
+            )
+            return synced_until
+        return started_at
+
+    async def sync(self) -> int:
+        """Invalidate the cached responses of all of the records that changed since the last sync.
+
+        :return: The amount of the changed records.
+        """
+        started_at = int(time.time())
+        log.debug("Syncing TVDB updates")
+
+        changes = _Changes()
+        synced_until = {
+            entity_type: await self._collect(changes, entity_type, started_at) for entity_type in self.ENTITY_TYPES
+        }
+
+        # Each of these looks up (and updates) the cached responses of all of the given records at once
+        await self.client.invalidate(Series, changes.series | changes.episode_series)
+        await self.client.invalidate_episode_lists(changes.episode_series)
+        await self.client.invalidate_episodes(changes.episodes)
+        await self.client.invalidate(Movie, changes.movies)
+        await self.client.invalidate(Series, changes.deleted_series, evict=True)
+        await self.client.invalidate_episode_lists(changes.deleted_series, evict=True)
+        await self.client.invalidate(Movie, changes.deleted_movies, evict=True)
+        await self.client.invalidate_episodes(changes.deleted_episodes, evict=True)
+        if self.client.title_index is not None:
+            await self.client.title_index.remove_many(Series.SEARCH_TYPE, changes.series)
+            await self.client.title_index.remove_many(Movie.SEARCH_TYPE, changes.movies)
+
+        # Only once everything got invalidated, so that an interrupted sync gets repeated
+        await self.client.cache.multi_set(
+            [(f"synced_until_{entity_type}", timestamp) for entity_type, timestamp in synced_until.items()],
+            namespace=self.CACHE_NAMESPACE,
+        )
+        log.debug(f"Synced TVDB updates, {len(changes)} records changed")
+        return len(changes)
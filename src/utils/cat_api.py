@@ -1,5 +1,7 @@
 from discord import aiohttp
 
+from src.utils.json_codec import decode as decode_json
+
 CAT_API_URL = "https://api.thecatapi.com/v1/images/search"
 
 
@@ -10,5 +12,5 @@ async def get_cat_image_url(http_session: aiohttp.ClientSession) -> str:
     """
     async with http_session.get(CAT_API_URL) as resp:
         resp.raise_for_status()
-        data = await resp.json()
+        data = decode_json(await resp.read())
         return data[0]["url"]
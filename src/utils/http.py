@@ -0,0 +1,85 @@
+"""Pooled HTTP sessions for talking to external APIs.
+
+Sharing a single session (and so a single connection pool) between everything would mean that a slow
+external API can exhaust the pool and hold up the unrelated requests, so each API client with a notable
+amount of traffic should instead own a session created here, with its own (bounded) pool and timeouts.
+"""
+
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+import aiohttp
+
+__all__ = ["ConnectionStats", "create_pooled_session"]
+
+
+@dataclass
+class ConnectionStats:
+    """Counters tracking how the requests of a pooled session obtained their connections."""
+
+    created: int = 0
+    """Requests that had to open a new connection."""
+    reused: int = 0
+    """Requests that reused an already open (kept-alive) connection."""
+    queued: int = 0
+    """Requests that had to wait for a connection, because the pool was exhausted."""
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Portion of the requests which reused an already open connection."""
+        total = self.created + self.reused
+        return self.reused / total if total else 0
+
+
+def _stats_trace_config(stats: ConnectionStats) -> aiohttp.TraceConfig:
+    """Create a trace config, keeping the connection stats of the session up to date."""
+
+    async def on_connection_create_end(*_: object) -> None:
+        stats.created += 1
+
+    async def on_connection_reuseconn(*_: object) -> None:
+        stats.reused += 1
+
+    async def on_connection_queued_start(*_: object) -> None:
+        stats.queued += 1
+
+    trace_config = aiohttp.TraceConfig(trace_config_ctx_factory=SimpleNamespace)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    trace_config.on_connection_queued_start.append(on_connection_queued_start)
+    return trace_config
+
+
+def create_pooled_session(
+    *,
+    max_connections: int,
+    max_connections_per_host: int,
+    keepalive_timeout: float,
+    connect_timeout: float | None,
+    read_timeout: float | None,
+    dns_cache_ttl: int | None = 300,
+    stats: ConnectionStats | None = None,
+) -> aiohttp.ClientSession:
+    """Create a HTTP session with its own connection pool.
+
+    This has to be called from within a running event loop.
+
+    :param max_connections: Maximum amount of simultaneously open connections (`0` for no limit).
+    :param max_connections_per_host: Maximum amount of simultaneously open connections to a single host.
+    :param keepalive_timeout: Time in seconds for which the idle connections are kept open for reuse.
+    :param connect_timeout:
+        Maximum time in seconds for obtaining a connection, including the time spent waiting for a free
+        connection in the pool (`None` for no limit).
+    :param read_timeout: Maximum time in seconds between two reads of the response data (`None` for no limit).
+    :param dns_cache_ttl: Time in seconds for which the resolved addresses are cached (`None` to cache forever).
+    :param stats: If set, the counters of this instance will be kept up to date with the session.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=max_connections,
+        limit_per_host=max_connections_per_host,
+        keepalive_timeout=keepalive_timeout,
+        ttl_dns_cache=dns_cache_ttl,
+    )
+    timeout = aiohttp.ClientTimeout(total=None, connect=connect_timeout, sock_read=read_timeout)
+    trace_configs = [_stats_trace_config(stats)] if stats is not None else None
+    return aiohttp.ClientSession(connector=connector, timeout=timeout, trace_configs=trace_configs)
@@ -0,0 +1,48 @@
+"""Encoding and decoding of JSON data, using the fastest available backend.
+
+If `orjson` is installed, it's used for both directions, otherwise this falls back to the stdlib `json`
+module. Either way, the encoded data is always compact UTF-8 bytes.
+
+The JSON meant to be validated into pydantic models should go through :func:`validate`. Note that it
+doesn't use `model_validate_json` of the models: with our (large, mostly optional) TVDB models, the JSON
+parsing of pydantic turned out to be slower than decoding the data here, and validating the result.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel
+
+__all__ = ["BACKEND", "decode", "encode", "validate"]
+
+
+def _stdlib_encode(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _load_backend() -> tuple[str, Callable[[bytes], Any], Callable[[Any], bytes]]:
+    try:
+        import orjson
+    except ImportError:
+        return "json", json.loads, _stdlib_encode
+    return "orjson", orjson.loads, orjson.dumps
+
+
+# Name of the used backend (either "orjson" or "json"), and its functions
+BACKEND, _decode, _encode = _load_backend()
+
+
+def decode(data: bytes) -> Any:
+    """Decode the JSON data."""
+    return _decode(data)
+
+
+def encode(obj: Any) -> bytes:
+    """Encode the object into compact JSON data."""
+    return _encode(obj)
+
+
+def validate[T: BaseModel](model: type[T], data: bytes) -> T:
+    """Decode the JSON data and validate it into given model."""
+    return model.model_validate(_decode(data))
@@ -0,0 +1,62 @@
+import functools
+from collections.abc import Callable
+from typing import Any, Self, overload
+
+__all__ = ["slot_cached_property", "reset_cached_properties"]
+
+
+class SlotCachedProperty[T, R]:
+    """A :func:`functools.cached_property` alternative, for classes using `__slots__`.
+
+    The computed value is memoized in a slot named after the property, with an underscore prefix
+    (e.g. the value of `name` is stored in `_name`), which the class has to declare in its `__slots__`.
+    """
+
+    def __init__(self, func: Callable[[T], R]) -> None:
+        self.func = func
+        self.slot = f"_{func.__name__}"
+        self.__doc__ = func.__doc__
+
+    @overload
+    def __get__(self, instance: None, owner: type[T]) -> Self: ...
+
+    @overload
+    def __get__(self, instance: T, owner: type[T]) -> R: ...
+
+    def __get__(self, instance: T | None, owner: type[T]) -> R | Self:
+        if instance is None:
+            return self
+
+        try:
+            return getattr(instance, self.slot)
+        except AttributeError:
+            value = self.func(instance)
+            setattr(instance, self.slot, value)
+            return value
+
+    def reset(self, instance: T) -> None:
+        """Forget the memoized value, so that it gets computed again on the next access."""
+        if hasattr(instance, self.slot):
+            delattr(instance, self.slot)
+
+
+def slot_cached_property[T, R](func: Callable[[T], R]) -> SlotCachedProperty[T, R]:
+    """Decorate a method to turn it into a property, computed on the first access and memoized in a slot.
+
+    See :class:`SlotCachedProperty` for more details.
+    """
+    return SlotCachedProperty(func)
+
+
+@functools.cache
+def _cached_property_slots(cls: type) -> tuple[str, ...]:
+    return tuple(
+        attr.slot for klass in cls.__mro__ for attr in vars(klass).values() if isinstance(attr, SlotCachedProperty)
+    )
+
+
+def reset_cached_properties(instance: Any) -> None:
+    """Forget all of the memoized values of the slot cached properties of given instance."""
+    for slot in _cached_property_slots(type(instance)):
+        if hasattr(instance, slot):
+            delattr(instance, slot)
@@ -0,0 +1,64 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+__all__ = ["LRUCache"]
+
+
+class LRUCache[K: Hashable, V]:
+    """A simple in-process LRU cache, with optional per-entry expiration.
+
+    Once the cache holds `maxsize` entries, storing a new entry evicts the least recently used one.
+    Expired entries are removed lazily, when they're accessed.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError("LRU cache size must be positive.")
+
+        self.maxsize = maxsize
+        self._data: OrderedDict[K, tuple[float | None, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: K) -> V | None:
+        """Get the value stored under `key`, or ``None`` if it's not present (or expired)."""
+        try:
+            expires_at, value = self._data[key]
+        except KeyError:
+            return None
+
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, *, ttl: float | None = None) -> None:
+        """Store the value under `key`, expiring after `ttl` seconds (if set)."""
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        """Remove the value stored under `key`, returning it (or ``None`` if it wasn't present)."""
+        entry = self._data.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def discard_where(self, predicate: Callable[[K], bool]) -> int:
+        """Remove all of the values with keys matching the `predicate`, returning the amount of removed values."""
+        keys = [key for key in self._data if predicate(key)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove all of the stored values."""
+        self._data.clear()
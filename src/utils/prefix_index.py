@@ -0,0 +1,126 @@
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+
+__all__ = ["PrefixIndex"]
+
+
+class PrefixIndex:
+    """An in-memory index of texts, for completing them by the prefixes of their words.
+
+    Each text is stored under the suffixes starting at each of its words (after normalization),
+    in a sorted list, so that a text can be found by the prefix of any of its words (e.g. "The Office"
+    is found by both "the off" and "off") with a binary search.
+
+    The index holds at most `maxsize` texts, once it's full, adding a new text evicts the least
+    recently added one.
+    """
+
+    def __init__(self, maxsize: int, *, normalize: Callable[[str], str] = str.casefold) -> None:
+        """Initialize the prefix index.
+
+        :param maxsize: Maximum amount of held texts.
+        :param normalize: Function normalizing both the texts and the prefixes before they're matched.
+        """
+        if maxsize <= 0:
+            raise ValueError("Prefix index size must be positive.")
+
+        self.maxsize = maxsize
+        self.normalize = normalize
+        self._keys: list[tuple[str, str]] = []
+        """Sorted (word suffix of the normalized text, text) pairs."""
+        self._texts: OrderedDict[str, tuple[str, ...]] = OrderedDict()
+        """The held texts, with their word suffixes, from the least recently added one."""
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, text: str) -> bool:
+        return text in self._texts
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the held texts, from the least recently added one."""
+        return iter(self._texts)
+
+    def _suffixes(self, text: str) -> tuple[str, ...]:
+        words = self.normalize(text).split(" ")
+        return tuple(dict.fromkeys(" ".join(words[start:]) for start in range(len(words)) if words[start]))
+
+    def add(self, text: str) -> None:
+        """Add the text to the index (or mark it as the most recently added one, if it's already held)."""
+        if text in self._texts:
+            self._texts.move_to_end(text)
+            return
+
+        suffixes = self._suffixes(text)
+        if not suffixes:
+            return
+        self._texts[text] = suffixes
+        for suffix in suffixes:
+            insort(self._keys, (suffix, text))
+        self._evict()
+
+    def update(self, texts: Iterable[str]) -> None:
+        """Add all of the texts to the index, in order.
+
+        When adding a lot of texts, this is faster than adding them one by one, as the index only gets sorted once.
+        """
+        added: list[tuple[str, str]] = []
+        for text in texts:
+            if text in self._texts:
+                self._texts.move_to_end(text)
+            elif suffixes := self._suffixes(text):
+                self._texts[text] = suffixes
+                added.extend((suffix, text) for suffix in suffixes)
+
+        if len(added) > len(self._keys) // 8:
+            self._keys.extend(added)
+            self._keys.sort()
+        else:
+            for key in added:
+                insort(self._keys, key)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently added texts, until the index is within its size."""
+        excess = len(self._texts) - self.maxsize
+        if excess == 1:
+            self.discard(next(iter(self._texts)))
+        elif excess > 1:
+            removed = {self._texts.popitem(last=False)[0] for _ in range(excess)}
+            self._keys = [key for key in self._keys if key[1] not in removed]
+
+    def discard(self, text: str) -> None:
+        """Remove the text from the index, if it's held."""
+        suffixes = self._texts.pop(text, None)
+        if suffixes is None:
+            return
+        for suffix in suffixes:
+            position = bisect_left(self._keys, (suffix, text))
+            del self._keys[position]
+
+    def complete(self, prefix: str, limit: int = 25) -> list[str]:
+        """Get up to `limit` texts that have a word starting with the prefix.
+
+        The texts which start with the prefix are listed first, the rest is ordered alphabetically.
+        """
+        normalized = self.normalize(prefix)
+        if not normalized:
+            return []
+
+        leading: list[str] = []
+        other: dict[str, None] = {}
+        position = bisect_left(self._keys, (normalized, ""))
+        # Looking at a few more keys than needed, as the leading matches are still likely to come
+        while position < len(self._keys) and len(leading) < limit and len(other) < 4 * limit:
+            suffix, text = self._keys[position]
+            if not suffix.startswith(normalized):
+                break
+            if self._texts[text][0] == suffix:
+                leading.append(text)
+            else:
+                other[text] = None
+            position += 1
+
+        other_texts = [text for text in other if text not in leading]
+        return (leading + other_texts)[:limit]
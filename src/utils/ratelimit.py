@@ -1,5 +1,11 @@
+import asyncio
+import heapq
+import itertools
 import time
+from collections import deque
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import IntEnum
 from functools import wraps
 from typing import Concatenate, cast
 
@@ -140,6 +146,184 @@ async def rate_limit(
         )
 
 
+class RateLimitPriority(IntEnum):
+    """Priority classes for requests waiting in a :class:`RateLimitQueue`.
+
+    Requests with a lower value are admitted first, requests with the same priority
+    are admitted in the order in which they arrived.
+    """
+
+    INTERACTIVE = 0
+    """Requests that a user is actively waiting for."""
+    NORMAL = 1
+    BACKGROUND = 2
+    """Requests that nobody is waiting for (e.g. prefetching or cache refreshes)."""
+
+
+@dataclass
+class RateLimitQueueStats:
+    """Metrics of a :class:`RateLimitQueue`."""
+
+    admitted: int = 0
+    """Requests that were let through (including the ones that had to wait)."""
+    waited: int = 0
+    """Requests that had to wait in the queue before being let through."""
+    rejected: int = 0
+    """Requests that gave up after waiting in the queue for too long."""
+    total_wait_time: float = 0
+    max_wait_time: float = 0
+    max_queue_depth: int = 0
+
+    @property
+    def avg_wait_time(self) -> float:
+        """Average time spent waiting in the queue, out of the requests that had to wait."""
+        if self.waited == 0:
+            return 0
+        return self.total_wait_time / self.waited
+
+
+class RateLimitQueue:
+    """An admission queue, enforcing a rate limit by making the requests wait, rather than rejecting them.
+
+    This uses the same sliding window approach as :func:`rate_limit` (at most `limit` requests
+    are admitted within any `period` seconds), but instead of raising an exception once the
+    window is full, the request is held in a queue until a slot opens up.
+
+    The queue is held in-process, so unlike :func:`rate_limit`, it's not backed by the cache.
+    This makes it suitable for internal (outbound) rate-limits, which are only relevant to
+    this process.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        *,
+        limit: int,
+        period: float,
+        max_wait: float | None = None,
+        err_msg: str | None = None,
+    ) -> None:
+        """Initialize the rate limit queue.
+
+        :param key: Name of this rate-limit, used in logs and in the raised exceptions.
+        :param limit: The number of requests allowed in the period.
+        :param period: The period of time in seconds, in which the limit is enforced.
+        :param max_wait:
+            Maximum time in seconds that a request can wait in the queue, before giving up.
+
+            If ``None``, the requests will wait for as long as necessary.
+        :param err_msg: Custom error message to include in the `RateLimitExceededError` exception.
+        """
+        self.key = key
+        self.limit = limit
+        self.period = period
+        self.max_wait = max_wait
+        self.err_msg = err_msg
+        self.stats = RateLimitQueueStats()
+
+        # Admission times (monotonic) of the requests in the current window
+        self._admissions: deque[float] = deque()
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+        self._wakeup: asyncio.TimerHandle | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of requests currently waiting in the queue."""
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+    def _prune(self, now: float) -> None:
+        """Forget admissions that are no longer within the sliding window."""
+        while self._admissions and now - self._admissions[0] >= self.period:
+            self._admissions.popleft()
+
+    def _next_slot_delay(self, now: float) -> float:
+        """Get the time in seconds until a new slot opens up (0 if there's a free slot)."""
+        if len(self._admissions) < self.limit:
+            return 0
+        return max(self._admissions[0] + self.period - now, 0)
+
+    def _schedule_wakeup(self, now: float) -> None:
+        if self._wakeup is not None:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._wakeup = loop.call_later(self._next_slot_delay(now), self._admit_waiters)
+
+    def _admit_waiters(self) -> None:
+        """Let through as many waiting requests as the free slots allow, in priority order."""
+        self._wakeup = None
+        now = time.monotonic()
+        self._prune(now)
+
+        while self._waiters and len(self._admissions) < self.limit:
+            _, _, fut = heapq.heappop(self._waiters)
+            if fut.done():  # The waiter gave up (timed out / got cancelled)
+                continue
+            self._admissions.append(now)
+            fut.set_result(None)
+
+        # Drop the waiters that gave up, so that they don't trigger needless wakeups
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+
+        if self._waiters:
+            self._schedule_wakeup(now)
+
+    async def acquire(self, priority: RateLimitPriority = RateLimitPriority.NORMAL) -> None:
+        """Wait until the request can be made without exceeding the rate limit.
+
+        :param priority: The priority of this request, lower values are admitted first.
+        :raises RateLimitExceededError:
+            If the request would need to wait for longer than `max_wait`.
+        """
+        start = time.monotonic()
+        self._prune(start)
+
+        if not self._waiters and len(self._admissions) < self.limit:
+            self._admissions.append(start)
+            self.stats.admitted += 1
+            return
+
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), fut))
+        depth = self.queue_depth
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, depth)
+        log.trace(f"Rate limit {self.key!r} is full, queueing request ({priority.name}, queue depth: {depth})")
+        self._schedule_wakeup(start)
+
+        try:
+            await asyncio.wait_for(fut, self.max_wait)
+        except TimeoutError:
+            self.stats.rejected += 1
+            now = time.monotonic()
+            closest_expiration = time.time() + self._next_slot_delay(now)
+            log.debug(f"Rate limit exceeded on key: {self.key!r} (waited for {now - start:.2f}s)")
+            raise RateLimitExceededError(
+                self.err_msg,
+                key=self.key,
+                limit=self.limit,
+                period=self.period,
+                closest_expiration=closest_expiration,
+                updates_when_exceeded=False,
+            )
+        except asyncio.CancelledError:
+            # If we were cancelled just after being admitted, release the slot for someone else
+            if fut.done() and not fut.cancelled():
+                self._admissions.pop()
+                if self._wakeup is not None:
+                    self._wakeup.cancel()
+                self._admit_waiters()
+            raise
+
+        wait_time = time.monotonic() - start
+        self.stats.admitted += 1
+        self.stats.waited += 1
+        self.stats.total_wait_time += wait_time
+        self.stats.max_wait_time = max(self.stats.max_wait_time, wait_time)
+        log.trace(f"Rate limit {self.key!r} admitted a queued request after {wait_time:.3f}s")
+
+
 type CogCommandFunction[T: Cog, **P] = Callable[Concatenate[T, ApplicationContext, P], Awaitable[None]]
 type TransformFunction[T, R] = Callable[[T, ApplicationContext], R]
 
@@ -0,0 +1,264 @@
+"""Building blocks for making the requests to an unreliable upstream service resilient.
+
+- :class:`CircuitBreaker` stops sending requests to an upstream that keeps failing, for a while.
+- :func:`backoff_delay` gives the (jittered) delays between the retries of a failed request.
+- :class:`Hedger` sends a second copy of a slow request, using whichever response arrives first.
+"""
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitBreakerStats",
+    "CircuitOpenError",
+    "CircuitState",
+    "HedgeStats",
+    "Hedger",
+    "backoff_delay",
+]
+
+
+class CircuitOpenError(Exception):
+    """Exception raised when a request isn't sent at all, as the circuit breaker of its upstream is open."""
+
+    def __init__(self, name: str, retry_at: float) -> None:
+        """Initialize the circuit open error.
+
+        :param name: Name of the circuit breaker.
+        :param retry_at: The unix time-stamp from which the upstream will be tried again.
+        """
+        self.name = name
+        self.retry_at = retry_at
+        super().__init__(f"Circuit breaker {name!r} is open, the upstream is failing")
+
+
+class CircuitState(Enum):
+    """States of a :class:`CircuitBreaker`."""
+
+    CLOSED = "closed"
+    """The requests are let through."""
+    OPEN = "open"
+    """The requests are rejected right away."""
+    HALF_OPEN = "half-open"
+    """A single (probe) request is let through, to find out whether the upstream recovered."""
+
+
+@dataclass
+class CircuitBreakerStats:
+    """Metrics of a :class:`CircuitBreaker`."""
+
+    opened: int = 0
+    """How many times the circuit was opened."""
+    rejected: int = 0
+    """Requests that weren't sent, as the circuit was open."""
+
+
+class CircuitBreaker:
+    """Stops the requests to an upstream, once too many of them failed in a row.
+
+    After `failure_threshold` consecutive failures, the circuit opens, and all of the requests are rejected
+    right away (with :class:`CircuitOpenError`) for `reset_timeout` seconds. After that, the circuit is
+    half-open: a single probe request is let through, if it succeeds, the circuit closes again, otherwise
+    it stays open for another `reset_timeout` seconds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int,
+        reset_timeout: float,
+        is_failure: Callable[[BaseException], bool],
+    ) -> None:
+        """Initialize the circuit breaker.
+
+        :param name: Name of the circuit breaker, used in logs and in the raised exceptions.
+        :param failure_threshold: Amount of consecutive failures after which the circuit opens.
+        :param reset_timeout: Time in seconds for which the circuit stays open, before letting a probe through.
+        :param is_failure:
+            Decides whether an exception raised by a request means that the upstream is failing.
+
+            The other exceptions (e.g. a 404 response) count neither as a failure, nor as a success.
+        """
+        if failure_threshold <= 0:
+            raise ValueError("Circuit breaker failure threshold must be positive.")
+
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.is_failure = is_failure
+        self.stats = CircuitBreakerStats()
+
+        self.failures = 0
+        """Amount of consecutive failures."""
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state of the circuit."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    def _check(self) -> bool:
+        """Check whether a request can be sent now, returning whether it's the probe of a half-open circuit.
+
+        :raises CircuitOpenError: If the request can't be sent.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return False
+        if state is CircuitState.HALF_OPEN and not self._probing:
+            self._probing = True
+            log.debug(f"Circuit breaker {self.name!r} is half-open, sending a probe request")
+            return True
+
+        self.stats.rejected += 1
+        opened_at = self._opened_at or time.monotonic()
+        retry_in = max(opened_at + self.reset_timeout - time.monotonic(), 0)
+        raise CircuitOpenError(self.name, retry_at=time.time() + retry_in)
+
+    def _record_success(self) -> None:
+        if self._opened_at is not None:
+            log.info(f"Circuit breaker {self.name!r} closed, the upstream recovered")
+        self.failures = 0
+        self._opened_at = None
+
+    def _record_failure(self, *, probe: bool) -> None:
+        self.failures += 1
+        if probe or (self._opened_at is None and self.failures >= self.failure_threshold):
+            self._opened_at = time.monotonic()
+            self.stats.opened += 1
+            log.warning(
+                f"Circuit breaker {self.name!r} opened after {self.failures} consecutive failures,"
+                f" rejecting the requests for {self.reset_timeout}s"
+            )
+
+    @contextmanager
+    def attempt(self) -> Iterator[None]:
+        """Guard a single request (made within this context), recording whether it succeeded.
+
+        :raises CircuitOpenError: If the circuit is open (the request shouldn't be made).
+        """
+        probe = self._check()
+        try:
+            yield
+        except BaseException as exc:
+            if self.is_failure(exc):
+                self._record_failure(probe=probe)
+            raise
+        else:
+            self._record_success()
+        finally:
+            if probe:
+                self._probing = False
+
+
+def backoff_delay(attempt: int, *, base: float, cap: float) -> float:
+    """Get the delay in seconds before the retry of a failed request, with "full jitter".
+
+    The delay is picked randomly between 0 and an exponentially growing bound (`base` doubled with each
+    attempt, up to `cap`), so that the clients that failed at the same time don't all retry at once.
+
+    :param attempt: The number of the failed attempt, starting from 0.
+    """
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+@dataclass
+class HedgeStats:
+    """Metrics of a :class:`Hedger`."""
+
+    sent: int = 0
+    """Hedge calls that were made, as the primary call took too long."""
+    won: int = 0
+    """Hedge calls that finished before the primary call."""
+    skipped: int = 0
+    """Slow calls that weren't hedged, as too many hedge calls were already running."""
+
+
+def _consume_result(task: asyncio.Future[Any]) -> None:
+    # Losing calls might still fail before they get cancelled, don't let their exceptions go unretrieved
+    if not task.cancelled():
+        task.exception()
+
+
+class Hedger:
+    """Hedges slow calls: if a call doesn't finish in time, a second copy of it is made alongside it.
+
+    This cuts the tail latency caused by the occasional slow response, at the cost of a few extra calls.
+    As the calls are usually slow because the upstream (or the local connection pool) is overloaded, the
+    amount of the concurrently running hedge calls is limited, so that the hedging can't add to the load.
+    """
+
+    def __init__(self, *, delay: float, max_inflight: int) -> None:
+        """Initialize the hedger.
+
+        :param delay: Time in seconds after which a call that's still running gets hedged.
+        :param max_inflight: Maximum amount of concurrently running hedge calls.
+        """
+        self.delay = delay
+        self.max_inflight = max_inflight
+        self.inflight = 0
+        self.stats = HedgeStats()
+
+    async def run[T](self, primary: Callable[[], Awaitable[T]], hedge: Callable[[], Awaitable[T]]) -> T:
+        """Make the primary call, and if it doesn't finish within the delay, make the hedge call alongside it.
+
+        The result of whichever call succeeds first is returned, the other call gets cancelled. Only if both of
+        the calls fail, the exception of the first one to fail is raised. This should only be used for idempotent
+        calls (e.g. GET requests), as both of them can end up being executed.
+
+        :param primary: The call to make.
+        :param hedge: The call to make, if the primary one takes too long (usually a copy of the primary call).
+        """
+        tasks: list[asyncio.Future[T]] = [asyncio.ensure_future(primary())]
+        tasks[0].add_done_callback(_consume_result)
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.delay)
+            if done:
+                return tasks[0].result()
+            if self.inflight >= self.max_inflight:
+                self.stats.skipped += 1
+                return await tasks[0]
+
+            self.inflight += 1
+            try:
+                return await self._race(tasks, hedge)
+            finally:
+                self.inflight -= 1
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _race[T](self, tasks: list[asyncio.Future[T]], hedge: Callable[[], Awaitable[T]]) -> T:
+        """Make the hedge call, returning the result of whichever of the calls succeeds first."""
+        tasks.append(asyncio.ensure_future(hedge()))
+        tasks[1].add_done_callback(_consume_result)
+        self.stats.sent += 1
+
+        pending = set(tasks)
+        failed: list[asyncio.Future[T]] = []
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is tasks[1]:
+                        self.stats.won += 1
+                    return task.result()
+                failed.append(task)
+        return failed[0].result()
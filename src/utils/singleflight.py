@@ -0,0 +1,57 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+
+from src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+
+class SingleFlight[K: Hashable, V]:
+    """Deduplicate concurrent executions of the same (keyed) coroutine.
+
+    While a call for some key is in-flight, any other callers asking for that same key will
+    simply wait for the result of the already running call, instead of starting a new one.
+
+    The shared call runs in its own task, so a cancellation of any single caller (including
+    the one that started the call) will not cancel the call for the others.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[K, asyncio.Task[V]] = {}
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._inflight
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: K, func: Callable[[], Awaitable[V]]) -> tuple[V, bool]:
+        """Run `func`, unless a call for given `key` is already running, in which case join it instead.
+
+        :return:
+            A tuple of the result and a bool, indicating whether the result was shared
+            (obtained by joining an already in-flight call).
+        """
+        task = self._inflight.get(key)
+        shared = task is not None
+
+        if task is None:
+
+            async def _run() -> V:
+                return await func()
+
+            def _done(finished: asyncio.Task[V]) -> None:
+                if self._inflight.get(key) is finished:
+                    del self._inflight[key]
+                # All of the callers might've been cancelled (e.g. timed out) by now, with nobody left to
+                # retrieve the exception, which asyncio would then report as never retrieved
+                if not finished.cancelled():
+                    finished.exception()
+
+            task = asyncio.create_task(_run())
+            self._inflight[key] = task
+            task.add_done_callback(_done)
+        else:
+            log.trace(f"Joining an in-flight call for key {key!r}")
+
+        return await asyncio.shield(task), shared
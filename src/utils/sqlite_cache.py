@@ -0,0 +1,262 @@
+"""Persistent aiocache backend, storing the cached values in a local SQLite database file.
+
+Unlike the in-memory cache, the values cached here survive restarts of the bot, which means
+that a freshly started bot doesn't have to re-fetch everything from the external APIs.
+"""
+
+import asyncio
+import contextlib
+import time
+from pathlib import Path
+from typing import Any, cast, override
+
+import aiosqlite
+from aiocache.base import BaseCache
+from aiocache.serializers import BaseSerializer, PickleSerializer
+
+from src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+__all__ = ["SQLiteCache"]
+
+
+class SQLiteCache(BaseCache):
+    """Cache backend storing the values in a SQLite database file.
+
+    Expiration of the keys is handled lazily: expired keys are simply ignored on reads and
+    only get removed from the database periodically, by a background compaction task.
+
+    By default, the values are serialized using pickle, so that any python object that the
+    in-memory cache can hold can also be stored here (the database file should therefore only
+    ever be written to by the bot itself).
+    """
+
+    NAME: str = "sqlite"
+
+    def __init__(
+        self,
+        db_file: Path,
+        *,
+        compaction_interval: float = 10 * 60,
+        serializer: BaseSerializer | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the SQLite cache.
+
+        :param db_file: Path to the database file, it will be created if it doesn't exist yet.
+        :param compaction_interval: Time in seconds between the removals of expired keys from the database.
+        :param kwargs: Additional arguments for :class:`aiocache.BaseCache`.
+        """
+        super().__init__(serializer=serializer or PickleSerializer(), **kwargs)
+        self.db_file = db_file
+        self.compaction_interval = compaction_interval
+
+        self._db: aiosqlite.Connection | None = None
+        self._db_lock = asyncio.Lock()
+        self._compaction_task: asyncio.Task[None] | None = None
+
+    async def _get_db(self) -> aiosqlite.Connection:
+        """Get the database connection, opening it (and creating the schema) on first use."""
+        if self._db is not None:
+            return self._db
+
+        async with self._db_lock:
+            if self._db is not None:
+                return self._db
+
+            log.debug(f"Opening the SQLite cache: {self.db_file}")
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            db = await aiosqlite.connect(self.db_file)
+            # Must be set before the table is created to take effect (no-op for existing databases)
+            await db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            await db.execute("PRAGMA journal_mode = WAL")
+            await db.execute("PRAGMA synchronous = NORMAL")
+            await db.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+            )
+            await db.execute("CREATE INDEX IF NOT EXISTS ix_cache_expires_at ON cache (expires_at)")
+            await db.commit()
+
+            self._db = db
+            self._compaction_task = asyncio.create_task(self._compaction_loop())
+            return db
+
+    @staticmethod
+    def _expires_at(ttl: float | None) -> float | None:
+        return time.time() + ttl if ttl else None
+
+    async def compact(self) -> int:
+        """Remove all of the expired keys from the database, returning the amount of removed keys."""
+        db = await self._get_db()
+        cursor = await db.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+        await db.commit()
+        removed = cursor.rowcount
+        if removed > 0:
+            await db.execute("PRAGMA incremental_vacuum")
+            await db.commit()
+        log.debug(f"Compacted the SQLite cache, removed {removed} expired keys")
+        return removed
+
+    async def is_empty(self) -> bool:
+        """Check whether the cache holds no (unexpired) values at all."""
+        db = await self._get_db()
+        query = "SELECT 1 FROM cache WHERE expires_at IS NULL OR expires_at > ? LIMIT 1"
+        async with db.execute(query, (time.time(),)) as cursor:
+            return await cursor.fetchone() is None
+
+    async def _compaction_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.compaction_interval)
+            try:
+                await self.compact()
+            except Exception:
+                log.exception("Failed to compact the SQLite cache")
+
+    async def _fetch_value(self, db: aiosqlite.Connection, key: str) -> Any:
+        query = "SELECT value FROM cache WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)"
+        async with db.execute(query, (key, time.time())) as cursor:
+            row = await cursor.fetchone()
+        return row[0] if row is not None else None
+
+    @override
+    async def _get(self, key: str, encoding: str = "utf-8", _conn: Any = None) -> Any:
+        return await self._fetch_value(await self._get_db(), key)
+
+    @override
+    async def _gets(self, key: str, encoding: str = "utf-8", _conn: Any = None) -> Any:
+        return await self._get(key, encoding=encoding, _conn=_conn)
+
+    @override
+    async def _multi_get(self, keys: list[str], encoding: str = "utf-8", _conn: Any = None) -> list[Any]:
+        if not keys:
+            return []
+
+        db = await self._get_db()
+        placeholders = ", ".join("?" * len(keys))
+        query = (
+            f"SELECT key, value FROM cache WHERE key IN ({placeholders})"  # noqa: S608
+            " AND (expires_at IS NULL OR expires_at > ?)"
+        )
+        async with db.execute(query, (*keys, time.time())) as cursor:
+            found = {key: value async for key, value in cursor}
+        return [found.get(key) for key in keys]
+
+    @override
+    async def _set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float | None = None,
+        _cas_token: Any = None,
+        _conn: Any = None,
+    ) -> bool | int:
+        db = await self._get_db()
+        if _cas_token is not None and _cas_token != await self._fetch_value(db, key):
+            return 0
+
+        await db.execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, self._expires_at(ttl)),
+        )
+        await db.commit()
+        return True
+
+    @override
+    async def _multi_set(self, pairs: list[tuple[str, Any]], ttl: float | None = None, _conn: Any = None) -> bool:
+        db = await self._get_db()
+        expires_at = self._expires_at(ttl)
+        await db.executemany(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            [(key, value, expires_at) for key, value in pairs],
+        )
+        await db.commit()
+        return True
+
+    @override
+    async def _add(self, key: str, value: Any, ttl: float | None = None, _conn: Any = None) -> bool:
+        db = await self._get_db()
+        if await self._fetch_value(db, key) is not None:
+            raise ValueError(f"Key {key} already exists, use .set to update the value")
+
+        await self._set(key, value, ttl=ttl)
+        return True
+
+    @override
+    async def _exists(self, key: str, _conn: Any = None) -> bool:
+        return await self._fetch_value(await self._get_db(), key) is not None
+
+    @override
+    async def _increment(self, key: str, delta: int, _conn: Any = None) -> int:
+        db = await self._get_db()
+        serializer = cast(BaseSerializer, self.serializer)
+        raw_value = await self._fetch_value(db, key)
+        if raw_value is None:
+            value = delta
+            await self._set(key, serializer.dumps(value))
+            return value
+
+        try:
+            value = int(serializer.loads(raw_value)) + delta
+        except ValueError:
+            raise TypeError("Value is not an integer") from None
+
+        # Update the value only, keeping the original expiration
+        await db.execute("UPDATE cache SET value = ? WHERE key = ?", (serializer.dumps(value), key))
+        await db.commit()
+        return value
+
+    @override
+    async def _expire(self, key: str, ttl: float, _conn: Any = None) -> bool:
+        db = await self._get_db()
+        cursor = await db.execute(
+            "UPDATE cache SET expires_at = ? WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (self._expires_at(ttl), key, time.time()),
+        )
+        await db.commit()
+        return cursor.rowcount > 0
+
+    @override
+    async def _delete(self, key: str, _conn: Any = None) -> int:
+        db = await self._get_db()
+        cursor = await db.execute("DELETE FROM cache WHERE key = ?", (key,))
+        await db.commit()
+        return cursor.rowcount
+
+    @override
+    async def _clear(self, namespace: str | None = None, _conn: Any = None) -> bool:
+        db = await self._get_db()
+        if namespace:
+            escaped = namespace.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            await db.execute("DELETE FROM cache WHERE key LIKE ? ESCAPE '\\'", (f"{escaped}%",))
+        else:
+            await db.execute("DELETE FROM cache")
+        await db.commit()
+        return True
+
+    @override
+    async def _raw(self, command: str, *args: Any, encoding: str = "utf-8", _conn: Any = None, **kwargs: Any) -> Any:
+        db = await self._get_db()
+        async with db.execute(command, args) as cursor:
+            rows = await cursor.fetchall()
+        await db.commit()
+        return rows
+
+    @override
+    async def _redlock_release(self, key: str, value: Any) -> int:
+        db = await self._get_db()
+        cursor = await db.execute("DELETE FROM cache WHERE key = ? AND value = ?", (key, value))
+        await db.commit()
+        return cursor.rowcount
+
+    @override
+    async def _close(self, *args: Any, _conn: Any = None, **kwargs: Any) -> None:
+        if self._compaction_task is not None:
+            self._compaction_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._compaction_task
+            self._compaction_task = None
+
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
@@ -0,0 +1,82 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import override
+
+__all__ = ["StageStats", "StageTimer", "StageTimings"]
+
+
+@dataclass
+class StageStats:
+    """Accumulated durations of a single stage, across the runs of an operation."""
+
+    count: int = 0
+    total: float = 0
+    """Total time in seconds spent in the stage."""
+    max: float = 0
+    """The longest duration of the stage in seconds."""
+
+    @property
+    def mean(self) -> float:
+        """The average duration of the stage in seconds."""
+        return self.total / self.count if self.count else 0
+
+
+class StageTimings:
+    """Accumulated durations of the stages of a repeatedly run operation (e.g. a command)."""
+
+    def __init__(self) -> None:
+        self.stages: dict[str, StageStats] = {}
+
+    def record(self, stage: str, duration: float) -> None:
+        """Account for a single run of given stage, which took `duration` seconds."""
+        stats = self.stages.setdefault(stage, StageStats())
+        stats.count += 1
+        stats.total += duration
+        stats.max = max(stats.max, duration)
+
+    def summary(self) -> str:
+        """Get a human readable summary of the mean and max durations of the stages."""
+        return ", ".join(
+            f"{stage}: mean {stats.mean * 1000:.0f}ms, max {stats.max * 1000:.0f}ms (n={stats.count})"
+            for stage, stats in self.stages.items()
+        )
+
+
+class StageTimer:
+    """Measures the durations of the stages of a single run of an operation.
+
+    The durations of a stage entered multiple times are summed up.
+    """
+
+    def __init__(self, timings: StageTimings | None = None) -> None:
+        """Initialize the timer.
+
+        :param timings: If set, the duration of each stage is also recorded into it, once the stage is exited.
+        """
+        self.timings = timings
+        self.durations: dict[str, float] = {}
+        self._started_at = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measure the duration of the stage running within this context."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self.durations[name] = self.durations.get(name, 0) + duration
+            if self.timings is not None:
+                self.timings.record(name, duration)
+
+    @property
+    def elapsed(self) -> float:
+        """Time in seconds since the timer was created."""
+        return time.perf_counter() - self._started_at
+
+    @override
+    def __str__(self) -> str:
+        stages = ", ".join(f"{name}={duration * 1000:.0f}ms" for name, duration in self.durations.items())
+        return f"{stages} (total {self.elapsed * 1000:.0f}ms)"
@@ -0,0 +1,56 @@
+import os
+import tempfile
+from collections.abc import AsyncIterator, Awaitable, Callable
+from pathlib import Path
+
+# The settings are read once the modules of the bot get imported, so these have to be set before that
+_TMP_DIR = Path(tempfile.mkdtemp(prefix="bot-tests-"))
+os.environ.setdefault("BOT_TOKEN", "test-bot-token")
+os.environ.setdefault("TVDB_API_KEY", "test-api-key")
+os.environ["SQLITE_DATABASE_FILE"] = str(_TMP_DIR / "database.db")
+os.environ["TVDB_TITLE_INDEX_FILE"] = str(_TMP_DIR / "titles.db")
+
+import pytest  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncEngine  # noqa: E402
+from yarl import URL  # noqa: E402
+
+from src.tvdb import TvdbClient  # noqa: E402
+from src.utils.database import Base, engine, load_db_models  # noqa: E402
+from tools.tvdb_stand_in import StandIn, create_app  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+type ServeStandIn = Callable[[StandIn], Awaitable[URL]]
+
+
+@pytest.fixture()
+async def database() -> AsyncIterator[AsyncEngine]:
+    """Create all of the tables in an empty database, dropping them once the test is done."""
+    load_db_models()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    # The pooled connections belong to the event loop of this test
+    await engine.dispose()
+
+
+@pytest.fixture()
+async def serve_stand_in(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[ServeStandIn]:
+    """Serve the given TVDB stand-in on a free port, pointing the TVDB clients created afterwards to it."""
+    servers: list[TestServer] = []
+
+    async def serve(stand_in: StandIn) -> URL:
+        # The test server cancels the handlers of the requests abandoned by the client (see StandInStats.cancelled)
+        server = TestServer(create_app(stand_in))
+        await server.start_server()
+        servers.append(server)
+        url = server.make_url("/")
+        monkeypatch.setattr(TvdbClient, "BASE_URL", url)
+        return url
+
+    yield serve
+    for server in servers:
+        await server.close()
@@ -0,0 +1,76 @@
+import pytest
+
+from src.tvdb.title_index import normalize_title
+from src.utils.prefix_index import PrefixIndex
+
+
+@pytest.fixture()
+def index() -> PrefixIndex:
+    index = PrefixIndex(100, normalize=normalize_title)
+    index.update(["The Office", "Office Space", "Breaking Bad", "Better Call Saul", "The Bad Batch"])
+    return index
+
+
+@pytest.mark.parametrize(
+    ("prefix", "expected"),
+    [
+        # The texts starting with the prefix come first, the rest is alphabetical
+        ("off", ["Office Space", "The Office"]),
+        ("the off", ["The Office"]),
+        ("b", ["Better Call Saul", "Breaking Bad", "The Bad Batch"]),
+        ("bad", ["Breaking Bad", "The Bad Batch"]),
+        ("BREAK", ["Breaking Bad"]),
+        ("call s", ["Better Call Saul"]),
+        ("saul x", []),
+        ("", []),
+        ("  ", []),
+    ],
+)
+def test_complete(index: PrefixIndex, prefix: str, expected: list[str]):
+    assert index.complete(prefix) == expected
+
+
+def test_complete_limit(index: PrefixIndex):
+    assert index.complete("b", limit=2) == ["Better Call Saul", "Breaking Bad"]
+    assert index.complete("b", limit=1) == ["Better Call Saul"]
+
+
+def test_readding_keeps_a_single_entry(index: PrefixIndex):
+    index.add("The Office")
+    index.update(["The Office", "The Office"])
+
+    assert len(index) == 5
+    assert index.complete("office") == ["Office Space", "The Office"]
+
+
+def test_evicts_least_recently_added():
+    index = PrefixIndex(3)
+    index.update(["alpha", "beta", "gamma"])
+    index.add("alpha")
+    index.add("delta")
+
+    assert list(index) == ["gamma", "alpha", "delta"]
+    assert "beta" not in index
+    assert index.complete("b") == []
+
+
+def test_bulk_update_evicts():
+    index = PrefixIndex(2)
+    index.update(["alpha", "beta", "gamma", "delta"])
+
+    assert list(index) == ["gamma", "delta"]
+    assert index.complete("a") == []
+    assert index.complete("d") == ["delta"]
+
+
+def test_discard(index: PrefixIndex):
+    index.discard("The Office")
+    index.discard("Missing")
+
+    assert "The Office" not in index
+    assert index.complete("off") == ["Office Space"]
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError, match="positive"):
+        PrefixIndex(0)
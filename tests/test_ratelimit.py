@@ -0,0 +1,125 @@
+import asyncio
+import time
+
+import pytest
+
+from src.utils.ratelimit import RateLimitExceededError, RateLimitPriority, RateLimitQueue
+
+PERIOD = 0.1
+
+
+async def test_admits_up_to_limit_without_waiting():
+    queue = RateLimitQueue("test", limit=3, period=PERIOD)
+    start = time.monotonic()
+    for _ in range(3):
+        await queue.acquire()
+
+    assert time.monotonic() - start < PERIOD / 2
+    assert queue.stats.admitted == 3
+    assert queue.stats.waited == 0
+
+
+async def test_sliding_window_admission():
+    queue = RateLimitQueue("test", limit=2, period=PERIOD)
+    admitted_at: list[float] = []
+    start = time.monotonic()
+
+    async def acquire() -> None:
+        await queue.acquire()
+        admitted_at.append(time.monotonic() - start)
+
+    await asyncio.gather(*(acquire() for _ in range(5)))
+
+    # Two requests per window: right away, after one period and after two periods
+    assert [round(admitted / PERIOD) for admitted in admitted_at] == [0, 0, 1, 1, 2]
+    assert all(later - earlier >= PERIOD * 0.9 for earlier, later in zip(admitted_at, admitted_at[2:], strict=False))
+    assert queue.stats.admitted == 5
+    assert queue.stats.waited == 3
+    assert queue.stats.max_queue_depth == 3
+    assert queue.stats.max_wait_time >= PERIOD * 1.9
+    assert queue.queue_depth == 0
+
+
+async def test_priority_ordering():
+    queue = RateLimitQueue("test", limit=1, period=PERIOD / 4)
+    await queue.acquire()
+    order: list[str] = []
+
+    async def acquire(name: str, priority: RateLimitPriority) -> None:
+        await queue.acquire(priority)
+        order.append(name)
+
+    tasks = [
+        asyncio.create_task(acquire("background", RateLimitPriority.BACKGROUND)),
+        asyncio.create_task(acquire("normal 1", RateLimitPriority.NORMAL)),
+        asyncio.create_task(acquire("interactive", RateLimitPriority.INTERACTIVE)),
+        asyncio.create_task(acquire("normal 2", RateLimitPriority.NORMAL)),
+    ]
+    await asyncio.gather(*tasks)
+
+    # By priority, and in the order of arrival within the same priority
+    assert order == ["interactive", "normal 1", "normal 2", "background"]
+
+
+async def test_new_request_does_not_overtake_queued_ones():
+    queue = RateLimitQueue("test", limit=1, period=PERIOD / 2)
+    await queue.acquire()
+    order: list[str] = []
+
+    async def acquire(name: str) -> None:
+        await queue.acquire()
+        order.append(name)
+
+    queued = asyncio.create_task(acquire("queued"))
+    await asyncio.sleep(PERIOD)
+    # The window has a free slot by now, but the queued request wasn't admitted yet
+    await asyncio.gather(queued, acquire("new"))
+
+    assert order == ["queued", "new"]
+
+
+async def test_max_wait_rejection():
+    queue = RateLimitQueue("test", limit=1, period=PERIOD, max_wait=PERIOD / 4, err_msg="Too many requests")
+    await queue.acquire()
+
+    with pytest.raises(RateLimitExceededError, match="Too many requests") as exc_info:
+        await queue.acquire()
+
+    assert exc_info.value.key == "test"
+    assert exc_info.value.closest_expiration <= time.time() + PERIOD
+    assert queue.stats.rejected == 1
+    assert queue.stats.admitted == 1
+    assert queue.queue_depth == 0
+
+
+async def test_rejected_request_does_not_take_a_slot():
+    queue = RateLimitQueue("test", limit=1, period=PERIOD, max_wait=PERIOD / 4)
+    await queue.acquire()
+    with pytest.raises(RateLimitExceededError):
+        await queue.acquire()
+
+    # Admitted right away once the first request leaves the window, as if the rejected one was never made
+    await asyncio.sleep(PERIOD)
+    await queue.acquire()
+    assert queue.stats.admitted == 2
+    assert queue.stats.waited == 0
+
+
+async def test_cancelled_waiter_is_skipped():
+    queue = RateLimitQueue("test", limit=1, period=PERIOD / 2)
+    await queue.acquire()
+
+    cancelled = asyncio.create_task(queue.acquire(RateLimitPriority.INTERACTIVE))
+    waiting = asyncio.create_task(queue.acquire(RateLimitPriority.BACKGROUND))
+    await asyncio.sleep(0)
+    assert queue.queue_depth == 2
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    assert queue.queue_depth == 1
+
+    async with asyncio.timeout(PERIOD * 2):
+        await waiting
+    assert cancelled.cancelled()
+    assert queue.stats.admitted == 2
+    assert queue.stats.waited == 1
+    assert queue.queue_depth == 0
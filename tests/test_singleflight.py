@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from src.utils.singleflight import SingleFlight
+
+
+class FetchError(Exception):
+    pass
+
+
+async def test_concurrent_calls_share_one_fetch():
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    tasks = [asyncio.create_task(flight.do("key", fetch)) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert "key" in flight
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == 1
+    assert [value for value, _ in results] == [1] * 5
+    # Only the first caller ran the call, the rest joined it
+    assert [shared for _, shared in results] == [False, True, True, True, True]
+    assert len(flight) == 0
+
+
+async def test_different_keys_run_separately():
+    flight: SingleFlight[str, str] = SingleFlight()
+
+    async def fetch(key: str) -> str:
+        await asyncio.sleep(0)
+        return key
+
+    results = await asyncio.gather(flight.do("a", lambda: fetch("a")), flight.do("b", lambda: fetch("b")))
+    assert results == [("a", False), ("b", False)]
+
+
+async def test_sequential_calls_fetch_again():
+    flight: SingleFlight[str, int] = SingleFlight()
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await flight.do("key", fetch) == (1, False)
+    assert await flight.do("key", fetch) == (2, False)
+
+
+async def test_exception_reaches_every_waiter():
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+
+    async def fetch() -> int:
+        await release.wait()
+        raise FetchError("failed")
+
+    tasks = [asyncio.create_task(flight.do("key", fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert len(results) == 3
+    assert all(isinstance(result, FetchError) for result in results)
+
+
+async def test_key_is_released_after_failure():
+    flight: SingleFlight[str, int] = SingleFlight()
+
+    async def fail() -> int:
+        raise FetchError("failed")
+
+    async def succeed() -> int:
+        return 1
+
+    with pytest.raises(FetchError):
+        await flight.do("key", fail)
+    assert "key" not in flight
+    # The failure isn't shared with the later callers
+    assert await flight.do("key", succeed) == (1, False)
+
+
+async def test_cancelled_caller_does_not_cancel_the_call():
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+
+    async def fetch() -> int:
+        await release.wait()
+        return 1
+
+    first = asyncio.create_task(flight.do("key", fetch))
+    second = asyncio.create_task(flight.do("key", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == (1, True)
+    assert first.cancelled()
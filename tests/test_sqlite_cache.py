@@ -0,0 +1,120 @@
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+
+from src.utils.sqlite_cache import SQLiteCache
+
+TTL = 0.05
+
+
+@pytest.fixture()
+async def cache(tmp_path: Path) -> AsyncIterator[SQLiteCache]:
+    cache = SQLiteCache(tmp_path / "cache.db")
+    yield cache
+    await cache.close()
+
+
+async def test_set_and_get(cache: SQLiteCache):
+    await cache.set("key", {"value": [1, 2]}, namespace="test")
+
+    assert await cache.get("key", namespace="test") == {"value": [1, 2]}
+    assert await cache.get("key", namespace="other") is None
+    assert await cache.get("missing", namespace="test") is None
+
+
+async def test_ttl_expiry(cache: SQLiteCache):
+    await cache.set("expiring", 1, ttl=TTL)
+    await cache.set("kept", 2)
+    assert await cache.exists("expiring")
+
+    await asyncio.sleep(TTL * 2)
+    assert await cache.get("expiring") is None
+    assert not await cache.exists("expiring")
+    assert await cache.get("kept") == 2
+
+
+async def test_expired_keys_are_kept_until_compaction(cache: SQLiteCache):
+    await cache.multi_set([("a", 1), ("b", 2)], ttl=TTL)
+    await cache.set("kept", 3)
+    await asyncio.sleep(TTL * 2)
+
+    # Expired keys are only ignored on reads, until they're compacted
+    assert len(await cache.raw("SELECT key FROM cache")) == 3
+    assert await cache.compact() == 2
+    assert [key for (key,) in await cache.raw("SELECT key FROM cache")] == ["kept"]
+    assert await cache.compact() == 0
+
+
+async def test_compaction_loop(tmp_path: Path):
+    cache = SQLiteCache(tmp_path / "cache.db", compaction_interval=TTL)
+    try:
+        await cache.set("expiring", 1, ttl=TTL / 2)
+        await asyncio.sleep(TTL * 3)
+        assert await cache.raw("SELECT key FROM cache") == []
+    finally:
+        await cache.close()
+
+
+async def test_multi_get_and_multi_set(cache: SQLiteCache):
+    await cache.multi_set([("a", 1), ("b", None), ("c", "three")], namespace="test")
+    await cache.set("expiring", 4, ttl=TTL, namespace="test")
+    await asyncio.sleep(TTL * 2)
+
+    # In the order of the keys, with the missing and expired ones being None
+    values = await cache.multi_get(["c", "missing", "a", "expiring", "b"], namespace="test")
+    assert values == ["three", None, 1, None, None]
+    assert await cache.multi_get([], namespace="test") == []
+
+
+async def test_multi_set_ttl(cache: SQLiteCache):
+    await cache.multi_set([("a", 1), ("b", 2)], ttl=TTL)
+    assert await cache.multi_get(["a", "b"]) == [1, 2]
+
+    await asyncio.sleep(TTL * 2)
+    assert await cache.multi_get(["a", "b"]) == [None, None]
+
+
+async def test_clear_namespace_escapes_like_wildcards(cache: SQLiteCache):
+    for namespace in ("tvdb_series", "tvdbXseries", "tvdb_series_2", "100%", "1000", "back\\slash", "backXslash"):
+        await cache.set("key", namespace, namespace=namespace)
+
+    # Neither "_" nor "%" matches any other character, and the namespace is still a prefix
+    await cache.clear(namespace="tvdb_series")
+    await cache.clear(namespace="100%")
+    await cache.clear(namespace="back\\slash")
+
+    keys = sorted(key for (key,) in await cache.raw("SELECT key FROM cache"))
+    assert keys == ["1000key", "backXslashkey", "tvdbXserieskey"]
+
+
+async def test_clear_everything(cache: SQLiteCache):
+    await cache.multi_set([("a", 1), ("b", 2)], namespace="test")
+    await cache.clear()
+
+    assert await cache.is_empty()
+
+
+async def test_is_empty(cache: SQLiteCache):
+    assert await cache.is_empty()
+
+    await cache.set("expiring", 1, ttl=TTL)
+    assert not await cache.is_empty()
+    # The expired (not yet compacted) keys don't count
+    await asyncio.sleep(TTL * 2)
+    assert await cache.is_empty()
+
+    await cache.set("kept", 1)
+    assert not await cache.is_empty()
+
+
+async def test_values_survive_reopening(cache: SQLiteCache):
+    await cache.set("key", "value", namespace="test")
+    await cache.close()
+
+    reopened = SQLiteCache(cache.db_file)
+    try:
+        assert await reopened.get("key", namespace="test") == "value"
+    finally:
+        await reopened.close()
@@ -0,0 +1,155 @@
+import asyncio
+import hashlib
+from datetime import UTC, datetime, timedelta
+
+import aiohttp
+import pytest
+from aiocache import SimpleMemoryCache
+
+from src.db_adapters.api_token import api_token_set
+from src.tvdb import Series, TvdbClient
+from src.tvdb.auth import TokenManager
+from src.tvdb.errors import InvalidApiKeyError, TokenRejectedError
+from src.utils.database import get_db_session
+from tests.conftest import ServeStandIn
+from tools.tvdb_stand_in import Faults, StandIn, SyntheticData
+
+
+async def test_token_is_reused(serve_stand_in: ServeStandIn):
+    stand_in = StandIn(None)
+    url = await serve_stand_in(stand_in)
+    async with aiohttp.ClientSession() as session:
+        manager = TokenManager(session, url / "login", "key", persist=False)
+        token = await manager.get_token()
+        assert await manager.get_token() == token
+
+    assert stand_in.stats.logins == 1
+
+
+async def test_concurrent_callers_share_login(serve_stand_in: ServeStandIn):
+    stand_in = StandIn(None)
+    url = await serve_stand_in(stand_in)
+    async with aiohttp.ClientSession() as session:
+        manager = TokenManager(session, url / "login", "key", persist=False)
+        tokens = await asyncio.gather(*(manager.get_token() for _ in range(5)))
+
+    assert len(set(tokens)) == 1
+    assert stand_in.stats.logins == 1
+
+
+async def test_invalid_api_key(serve_stand_in: ServeStandIn):
+    url = await serve_stand_in(StandIn(None))
+    async with aiohttp.ClientSession() as session:
+        manager = TokenManager(session, url / "login", "", persist=False)
+        with pytest.raises(InvalidApiKeyError):
+            await manager.get_token()
+
+
+async def test_expiry_is_read_from_token(serve_stand_in: ServeStandIn):
+    url = await serve_stand_in(StandIn(None, faults=Faults(token_lifetime=timedelta(days=3).total_seconds())))
+    async with aiohttp.ClientSession() as session:
+        manager = TokenManager(session, url / "login", "key", persist=False)
+        await manager.get_token()
+
+    assert manager.expires_at is not None
+    assert abs(manager.expires_at - (datetime.now(UTC) + timedelta(days=3))) < timedelta(minutes=1)
+
+
+async def test_token_is_refreshed_before_expiry(serve_stand_in: ServeStandIn):
+    stand_in = StandIn(None)
+    url = await serve_stand_in(stand_in)
+    async with aiohttp.ClientSession() as session:
+        manager = TokenManager(session, url / "login", "key", persist=False)
+        token = await manager.get_token()
+        # Still valid, but within the refresh margin
+        manager.expires_at = datetime.now(UTC) + TokenManager.REFRESH_MARGIN / 2
+        new_token = await manager.get_token()
+
+    assert new_token != token
+    assert stand_in.stats.logins == 2
+
+
+async def test_short_lived_token_is_refreshed_on_each_use(serve_stand_in: ServeStandIn):
+    stand_in = StandIn(None, faults=Faults(token_lifetime=60 * 60))
+    url = await serve_stand_in(stand_in)
+    async with aiohttp.ClientSession() as session:
+        manager = TokenManager(session, url / "login", "key", persist=False)
+        await manager.get_token()
+        await manager.get_token()
+
+    assert stand_in.stats.logins == 2
+
+
+@pytest.mark.usefixtures("database")
+async def test_token_is_persisted(serve_stand_in: ServeStandIn):
+    stand_in = StandIn(None)
+    url = await serve_stand_in(stand_in)
+    async with aiohttp.ClientSession() as session:
+        token = await TokenManager(session, url / "login", "key").get_token()
+        # A new manager (e.g. after a restart) uses the stored token
+        manager = TokenManager(session, url / "login", "key")
+        assert await manager.get_token() == token
+        assert manager.logins == 0
+
+    assert stand_in.stats.logins == 1
+
+
+@pytest.mark.usefixtures("database")
+async def test_token_of_other_api_key_is_not_used(serve_stand_in: ServeStandIn):
+    stand_in = StandIn(None)
+    url = await serve_stand_in(stand_in)
+    async with aiohttp.ClientSession() as session:
+        token = await TokenManager(session, url / "login", "key").get_token()
+        assert await TokenManager(session, url / "login", "other-key").get_token() != token
+
+    assert stand_in.stats.logins == 2
+
+
+@pytest.mark.usefixtures("database")
+async def test_expiring_stored_token_is_replaced(serve_stand_in: ServeStandIn):
+    stand_in = StandIn(None)
+    url = await serve_stand_in(stand_in)
+    async with aiohttp.ClientSession() as session:
+        manager = TokenManager(session, url / "login", "key")
+        stored = "expiring"
+        async with get_db_session() as db_session:
+            await api_token_set(
+                db_session, TokenManager.SERVICE, hashlib.sha256(b"key").hexdigest(), stored, datetime.now(UTC)
+            )
+
+        token = await manager.get_token()
+        assert token != stored
+        # The new token replaced the stored one
+        assert await TokenManager(session, url / "login", "key").get_token() == token
+
+    assert stand_in.stats.logins == 1
+
+
+async def test_rejected_token_is_replaced_once(serve_stand_in: ServeStandIn):
+    stand_in = StandIn(None, synthetic=SyntheticData())
+    await serve_stand_in(stand_in)
+    client = TvdbClient(SimpleMemoryCache(), persist_token=False)
+    try:
+        await Series.fetch(1, client)
+        stand_in.revoke_tokens()
+        series = await Series.fetch(2, client)
+    finally:
+        await client.close()
+
+    assert series.id == 2
+    assert stand_in.stats.unauthorized == 1
+    assert stand_in.stats.logins == 2
+
+
+async def test_rejected_new_token_is_not_replaced_again(serve_stand_in: ServeStandIn):
+    stand_in = StandIn(None, synthetic=SyntheticData(), faults=Faults(unauthorized_rate=1))
+    await serve_stand_in(stand_in)
+    client = TvdbClient(SimpleMemoryCache(), persist_token=False)
+    try:
+        with pytest.raises(TokenRejectedError):
+            await Series.fetch(1, client)
+    finally:
+        await client.close()
+
+    assert stand_in.stats.unauthorized == 2
+    assert stand_in.stats.logins == 2
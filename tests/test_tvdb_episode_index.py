@@ -0,0 +1,109 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from aiocache import SimpleMemoryCache
+
+from src.tvdb import Series, TvdbClient
+from src.tvdb.episode_index import EpisodeIndex, UNKNOWN
+from src.tvdb.generated_models import EpisodeBaseRecord, SeriesBaseRecord
+
+TODAY = datetime.now(UTC).date()
+PAST = (TODAY - timedelta(days=30)).isoformat()
+FUTURE = (TODAY + timedelta(days=30)).isoformat()
+
+
+def _episode(episode_id: int | None, season: int, number: int, aired: str | None = PAST) -> EpisodeBaseRecord:
+    return EpisodeBaseRecord.model_validate(
+        {"id": episode_id, "seasonNumber": season, "number": number, "aired": aired, "name": f"Episode {episode_id}"}
+    )
+
+
+# Out of order, with specials (season 0), a gap in the numbering of season 2 and an unaired season 3
+EPISODES = [
+    _episode(21, 2, 1),
+    _episode(11, 1, 1),
+    _episode(31, 3, 1, FUTURE),
+    _episode(1, 0, 1),
+    _episode(12, 1, 2),
+    _episode(24, 2, 4, None),
+    _episode(23, 2, 3),
+    _episode(13, 1, 3, "not a date"),
+]
+
+
+@pytest.fixture()
+def index() -> EpisodeIndex:
+    return EpisodeIndex(EPISODES)
+
+
+def test_rows_are_ordered_by_season_and_number(index: EpisodeIndex):
+    assert len(index) == len(EPISODES)
+    assert list(index.ids) == [1, 11, 12, 13, 21, 23, 24, 31]
+    assert [EPISODES[position].id for position in index.positions] == list(index.ids)
+    assert list(index.seasons) == [0, 1, 1, 1, 2, 2, 2, 3]
+    assert list(index.numbers) == [1, 1, 2, 3, 1, 3, 4, 1]
+    assert index.air_dates[3] == UNKNOWN
+
+
+def test_season_rows(index: EpisodeIndex):
+    assert index.season_numbers == [0, 1, 2, 3]
+    assert index.season_rows(0) == range(1)
+    assert index.season_rows(1) == range(1, 4)
+    assert index.season_rows(2) == range(4, 7)
+    assert index.season_rows(3) == range(7, 8)
+    assert index.season_rows(4) == range(0)
+
+
+@pytest.mark.parametrize(
+    ("season", "number", "row"),
+    [
+        (0, 1, 0),
+        (1, 1, 1),
+        (1, 3, 3),
+        # Found by the binary search, after the gap in the numbering
+        (2, 3, 5),
+        (2, 4, 6),
+        (3, 1, 7),
+        (2, 2, None),
+        (1, 4, None),
+        (1, 0, None),
+        (5, 1, None),
+    ],
+)
+def test_find(index: EpisodeIndex, season: int, number: int, row: int | None):
+    assert index.find(season, number) == row
+
+
+def test_last_aired(index: EpisodeIndex):
+    # The episodes without a (valid) air date, and the future ones, don't count as aired
+    assert index.last_aired() == 5
+    assert index.aired_rows() == [0, 1, 2, 4, 5]
+
+
+def test_last_aired_without_aired_episodes():
+    assert EpisodeIndex([_episode(1, 1, 1, FUTURE), _episode(2, 1, 2, None)]).last_aired() is None
+    assert EpisodeIndex([]).last_aired() is None
+
+
+def test_missing_ids_are_unknown():
+    index = EpisodeIndex([_episode(None, 1, 1)])
+    assert list(index.ids) == [UNKNOWN]
+
+
+async def test_series_episode_records_by_row():
+    client = TvdbClient(SimpleMemoryCache(), persist_token=False)
+    try:
+        series = Series(client, SeriesBaseRecord.model_validate({"id": 1, "name": "Series 1"}))
+        assert series.episode_index is None
+        series.set_episode_records(EPISODES)
+
+        index = series.episode_index
+        assert index is not None
+        row = index.find(2, 3)
+        assert row is not None
+        assert series.episode_record(row) is EPISODES[6]
+        episode = series.episode_at(row)
+        assert episode.id == 23
+        assert episode.formatted_name == "S02E03 - Episode 23"
+    finally:
+        await client.close()
@@ -0,0 +1,92 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+from aiocache import SimpleMemoryCache
+
+from src.tvdb import Series, TvdbClient
+from src.tvdb.generated_models import SeriesBaseRecord
+from tests.conftest import ServeStandIn
+from tools.tvdb_stand_in import EPISODES_PAGE_SIZE, FixtureStore, StandIn, SyntheticData
+
+EMPTY_SERIES_ID = 1000
+
+
+@pytest.fixture()
+def stand_in(tmp_path: Path) -> StandIn:
+    """A stand-in generating the records, except for the episodes of `EMPTY_SERIES_ID`, which has none."""
+    fixtures = FixtureStore(tmp_path / "fixtures")
+    body = b'{"status": "success", "data": {"series": null, "episodes": []}, "links": {"next": null}}'
+    fixtures.save(f"/series/{EMPTY_SERIES_ID}/episodes/official", {"page": "0"}, 200, body)
+    return StandIn(fixtures, synthetic=SyntheticData())
+
+
+@pytest.fixture()
+async def client(serve_stand_in: ServeStandIn, stand_in: StandIn) -> AsyncIterator[TvdbClient]:
+    await serve_stand_in(stand_in)
+    client = TvdbClient(SimpleMemoryCache(), persist_token=False)
+    yield client
+    await client.close()
+
+
+def _series(client: TvdbClient, series_id: int) -> Series:
+    return Series(client, SeriesBaseRecord.model_validate({"id": series_id, "name": f"Series {series_id}"}))
+
+
+async def test_pages_are_yielded_until_the_last_one(client: TvdbClient, stand_in: StandIn):
+    # The synthetic series 7 has 1000 episodes, series 1 only 30
+    series = _series(client, 7)
+    pages = [page async for page in series.iter_episode_pages()]
+
+    assert [len(page) for page in pages] == [EPISODES_PAGE_SIZE, EPISODES_PAGE_SIZE]
+    assert [episode.id for page in pages for episode in page] == list(range(70_000, 71_000))
+    # There's no request for a page past the last one
+    assert stand_in.stats.endpoints["series"] == 2
+
+    assert [len(page) async for page in _series(client, 1).iter_episode_pages()] == [30]
+    assert stand_in.stats.endpoints["series"] == 3
+
+
+async def test_pages_are_fetched_lazily(client: TvdbClient, stand_in: StandIn):
+    series = _series(client, 7)
+    async for page in series.iter_episode_pages():
+        assert page[0].id == 70_000
+        break
+
+    assert stand_in.stats.endpoints["series"] == 1
+
+
+async def test_pages_are_cached_separately(client: TvdbClient, stand_in: StandIn):
+    series = _series(client, 7)
+    async for _ in series.iter_episode_pages(language="eng"):
+        break
+    client.model_cache.clear()
+
+    # Only the second page is fetched
+    pages = [page async for page in series.iter_episode_pages(language="eng")]
+    assert len(pages) == 2
+    assert pages[0][0].name == "Episode 1x01 of series 7 (eng)"
+    assert stand_in.stats.endpoints["series"] == 2
+    assert client.cache_stats.hits == 1
+
+    keys = ["7_official_eng_0", "7_official_eng_1", "7_official_eng_2", "7_official_0"]
+    cached = await client.cache.multi_get(keys, namespace="tvdb_episodes")
+    assert [value is not None for value in cached] == [True, True, False, False]
+
+
+async def test_series_without_episodes(client: TvdbClient, stand_in: StandIn):
+    series = _series(client, EMPTY_SERIES_ID)
+    assert [page async for page in series.iter_episode_pages()] == []
+
+    await series.fetch_episodes()
+    assert series.episode_index is None
+    assert stand_in.stats.endpoints["series"] == 1
+
+
+async def test_fetch_episodes_collects_all_pages(client: TvdbClient):
+    series = _series(client, 7)
+    await series.fetch_episodes()
+
+    assert series.episode_index is not None
+    assert len(series.episode_index) == 2 * EPISODES_PAGE_SIZE
+    assert [episode.id async for episode in series.iter_episodes()][-1] == 70_999
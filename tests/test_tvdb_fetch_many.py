@@ -0,0 +1,99 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+from aiocache import SimpleMemoryCache
+
+from src.tvdb import Movie, Series, TvdbClient
+from src.tvdb.errors import InvalidIdError, NotFoundError
+from tests.conftest import ServeStandIn
+from tools.tvdb_stand_in import Faults, FixtureStore, StandIn, SyntheticData
+
+MISSING_ID = 999
+
+
+@pytest.fixture()
+def stand_in(tmp_path: Path) -> StandIn:
+    """A slow stand-in generating the records, except for the series and movie with `MISSING_ID`."""
+    fixtures = FixtureStore(tmp_path / "fixtures")
+    body = b'{"status": "failure", "message": "NotFoundException", "data": null}'
+    fixtures.save(f"/series/{MISSING_ID}", {}, 404, body)
+    fixtures.save(f"/movies/{MISSING_ID}", {}, 404, body)
+    return StandIn(fixtures, synthetic=SyntheticData(), faults=Faults(latency=0.02))
+
+
+@pytest.fixture()
+async def client(serve_stand_in: ServeStandIn, stand_in: StandIn) -> AsyncIterator[TvdbClient]:
+    await serve_stand_in(stand_in)
+    client = TvdbClient(SimpleMemoryCache(), persist_token=False)
+    yield client
+    await client.close()
+
+
+def _track_concurrency(client: TvdbClient, monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Count the requests to the API running at the same time, returning [running, peak]."""
+    counts = [0, 0]
+    request_raw = client.request_raw
+
+    async def _request_raw(*args, **kwargs) -> bytes:
+        counts[0] += 1
+        counts[1] = max(counts)
+        try:
+            return await request_raw(*args, **kwargs)
+        finally:
+            counts[0] -= 1
+
+    monkeypatch.setattr(client, "request_raw", _request_raw)
+    return counts
+
+
+async def test_concurrency_is_bounded(client: TvdbClient, stand_in: StandIn, monkeypatch: pytest.MonkeyPatch):
+    counts = _track_concurrency(client, monkeypatch)
+    results = await client.fetch_many(Series, range(1, 21), concurrency=4)
+
+    assert all(isinstance(result, Series) for result in results)
+    assert counts[1] == 4
+    assert stand_in.stats.endpoints["series"] == 20
+
+
+async def test_order_is_preserved(client: TvdbClient):
+    media_ids = [7, 3, 11, 1, 5, 2]
+    results = await client.fetch_many(Movie, media_ids, extended=True, concurrency=3)
+
+    assert [result.id if isinstance(result, Movie) else result for result in results] == media_ids
+
+
+async def test_errors_are_per_item(client: TvdbClient):
+    results = await client.fetch_many(Series, [1, MISSING_ID, "abc", "series-2"])
+
+    assert isinstance(results[0], Series)
+    assert results[0].id == 1
+    assert isinstance(results[1], NotFoundError)
+    assert isinstance(results[2], InvalidIdError)
+    assert isinstance(results[3], Series)
+    assert results[3].id == 2
+
+
+async def test_cached_items_dont_reach_the_api(client: TvdbClient, stand_in: StandIn, monkeypatch: pytest.MonkeyPatch):
+    await Series.fetch(1, client, extended=True)
+    await Series.fetch(2, client, extended=True)
+    client.model_cache.clear()
+    counts = _track_concurrency(client, monkeypatch)
+
+    # The extended records cover the base ones too
+    results = await client.fetch_many(Series, [1, 2, 3])
+    assert [result.id for result in results if isinstance(result, Series)] == [1, 2, 3]
+    assert stand_in.stats.endpoints["series"] == 3
+    assert counts[1] == 1
+
+    # Now all of them come from the model cache
+    await client.fetch_many(Series, [1, 2, 3])
+    assert stand_in.stats.endpoints["series"] == 3
+    assert client.cache_stats.model_hits == 3
+
+
+async def test_duplicate_ids_are_fetched_once(client: TvdbClient, stand_in: StandIn):
+    results = await client.fetch_many(Series, [1, 1, "1", "series-1"])
+
+    assert [result.id for result in results if isinstance(result, Series)] == [1, 1, 1, 1]
+    assert stand_in.stats.endpoints["series"] == 1
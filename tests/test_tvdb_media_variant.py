@@ -0,0 +1,153 @@
+import pytest
+
+from src.tvdb import FetchMeta
+from src.tvdb.client import CachedMediaRecord, MediaVariant
+from src.tvdb.errors import BadCallError
+from src.utils import json_codec
+
+BASE = MediaVariant()
+EXTENDED = MediaVariant(extended=True)
+SHORT = MediaVariant(extended=True, short=True)
+TRANSLATIONS = MediaVariant(extended=True, metas=frozenset({FetchMeta.TRANSLATIONS}))
+SHORT_TRANSLATIONS = MediaVariant(extended=True, short=True, metas=frozenset({FetchMeta.TRANSLATIONS}))
+EPISODES = MediaVariant(extended=True, metas=frozenset({FetchMeta.EPISODES}))
+BOTH = MediaVariant(extended=True, metas=frozenset({FetchMeta.TRANSLATIONS, FetchMeta.EPISODES}))
+
+
+@pytest.mark.parametrize(
+    ("variant", "other", "covers"),
+    [
+        (BASE, BASE, True),
+        (EXTENDED, BASE, True),
+        (SHORT, BASE, True),
+        (BASE, EXTENDED, False),
+        (BASE, SHORT, False),
+        # The full record holds the fields omitted from the short one, but not the other way around
+        (EXTENDED, SHORT, True),
+        (SHORT, EXTENDED, False),
+        (SHORT, SHORT, True),
+        (TRANSLATIONS, EXTENDED, True),
+        (TRANSLATIONS, SHORT, True),
+        (TRANSLATIONS, TRANSLATIONS, True),
+        (TRANSLATIONS, SHORT_TRANSLATIONS, True),
+        (SHORT_TRANSLATIONS, TRANSLATIONS, False),
+        (SHORT_TRANSLATIONS, SHORT, True),
+        (EXTENDED, TRANSLATIONS, False),
+        (TRANSLATIONS, EPISODES, False),
+        (BOTH, TRANSLATIONS, True),
+        (BOTH, EPISODES, True),
+        (BOTH, SHORT_TRANSLATIONS, True),
+        (TRANSLATIONS, BOTH, False),
+    ],
+)
+def test_covers(variant: MediaVariant, other: MediaVariant, covers: bool):  # noqa: FBT001
+    assert variant.covers(other) is covers
+
+
+@pytest.mark.parametrize(
+    ("variant", "other", "merged"),
+    [
+        (BASE, BASE, BASE),
+        (BASE, EXTENDED, EXTENDED),
+        (SHORT, BASE, SHORT),
+        (SHORT, EXTENDED, EXTENDED),
+        (SHORT, SHORT, SHORT),
+        (SHORT, SHORT_TRANSLATIONS, SHORT_TRANSLATIONS),
+        (SHORT_TRANSLATIONS, EXTENDED, TRANSLATIONS),
+        (TRANSLATIONS, EPISODES, BOTH),
+        (EPISODES, SHORT_TRANSLATIONS, BOTH),
+    ],
+)
+def test_merge(variant: MediaVariant, other: MediaVariant, merged: MediaVariant):
+    assert variant.merge(other) == merged
+    assert other.merge(variant) == merged
+    assert merged.covers(variant)
+    assert merged.covers(other)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "variant", "cache_key", "query"),
+    [
+        ({"extended": False, "short": None, "meta": None}, BASE, "1", None),
+        ({"extended": True, "short": None, "meta": None}, EXTENDED, "1_False", {"short": "false"}),
+        ({"extended": True, "short": True, "meta": None}, SHORT, "1_True", {"short": "true"}),
+        (
+            {"extended": True, "short": False, "meta": FetchMeta.TRANSLATIONS},
+            TRANSLATIONS,
+            "1_False_translations",
+            {"short": "false", "meta": "translations"},
+        ),
+    ],
+)
+def test_from_fetch_args(
+    kwargs: dict[str, object], variant: MediaVariant, cache_key: str, query: dict[str, str] | None
+):
+    assert MediaVariant.from_fetch_args(**kwargs) == variant  # pyright: ignore[reportArgumentType]
+    assert variant.cache_key(1) == cache_key
+    assert variant.query() == query
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"extended": False, "short": True, "meta": None}, {"extended": False, "short": None, "meta": "episodes"}],
+)
+def test_from_fetch_args_rejects_non_extended_options(kwargs: dict[str, object]):
+    with pytest.raises(BadCallError):
+        MediaVariant.from_fetch_args(**kwargs)  # pyright: ignore[reportArgumentType]
+
+
+def _record(variant: MediaVariant, fetched_at: float, **data: object) -> CachedMediaRecord:
+    response = json_codec.encode({"status": "success", "data": {"id": 1, **data}})
+    return CachedMediaRecord(response, fetched_at=fetched_at, variant=variant, parts_fetched_at={})
+
+
+def _data(record: CachedMediaRecord) -> dict[str, object]:
+    return json_codec.decode(record.response)["data"]
+
+
+def test_merge_records_keeps_parts_not_covered_by_newer():
+    full = _record(TRANSLATIONS, 100, name="Old", characters=["a"], translations={"eng": "Old"})
+    merged = full.merge(_record(SHORT, 200, name="New"))
+
+    assert merged.variant == TRANSLATIONS
+    assert merged.fetched_at == 200
+    assert _data(merged) == {"id": 1, "name": "New", "characters": ["a"], "translations": {"eng": "Old"}}
+    assert merged.parts_fetched_at == {"full": 100, "translations": 100}
+
+
+def test_merge_records_replaces_covered_parts():
+    old = _record(EXTENDED, 100, name="Old", characters=["a"])
+    merged = old.merge(_record(TRANSLATIONS, 200, name="New", characters=["b"], translations={"eng": "New"}))
+
+    assert merged.variant == TRANSLATIONS
+    assert _data(merged) == {"id": 1, "name": "New", "characters": ["b"], "translations": {"eng": "New"}}
+    assert merged.parts_fetched_at == {}
+
+
+@pytest.mark.parametrize(
+    ("variant", "fetched_at"),
+    [
+        # The short and plain variants don't need the kept parts, so they're as fresh as the newest response
+        (BASE, 300),
+        (SHORT, 300),
+        (EXTENDED, 100),
+        (SHORT_TRANSLATIONS, 200),
+        (TRANSLATIONS, 100),
+        (EPISODES, 100),
+        (BOTH, 100),
+    ],
+)
+def test_for_variant(variant: MediaVariant, fetched_at: float):
+    # Full record with episodes fetched at 100, then translations (short) at 200, then short at 300
+    record = _record(EPISODES, 100, characters=["a"], episodes=[])
+    record = record.merge(_record(SHORT_TRANSLATIONS, 200, translations={}))
+    record = record.merge(_record(SHORT, 300))
+    assert record.variant == BOTH
+
+    assert record.for_variant(variant).fetched_at == fetched_at
+    assert record.for_variant(variant).response == record.response
+
+
+def test_for_variant_returns_same_record_when_fresh():
+    record = _record(TRANSLATIONS, 100)
+    assert record.for_variant(SHORT) is record
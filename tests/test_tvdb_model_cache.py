@@ -0,0 +1,115 @@
+from collections.abc import AsyncIterator
+
+import pytest
+from aiocache import SimpleMemoryCache
+
+from src.tvdb import FetchMeta, Series, TvdbClient
+from src.utils.lru import LRUCache
+from tests.conftest import ServeStandIn
+from tools.tvdb_stand_in import StandIn, SyntheticData
+
+
+@pytest.fixture()
+def stand_in() -> StandIn:
+    return StandIn(None, synthetic=SyntheticData())
+
+
+@pytest.fixture()
+async def client(
+    serve_stand_in: ServeStandIn, stand_in: StandIn, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[TvdbClient]:
+    monkeypatch.setattr("src.tvdb.client.TVDB_MODEL_CACHE_SIZE", 2)
+    await serve_stand_in(stand_in)
+    client = TvdbClient(SimpleMemoryCache(), persist_token=False)
+    yield client
+    await client.close()
+
+
+async def test_warm_fetch_reuses_the_validated_model(client: TvdbClient, stand_in: StandIn):
+    first = await Series.fetch(1, client, extended=True, meta=FetchMeta.TRANSLATIONS)
+    second = await Series.fetch(1, client, extended=True, meta=FetchMeta.TRANSLATIONS)
+
+    assert second.data is first.data
+    assert client.cache_stats.model_hits == 1
+    assert client.cache_stats.hits == 0
+    assert stand_in.stats.endpoints["series"] == 1
+
+
+async def test_least_recently_used_model_is_evicted(client: TvdbClient, stand_in: StandIn):
+    for series_id in (1, 2, 1, 3):
+        await Series.fetch(series_id, client)
+    assert len(client.model_cache) == 2
+
+    # Series 2 was the least recently used one, it's validated again from the cached response
+    await Series.fetch(1, client)
+    await Series.fetch(3, client)
+    assert client.cache_stats.model_hits == 3
+    await Series.fetch(2, client)
+    assert client.cache_stats.model_hits == 3
+    assert client.cache_stats.hits == 1
+    assert stand_in.stats.endpoints["series"] == 3
+
+
+async def test_invalidation_discards_the_models(client: TvdbClient, stand_in: StandIn):
+    await Series.fetch(1, client)
+    await Series.fetch(1, client, extended=True)
+    await client.invalidate(Series, [1])
+    assert len(client.model_cache) == 0
+
+    # Served stale from the response cache, while it's being refreshed
+    await Series.fetch(1, client, extended=True)
+    assert client.cache_stats.model_hits == 0
+    assert client.cache_stats.stale_hits == 1
+
+
+async def test_invalidation_keeps_the_other_models(client: TvdbClient):
+    await Series.fetch(1, client)
+    await Series.fetch(11, client)
+    await client.invalidate(Series, [1])
+
+    await Series.fetch(11, client)
+    assert client.cache_stats.model_hits == 1
+
+
+def test_lru_cache_eviction():
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_lru_cache_expiry(monkeypatch: pytest.MonkeyPatch):
+    now = [100.0]
+    monkeypatch.setattr("src.utils.lru.time.monotonic", lambda: now[0])
+    cache: LRUCache[str, int] = LRUCache(10)
+    cache.set("expiring", 1, ttl=5)
+    cache.set("kept", 2)
+
+    now[0] += 5
+    assert cache.get("expiring") is None
+    assert cache.get("kept") == 2
+    assert len(cache) == 1
+
+
+def test_lru_cache_discard_where():
+    cache: LRUCache[tuple[str, str], int] = LRUCache(10)
+    for namespace, key in [("series", "1"), ("series", "1_True"), ("series", "11"), ("movies", "1")]:
+        cache.set((namespace, key), 0)
+
+    assert cache.discard_where(lambda key: key[0] == "series" and key[1].split("_")[0] == "1") == 2
+    assert sorted(key for key in [("series", "1"), ("series", "11"), ("movies", "1")] if key in cache) == [
+        ("movies", "1"),
+        ("series", "11"),
+    ]
+    assert cache.pop(("movies", "1")) == 0
+    assert cache.pop(("movies", "1")) is None
+
+
+def test_lru_cache_invalid_size():
+    with pytest.raises(ValueError, match="positive"):
+        LRUCache(0)
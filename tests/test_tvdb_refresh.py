@@ -0,0 +1,99 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+from aiocache import SimpleMemoryCache
+
+from src.tvdb import Series, TvdbClient
+from tests.conftest import ServeStandIn
+from tools.tvdb_stand_in import Faults, StandIn, SyntheticData
+
+SOFT_TTL = 0.1
+HARD_TTL = 0.5
+
+
+@pytest.fixture()
+def stand_in() -> StandIn:
+    return StandIn(None, synthetic=SyntheticData())
+
+
+@pytest.fixture()
+async def client(
+    serve_stand_in: ServeStandIn, stand_in: StandIn, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[TvdbClient]:
+    monkeypatch.setattr("src.tvdb.client.TVDB_CACHE_SOFT_TTL", SOFT_TTL)
+    monkeypatch.setattr("src.tvdb.client.TVDB_CACHE_HARD_TTL", HARD_TTL)
+    await serve_stand_in(stand_in)
+    client = TvdbClient(SimpleMemoryCache(), persist_token=False)
+    yield client
+    await client.close()
+
+
+async def _refreshed(client: TvdbClient) -> None:
+    async with asyncio.timeout(2):
+        while client.refresh_queue_depth:
+            await asyncio.sleep(0.005)
+
+
+async def test_fresh_response_is_served_from_cache(client: TvdbClient, stand_in: StandIn):
+    await Series.fetch(1, client)
+    client.model_cache.clear()
+    await Series.fetch(1, client)
+
+    assert client.cache_stats.hits == 1
+    assert client.refresh_stats.scheduled == 0
+    assert stand_in.stats.endpoints["series"] == 1
+
+
+async def test_stale_response_is_served_and_refreshed_once(client: TvdbClient, stand_in: StandIn):
+    stand_in.faults = Faults(latency=0.05)
+    await Series.fetch(1, client)
+    await asyncio.sleep(SOFT_TTL)
+
+    # Both are answered right away with the stale response, only the first one schedules a refresh
+    async with asyncio.timeout(0.04):
+        first = await Series.fetch(1, client)
+        second = await Series.fetch(1, client)
+    assert first.id == second.id == 1
+    assert client.cache_stats.stale_hits == 2
+    assert client.refresh_stats.scheduled == 1
+    assert client.refresh_stats.deduplicated == 1
+
+    await _refreshed(client)
+    assert client.refresh_stats.completed == 1
+    assert stand_in.stats.endpoints["series"] == 2
+
+    # The refreshed response is fresh again
+    await Series.fetch(1, client)
+    assert client.cache_stats.stale_hits == 2
+    assert stand_in.stats.endpoints["series"] == 2
+
+
+async def test_failed_refresh_keeps_the_stale_response(
+    client: TvdbClient, stand_in: StandIn, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr("src.tvdb.client.TVDB_RETRY_ATTEMPTS", 0)
+    await Series.fetch(1, client)
+    await asyncio.sleep(SOFT_TTL)
+    stand_in.faults = Faults(error_rate=1, error_statuses=(500,))
+
+    await Series.fetch(1, client)
+    await _refreshed(client)
+    assert client.refresh_stats.failed == 1
+
+    # Still served (and refreshed again) from the stale response
+    stand_in.faults = Faults()
+    assert (await Series.fetch(1, client)).id == 1
+    await _refreshed(client)
+    assert client.refresh_stats.completed == 1
+
+
+async def test_expired_response_is_fetched_again(client: TvdbClient, stand_in: StandIn):
+    await Series.fetch(1, client)
+    await asyncio.sleep(HARD_TTL + 0.05)
+
+    await Series.fetch(1, client)
+    assert client.cache_stats.stale_hits == 0
+    assert client.cache_stats.misses == 2
+    assert client.refresh_stats.scheduled == 0
+    assert stand_in.stats.endpoints["series"] == 2
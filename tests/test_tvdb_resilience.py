@@ -0,0 +1,225 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+
+import aiohttp
+import pytest
+from aiocache import SimpleMemoryCache
+
+from src.tvdb import Series, TvdbClient
+from src.utils.resilience import CircuitOpenError, CircuitState
+from tests.conftest import ServeStandIn
+from tools.tvdb_stand_in import Faults, StandIn, SyntheticData
+
+type MakeClient = Callable[[], TvdbClient]
+
+
+@pytest.fixture()
+def settings(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    """Use short delays and timeouts, with the retries, hedging and circuit breakers disabled unless overridden."""
+    monkeypatch.setattr("src.tvdb.client.TVDB_RETRY_ATTEMPTS", 0)
+    monkeypatch.setattr("src.tvdb.client.TVDB_RETRY_BASE_DELAY", 0.01)
+    monkeypatch.setattr("src.tvdb.client.TVDB_RETRY_MAX_DELAY", 0.05)
+    monkeypatch.setattr("src.tvdb.client.TVDB_HEDGE_DELAY", 0)
+    monkeypatch.setattr("src.tvdb.client.TVDB_CIRCUIT_FAILURE_THRESHOLD", 1000)
+    monkeypatch.setattr("src.tvdb.client.TVDB_CIRCUIT_RESET_TIMEOUT", 0.2)
+    return monkeypatch
+
+
+@pytest.fixture()
+async def make_client(settings: pytest.MonkeyPatch) -> AsyncIterator[MakeClient]:
+    """Create TVDB clients (with the test settings applied), closing them once the test is done."""
+    clients: list[TvdbClient] = []
+
+    def make() -> TvdbClient:
+        client = TvdbClient(SimpleMemoryCache(), persist_token=False)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        await client.close()
+
+
+async def _wait_for(condition: Callable[[], bool]) -> None:
+    async with asyncio.timeout(2):
+        while not condition():
+            await asyncio.sleep(0.005)
+
+
+async def test_circuit_opens_after_consecutive_failures(
+    serve_stand_in: ServeStandIn, settings: pytest.MonkeyPatch, make_client: MakeClient
+):
+    settings.setattr("src.tvdb.client.TVDB_CIRCUIT_FAILURE_THRESHOLD", 3)
+    stand_in = StandIn(None, synthetic=SyntheticData(), faults=Faults(error_rate=1, error_statuses=(500,)))
+    await serve_stand_in(stand_in)
+    client = make_client()
+
+    for series_id in range(1, 4):
+        with pytest.raises(aiohttp.ClientResponseError):
+            await Series.fetch(series_id, client)
+    with pytest.raises(CircuitOpenError):
+        await Series.fetch(4, client)
+
+    breaker = client.circuit_breakers["series"]
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.stats.opened == 1
+    assert breaker.stats.rejected == 1
+    # The rejected request never reached the API
+    assert stand_in.stats.endpoints["series"] == 3
+
+
+async def test_circuit_is_per_endpoint(
+    serve_stand_in: ServeStandIn, settings: pytest.MonkeyPatch, make_client: MakeClient
+):
+    settings.setattr("src.tvdb.client.TVDB_CIRCUIT_FAILURE_THRESHOLD", 1)
+    stand_in = StandIn(None, synthetic=SyntheticData(), faults=Faults(error_rate=1, error_statuses=(500,)))
+    await serve_stand_in(stand_in)
+    client = make_client()
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        await Series.fetch(1, client)
+    stand_in.faults.error_rate = 0
+    assert (await client.search("query", limit=5)) is not None
+    assert client.circuit_breakers["search"].state is CircuitState.CLOSED
+
+
+async def test_half_open_circuit_closes_after_successful_probe(
+    serve_stand_in: ServeStandIn, settings: pytest.MonkeyPatch, make_client: MakeClient
+):
+    settings.setattr("src.tvdb.client.TVDB_CIRCUIT_FAILURE_THRESHOLD", 1)
+    stand_in = StandIn(None, synthetic=SyntheticData(), faults=Faults(error_rate=1, error_statuses=(500,)))
+    await serve_stand_in(stand_in)
+    client = make_client()
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        await Series.fetch(1, client)
+    breaker = client.circuit_breakers["series"]
+    await _wait_for(lambda: breaker.state is CircuitState.HALF_OPEN)
+
+    # Only a single probe is let through while half-open, the other requests are still rejected
+    stand_in.faults = Faults(latency=0.1)
+    probe = asyncio.create_task(Series.fetch(2, client))
+    await _wait_for(lambda: stand_in.stats.endpoints["series"] == 2)
+    with pytest.raises(CircuitOpenError):
+        await Series.fetch(3, client)
+
+    assert (await probe).id == 2
+    assert breaker.state is CircuitState.CLOSED
+    assert (await Series.fetch(3, client)).id == 3
+
+
+async def test_half_open_circuit_reopens_after_failed_probe(
+    serve_stand_in: ServeStandIn, settings: pytest.MonkeyPatch, make_client: MakeClient
+):
+    settings.setattr("src.tvdb.client.TVDB_CIRCUIT_FAILURE_THRESHOLD", 1)
+    stand_in = StandIn(None, synthetic=SyntheticData(), faults=Faults(error_rate=1, error_statuses=(500,)))
+    await serve_stand_in(stand_in)
+    client = make_client()
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        await Series.fetch(1, client)
+    breaker = client.circuit_breakers["series"]
+    await _wait_for(lambda: breaker.state is CircuitState.HALF_OPEN)
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        await Series.fetch(2, client)
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.stats.opened == 2
+    with pytest.raises(CircuitOpenError):
+        await Series.fetch(3, client)
+
+
+async def test_retries_stay_within_budget(
+    serve_stand_in: ServeStandIn, settings: pytest.MonkeyPatch, make_client: MakeClient
+):
+    settings.setattr("src.tvdb.client.TVDB_RETRY_ATTEMPTS", 2)
+    stand_in = StandIn(None, synthetic=SyntheticData(), faults=Faults(error_rate=1, error_statuses=(503,)))
+    await serve_stand_in(stand_in)
+    client = make_client()
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        await Series.fetch(1, client)
+
+    assert stand_in.stats.endpoints["series"] == 3
+    assert client.retry_stats.retried == 2
+    assert client.retry_stats.gave_up == 1
+
+
+async def test_intermittent_failures_are_retried(
+    serve_stand_in: ServeStandIn, settings: pytest.MonkeyPatch, make_client: MakeClient
+):
+    settings.setattr("src.tvdb.client.TVDB_RETRY_ATTEMPTS", 2)
+    stand_in = StandIn(
+        None, synthetic=SyntheticData(), faults=Faults(error_rate=0.3, error_statuses=(500, 502)), seed=1
+    )
+    await serve_stand_in(stand_in)
+    client = make_client()
+
+    results = await asyncio.gather(
+        *(Series.fetch(series_id, client) for series_id in range(1, 21)), return_exceptions=True
+    )
+
+    fetched = [result for result in results if isinstance(result, Series)]
+    assert len(fetched) + client.retry_stats.gave_up == 20
+    assert len(fetched) > client.retry_stats.gave_up
+    # No request was attempted more than 1 + TVDB_RETRY_ATTEMPTS times
+    assert stand_in.stats.endpoints["series"] == 20 + client.retry_stats.retried
+    assert client.retry_stats.retried <= 2 * 20
+
+
+async def test_long_retry_after_is_not_waited_for(
+    serve_stand_in: ServeStandIn, settings: pytest.MonkeyPatch, make_client: MakeClient
+):
+    settings.setattr("src.tvdb.client.TVDB_RETRY_ATTEMPTS", 2)
+    # The stand-in asks to retry the 429 responses after 1s, which is over TVDB_RETRY_MAX_DELAY
+    stand_in = StandIn(None, synthetic=SyntheticData(), faults=Faults(error_rate=1, error_statuses=(429,)))
+    await serve_stand_in(stand_in)
+    client = make_client()
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        await Series.fetch(1, client)
+
+    assert stand_in.stats.endpoints["series"] == 1
+    assert client.retry_stats.retried == 0
+
+
+async def test_hedge_wins_and_primary_is_cancelled(
+    serve_stand_in: ServeStandIn, settings: pytest.MonkeyPatch, make_client: MakeClient
+):
+    settings.setattr("src.tvdb.client.TVDB_HEDGE_DELAY", 0.05)
+    stand_in = StandIn(None, synthetic=SyntheticData(), faults=Faults(latency=5))
+    await serve_stand_in(stand_in)
+    client = make_client()
+
+    fetch = asyncio.create_task(Series.fetch(1, client))
+    # The primary request is stuck, the hedge sent after it gets answered right away
+    await _wait_for(lambda: stand_in.stats.requests == 1)
+    stand_in.faults.latency = 0
+    async with asyncio.timeout(1):
+        assert (await fetch).id == 1
+
+    assert client.hedger.stats.sent == 1
+    assert client.hedger.stats.won == 1
+    await _wait_for(lambda: stand_in.stats.cancelled == 1)
+    assert client.hedger.inflight == 0
+
+
+async def test_primary_wins_and_hedge_is_cancelled(
+    serve_stand_in: ServeStandIn, settings: pytest.MonkeyPatch, make_client: MakeClient
+):
+    settings.setattr("src.tvdb.client.TVDB_HEDGE_DELAY", 0.05)
+    stand_in = StandIn(None, synthetic=SyntheticData(), faults=Faults(latency=0.2))
+    await serve_stand_in(stand_in)
+    client = make_client()
+
+    fetch = asyncio.create_task(Series.fetch(1, client))
+    await _wait_for(lambda: stand_in.stats.requests == 1)
+    # The hedge gets stuck, while the primary request gets answered
+    stand_in.faults.latency = 5
+    async with asyncio.timeout(1):
+        assert (await fetch).id == 1
+
+    assert client.hedger.stats.sent == 1
+    assert client.hedger.stats.won == 0
+    await _wait_for(lambda: stand_in.stats.cancelled == 1)
+    assert client.hedger.inflight == 0
@@ -0,0 +1,181 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+
+import pytest
+from aiocache import SimpleMemoryCache
+
+from src.tvdb import Series, TvdbClient
+from src.tvdb.client import CachedSearchResponse, Episode, canonical_search_query
+from src.tvdb.errors import NotFoundError
+from src.tvdb.title_index import TitleIndex
+from tests.conftest import ServeStandIn
+from tools.tvdb_stand_in import FixtureStore, StandIn, SyntheticData
+
+type MakeClient = Callable[..., TvdbClient]
+
+EMPTY_SEARCH = b'{"status": "success", "data": []}'
+
+
+@pytest.fixture()
+def stand_in(tmp_path: Path) -> StandIn:
+    """A stand-in generating the records, with a search for "nothing" that has no results."""
+    fixtures = FixtureStore(tmp_path / "fixtures")
+    for limit in (1, 5):
+        fixtures.save("/search", {"query": "nothing", "limit": str(limit)}, 200, EMPTY_SEARCH)
+    return StandIn(fixtures, synthetic=SyntheticData())
+
+
+@pytest.fixture()
+async def make_client(serve_stand_in: ServeStandIn, stand_in: StandIn) -> AsyncIterator[MakeClient]:
+    await serve_stand_in(stand_in)
+    clients: list[TvdbClient] = []
+
+    def make(*, title_index: TitleIndex | None = None) -> TvdbClient:
+        client = TvdbClient(SimpleMemoryCache(), persist_token=False, title_index=title_index)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        await client.close()
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("Breaking Bad", "breaking bad"),
+        ("  breaking \t bad ", "breaking bad"),
+        ("BREAKING BAD", "breaking bad"),
+        # Compatibility characters (full width, ligatures) are normalized, the accents are kept
+        ("\uff22\uff52\uff45\uff41\uff4b ﬁsh", "break fish"),
+        ("Pokémon", "pokémon"),
+        ("Straße", "strasse"),
+        ("", ""),
+    ],
+)
+def test_canonical_search_query(query: str, expected: str):
+    assert canonical_search_query(query) == expected
+
+
+@pytest.mark.parametrize(
+    ("fetched_limit", "results", "limit", "covers"),
+    [
+        (5, 5, 1, True),
+        (5, 5, 5, True),
+        (5, 5, 6, False),
+        # Fewer results than requested, there aren't any more of them
+        (5, 3, 50, True),
+        (5, 0, 50, True),
+        (1, 1, 2, False),
+    ],
+)
+def test_cached_search_response_covers(fetched_limit: int, results: int, limit: int, covers: bool):  # noqa: FBT001
+    response = CachedSearchResponse(b"{}", fetched_at=0, limit=fetched_limit, results=results)
+    assert response.covers(limit) is covers
+
+
+async def test_equivalent_queries_share_a_response(make_client: MakeClient, stand_in: StandIn):
+    client = make_client()
+    results = await client.search("Breaking Bad", limit=5)
+    client.model_cache.clear()
+
+    # Served from the response fetched with the larger limit
+    assert [media.id for media in await client.search("  breaking BAD ", limit=2)] == [
+        media.id for media in results[:2]
+    ]
+    assert stand_in.stats.endpoints["search"] == 1
+    # A larger limit can't be served from it
+    await client.search("breaking bad", limit=10)
+    assert stand_in.stats.endpoints["search"] == 2
+
+
+async def test_missing_media_is_negatively_cached(make_client: MakeClient, stand_in: StandIn):
+    stand_in.synthetic = None
+    client = make_client()
+
+    for _ in range(3):
+        with pytest.raises(NotFoundError):
+            await Series.fetch(1, client)
+    # A missing series is missing in all of its variants
+    with pytest.raises(NotFoundError):
+        await Series.fetch(1, client, extended=True)
+
+    assert stand_in.stats.endpoints["series"] == 1
+    assert client.cache_stats.negative_hits == 3
+
+
+async def test_missing_episode_is_negatively_cached(make_client: MakeClient, stand_in: StandIn):
+    client = make_client()
+    # The synthetic series 1 only has 30 episodes
+    for _ in range(2):
+        with pytest.raises(NotFoundError):
+            await Episode.fetch(19_999, client=client)
+
+    assert stand_in.stats.endpoints["episodes"] == 1
+    assert client.cache_stats.negative_hits == 1
+
+
+async def test_negative_cache_expires(make_client: MakeClient, stand_in: StandIn, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("src.tvdb.client.TVDB_NEGATIVE_CACHE_TTL", 0.05)
+    stand_in.synthetic = None
+    client = make_client()
+
+    with pytest.raises(NotFoundError):
+        await Series.fetch(1, client)
+    await asyncio.sleep(0.1)
+    with pytest.raises(NotFoundError):
+        await Series.fetch(1, client)
+
+    assert stand_in.stats.endpoints["series"] == 2
+    assert client.cache_stats.negative_hits == 0
+
+
+async def test_empty_search_is_only_negatively_cached(make_client: MakeClient, stand_in: StandIn):
+    client = make_client()
+
+    assert await client.search("Nothing") == []
+    assert await client.search("nothing ") == []
+    assert stand_in.stats.endpoints["search"] == 1
+    assert client.cache_stats.negative_hits == 1
+    # New movies and series could start matching it at any time
+    assert await client.cache.get("nothing_None", namespace="tvdb_search") is None
+
+
+async def test_search_with_results_is_not_negatively_cached(make_client: MakeClient):
+    client = make_client()
+    assert await client.search("breaking bad", limit=5)
+
+    assert len(client.negative_cache) == 0
+    cached = await client.cache.get("breaking bad_None", namespace="tvdb_search")
+    assert isinstance(cached, CachedSearchResponse)
+    assert cached.limit == 5
+
+
+async def test_search_answered_from_title_index(make_client: MakeClient, stand_in: StandIn, tmp_path: Path):
+    index = TitleIndex(tmp_path / "titles.db")
+    record = {"id": "series-5", "objectID": "series-5", "tvdb_id": "5", "type": "series", "name": "Breaking Bad"}
+    await index.add("series", 5, ["Breaking Bad"], record)
+    client = make_client(title_index=index)
+
+    results = await client.search("Breaking Bad")
+    assert [(type(media), media.id) for media in results] == [(Series, 5)]
+    assert "search" not in stand_in.stats.endpoints
+    assert client.cache_stats.local_hits == 1
+
+
+async def test_exact_local_match_is_ranked_before_api_results(
+    make_client: MakeClient, stand_in: StandIn, tmp_path: Path
+):
+    index = TitleIndex(tmp_path / "titles.db")
+    record = {"id": "series-5", "objectID": "series-5", "tvdb_id": "5", "type": "series", "name": "Breaking Bad"}
+    await index.add("series", 5, ["Breaking Bad"], record)
+    client = make_client(title_index=index)
+
+    # Not enough local matches for the limit, so the API gets searched as well
+    results = await client.search("breaking bad", limit=3)
+    assert stand_in.stats.endpoints["search"] == 1
+    assert client.cache_stats.local_hits == 0
+    assert len(results) == 3
+    assert results[0].id == 5
+    assert [media.id for media in results].count(5) == 1
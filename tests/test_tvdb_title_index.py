@@ -0,0 +1,127 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+
+from src.tvdb.title_index import TitleIndex, normalize_title
+from src.utils import json_codec
+
+
+@pytest.fixture()
+async def index(tmp_path: Path) -> AsyncIterator[TitleIndex]:
+    index = TitleIndex(tmp_path / "titles.db")
+    yield index
+    await index.close()
+
+
+async def _populate(index: TitleIndex) -> None:
+    await index.add("series", 1, ["Breaking Bad", "Breaking Bad (deu)"], {"name": "Breaking Bad"})
+    await index.add("series", 2, ["Better Call Saul", None, ""], {"name": "Better Call Saul"})
+    await index.add("movie", 3, ["El Camino: A Breaking Bad Movie"], {"name": "El Camino"})
+    await index.add("series", 4, ["Pokémon"], {"name": "Pokémon"})
+
+
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        ("Breaking Bad", "breaking bad"),
+        ("  Breaking   BAD!  ", "breaking bad"),
+        ("Pokémon", "pokemon"),
+        ("Marvel's Agents of S.H.I.E.L.D.", "marvel s agents of s h i e l d"),
+        ("...", ""),
+    ],
+)
+def test_normalize_title(title: str, expected: str):
+    assert normalize_title(title) == expected
+
+
+async def test_exact_match_scores_one(index: TitleIndex):
+    await _populate(index)
+    matches = await index.search("breaking BAD")
+
+    assert matches[0].media_id == 1
+    assert matches[0].title == "breaking bad"
+    assert matches[0].score == 1
+    assert json_codec.decode(matches[0].record) == {"name": "Breaking Bad"}
+    # Sharing a lot of trigrams, but only similar to the query
+    assert all(match.score < 1 for match in matches[1:])
+    assert [match.score for match in matches] == sorted((match.score for match in matches), reverse=True)
+
+
+async def test_search_tolerates_typos(index: TitleIndex):
+    await _populate(index)
+    matches = await index.search("braking bda", limit=1)
+
+    assert [(match.kind, match.media_id) for match in matches] == [("series", 1)]
+    assert 0.8 < matches[0].score < 1
+
+
+async def test_search_ignores_accents(index: TitleIndex):
+    await _populate(index)
+    matches = await index.search("pokemon", limit=1)
+
+    assert [(match.media_id, match.score) for match in matches] == [(4, 1)]
+
+
+async def test_search_returns_one_match_per_media(index: TitleIndex):
+    await _populate(index)
+    matches = await index.search("breaking bad", limit=10)
+
+    keys = [(match.kind, match.media_id) for match in matches]
+    assert len(keys) == len(set(keys))
+    assert ("series", 1) in keys
+    assert ("movie", 3) in keys
+
+
+async def test_search_filters_by_kind(index: TitleIndex):
+    await _populate(index)
+    matches = await index.search("breaking bad", kind="movie")
+
+    assert [(match.kind, match.media_id) for match in matches] == [("movie", 3)]
+
+
+async def test_short_queries_only_match_exactly(index: TitleIndex):
+    await index.add("series", 5, ["Up"], {"name": "Up"})
+    await index.add("series", 6, ["Upload"], {"name": "Upload"})
+
+    matches = await index.search("up")
+    assert [(match.media_id, match.score) for match in matches] == [(5, 1)]
+    assert await index.search("!!") == []
+
+
+async def test_readding_merges_titles_and_records(index: TitleIndex):
+    await index.add("series", 1, ["Breaking Bad"], {"name": "Breaking Bad", "year": "2008"})
+    await index.add("series", 1, ["Reviravolta"], {"name": "Breaking Bad", "year": None, "overview": "Chemistry."})
+
+    for query in ("breaking bad", "reviravolta"):
+        matches = await index.search(query, limit=1)
+        assert [match.media_id for match in matches] == [1]
+    record = json_codec.decode((await index.search("reviravolta", limit=1))[0].record)
+    assert record == {"name": "Breaking Bad", "year": "2008", "overview": "Chemistry."}
+
+
+async def test_remove(index: TitleIndex):
+    await _populate(index)
+    await index.remove("series", 1)
+
+    assert all(match.media_id != 1 for match in await index.search("breaking bad", limit=10))
+    assert await index.search("breaking bad", kind="movie")
+
+
+async def test_recent_records(index: TitleIndex):
+    await _populate(index)
+    await index.add("series", 1, ["Breaking Bad"], {"name": "Breaking Bad"})
+
+    records = [json_codec.decode(record)["name"] for record in await index.recent_records(2)]
+    assert records == ["Breaking Bad", "Pokémon"]
+
+
+async def test_index_is_persisted(index: TitleIndex):
+    await _populate(index)
+    await index.close()
+
+    reopened = TitleIndex(index.db_file)
+    try:
+        assert [match.media_id for match in await reopened.search("better call saul", limit=1)] == [2]
+    finally:
+        await reopened.close()
@@ -0,0 +1,116 @@
+import time
+
+import pytest
+from aiocache import SimpleMemoryCache
+
+from src.tvdb import FetchMeta, Movie, Series, TvdbClient
+from src.tvdb.client import Episode
+from src.tvdb.updates import UpdatesSync
+from tests.conftest import FIXTURES_DIR, ServeStandIn
+from tools.tvdb_stand_in import FixtureStore, StandIn, SyntheticData
+
+# The timestamps of the updates in the recorded feed (tests/fixtures/tvdb/updates@*.json)
+FEED_TIME = 1760000000
+
+
+@pytest.fixture()
+def stand_in() -> StandIn:
+    """A stand-in which replays the recorded fixtures (including the updates feed), generating the other records."""
+    return StandIn(FixtureStore(FIXTURES_DIR / "tvdb"), synthetic=SyntheticData())
+
+
+@pytest.fixture()
+async def client(serve_stand_in: ServeStandIn, stand_in: StandIn):
+    await serve_stand_in(stand_in)
+    client = TvdbClient(SimpleMemoryCache(), persist_token=False)
+    yield client
+    await client.close()
+
+
+async def _synced_until_feed(client: TvdbClient) -> None:
+    """Store the sync times, as if the last sync happened right before the updates in the recorded feed."""
+    await client.cache.multi_set(
+        [(f"synced_until_{entity_type}", FEED_TIME) for entity_type in UpdatesSync.ENTITY_TYPES],
+        namespace=UpdatesSync.CACHE_NAMESPACE,
+    )
+
+
+async def _populate(client: TvdbClient) -> None:
+    series = await Series.fetch(7, client, extended=True, meta=FetchMeta.TRANSLATIONS)
+    await series.fetch_episodes()
+    await series.fetch_english_episodes()
+    for series_id in (1, 5):
+        await Series.fetch(series_id, client)
+    for series_id in (2, 3):
+        await Series.fetch(series_id, client, extended=True)
+    for movie_id in (2, 3, 4):
+        await Movie.fetch(movie_id, client, extended=True)
+    for episode_id in (10003, 70001, 50002):
+        await Episode.fetch(episode_id, client=client)
+    await client.search("query", limit=5)
+
+
+async def _state(client: TvdbClient, namespace: str, key: str) -> str:
+    value = await client.cache.get(key, namespace=namespace)
+    if value is None:
+        return "evicted"
+    return "stale" if value.fetched_at == 0 else "fresh"
+
+
+async def test_first_sync_of_empty_cache_starts_from_now(client: TvdbClient, stand_in: StandIn):
+    started_at = int(time.time())
+    assert await UpdatesSync(client).sync() == 0
+
+    # There's nothing in the cache that could've changed before now, so the feed isn't even requested
+    assert "updates" not in stand_in.stats.endpoints
+    synced_until = await client.cache.get("synced_until_series", namespace=UpdatesSync.CACHE_NAMESPACE)
+    assert isinstance(synced_until, int)
+    assert synced_until >= started_at
+
+
+async def test_sync_invalidates_changed_records(client: TvdbClient):
+    await _populate(client)
+    await _synced_until_feed(client)
+
+    # Series 1, 7 and 3 (translation) changed, 2 got deleted, plus an episode of 7 changed and one of 1 got deleted.
+    # Movie 2 changed and movie 4 got deleted.
+    assert await UpdatesSync(client).sync() == 8
+
+    series, movies, episode = Series.cache_namespace(), Movie.cache_namespace(), Episode.CACHE_NAMESPACE
+    expected = {
+        (series, "1"): "stale",
+        (series, "2_extended"): "evicted",
+        (series, "3_extended"): "stale",
+        (series, "5"): "fresh",
+        (series, "7_extended"): "stale",
+        ("tvdb_episodes", "7_official_0"): "stale",
+        ("tvdb_episodes", "7_official_1"): "stale",
+        ("tvdb_episodes", "7_official_eng_0"): "stale",
+        ("tvdb_episodes", "7_official_eng_1"): "stale",
+        (movies, "2_extended"): "stale",
+        (movies, "3_extended"): "fresh",
+        (movies, "4_extended"): "evicted",
+        (episode, "10003_extended"): "evicted",
+        (episode, "70001_extended"): "stale",
+        (episode, "50002_extended"): "fresh",
+        # There's no telling which searches a changed record appeared in
+        ("tvdb_search", "query_None"): "fresh",
+    }
+    assert {key: await _state(client, *key) for key in expected} == expected
+
+
+async def test_truncated_feed_is_synced_up_to_the_processed_pages(client: TvdbClient, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(UpdatesSync, "MAX_PAGES", 1)
+    await _populate(client)
+    await _synced_until_feed(client)
+    started_at = int(time.time())
+    await UpdatesSync(client).sync()
+
+    # Only the first page of the series updates was processed, the deletion of series 2 is on the second one
+    assert await _state(client, Series.cache_namespace(), "1") == "stale"
+    assert await _state(client, Series.cache_namespace(), "2_extended") == "fresh"
+    synced_until = await client.cache.multi_get(
+        ["synced_until_series", "synced_until_movies"], namespace=UpdatesSync.CACHE_NAMESPACE
+    )
+    assert synced_until[0] == FEED_TIME + 20
+    assert synced_until[1] >= started_at
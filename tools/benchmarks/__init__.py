@@ -0,0 +1,7 @@
+"""Benchmarks of the performance sensitive parts of the bot, meant to be re-run when these parts change.
+
+Each benchmark is a module runnable with ``python -m tools.benchmarks.<name>`` (see ``--help`` of each).
+They import the bot's modules, so the required settings (e.g. ``BOT_TOKEN`` and ``TVDB_API_KEY``) have to
+be set, though they're never used to connect anywhere: the TVDB requests go to a local stand-in of the API
+(see :mod:`tools.tvdb_stand_in`), served on a free port for the duration of the benchmark.
+"""
@@ -0,0 +1,112 @@
+"""Helpers shared by the benchmarks."""
+
+import inspect
+import json
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from aiohttp.test_utils import TestServer
+from yarl import URL
+
+from src.tvdb import TvdbClient
+from tools.tvdb_stand_in import StandIn, create_app
+
+__all__ = ["best_of", "extended_series_payload", "report", "serve_stand_in"]
+
+
+async def best_of(func: Callable[[], Awaitable[Any] | Any], *, repeat: int = 5, number: int = 20) -> float:
+    """Get the mean duration in seconds of a call of `func`, in the fastest out of `repeat` rounds of `number` calls.
+
+    The function can be either synchronous or asynchronous.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            result = func()
+            if inspect.isawaitable(result):
+                await result
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def report(name: str, seconds: float) -> None:
+    """Print the measured duration of given benchmark case."""
+    print(f"  {name:<50} {seconds * 1000:10.3f} ms")  # noqa: T201
+
+
+def extended_series_payload(series_id: int, *, episodes: int, characters: int, artworks: int) -> bytes:
+    """Get the JSON response of `/series/{id}/extended?meta=episodes` of a made-up series of given size."""
+    record = {
+        "id": series_id,
+        "name": f"Series {series_id}",
+        "slug": f"series-{series_id}",
+        "image": f"https://artworks.thetvdb.com/banners/series/{series_id}/posters/1.jpg",
+        "overview": f"Overview of series {series_id}.",
+        "aliases": [{"language": "eng", "name": f"The Series {series_id}"}],
+        "nameTranslations": ["eng", "deu", "fra"],
+        "overviewTranslations": ["eng", "deu", "fra"],
+        "lastAired": "2020-01-01",
+        "seasons": [
+            {"id": series_id * 100 + number, "seriesId": series_id, "number": number, "type": {"type": "official"}}
+            for number in range(1, episodes // 20 + 2)
+        ],
+        "episodes": [
+            {
+                "id": series_id * 10_000 + index,
+                "seriesId": series_id,
+                "name": f"Episode {index // 20 + 1}x{index % 20 + 1:02} of series {series_id}",
+                "overview": f"Overview of episode {index // 20 + 1}x{index % 20 + 1:02}, which is a bit longer.",
+                "seasonNumber": index // 20 + 1,
+                "number": index % 20 + 1,
+                "aired": f"{2000 + index // 20 % 25}-{index % 12 + 1:02}-{index % 28 + 1:02}",
+                "image": f"https://artworks.thetvdb.com/banners/episodes/{series_id}/{index}.jpg",
+                "nameTranslations": ["eng", "deu", "fra"],
+                "overviewTranslations": ["eng", "deu", "fra"],
+            }
+            for index in range(episodes)
+        ],
+        "characters": [
+            {
+                "id": index,
+                "name": f"Character {index}",
+                "peopleId": 100_000 + index,
+                "personName": f"Actor {index}",
+                "seriesId": series_id,
+                "type": 3,
+                "sort": index,
+                "image": f"https://artworks.thetvdb.com/banners/person/{index}/primary.jpg",
+            }
+            for index in range(characters)
+        ],
+        "artworks": [
+            {
+                "id": index,
+                "image": f"https://artworks.thetvdb.com/banners/series/{series_id}/backgrounds/{index}.jpg",
+                "thumbnail": f"https://artworks.thetvdb.com/banners/series/{series_id}/backgrounds/{index}_t.jpg",
+                "language": "eng",
+                "type": 3,
+                "score": 100_000 - index,
+                "width": 1920,
+                "height": 1080,
+            }
+            for index in range(artworks)
+        ],
+    }
+    return json.dumps({"status": "success", "data": record}).encode()
+
+
+@asynccontextmanager
+async def serve_stand_in(stand_in: StandIn) -> AsyncIterator[URL]:
+    """Serve the TVDB stand-in on a free port, pointing the TVDB clients created meanwhile to it."""
+    server = TestServer(create_app(stand_in))
+    await server.start_server(access_log=None)
+    original_url = TvdbClient.BASE_URL
+    TvdbClient.BASE_URL = server.make_url("/")
+    try:
+        yield TvdbClient.BASE_URL
+    finally:
+        TvdbClient.BASE_URL = original_url
+        await server.close()
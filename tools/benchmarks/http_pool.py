@@ -0,0 +1,115 @@
+"""Load test of the separate connection pool of the TVDB client.
+
+Bursts of slow TVDB requests (to the stand-in, with injected latency) are sent while a few streams of
+requests go to another, fast API. This is done once with the TVDB client using the same (default) session
+as the other requests, and once with the TVDB client owning its own pooled session, comparing the latency
+of the requests to the other API.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import aiohttp
+from aiocache import SimpleMemoryCache
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from yarl import URL
+
+from src.tvdb import Series, TvdbClient
+from tools.benchmarks.common import serve_stand_in
+from tools.tvdb_stand_in import Faults, StandIn, SyntheticData
+
+
+@asynccontextmanager
+async def serve_other_api(latency: float) -> AsyncIterator[URL]:
+    """Serve an API unrelated to TVDB, answering each request after given latency."""
+
+    async def handle(_: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        return web.json_response({"status": "ok"})
+
+    app = web.Application()
+    app.router.add_get("/", handle)
+    server = TestServer(app)
+    await server.start_server(access_log=None)
+    try:
+        yield server.make_url("/")
+    finally:
+        await server.close()
+
+
+async def _stream(session: aiohttp.ClientSession, url: URL, latencies: list[float], done: asyncio.Event) -> None:
+    while not done.is_set():
+        start = time.perf_counter()
+        async with session.get(url) as response:
+            await response.read()
+        latencies.append(time.perf_counter() - start)
+
+
+async def _load(args: argparse.Namespace, client: TvdbClient, other: aiohttp.ClientSession, other_url: URL) -> None:
+    # The bursts are way over the default rate-limit, it's not what's being measured here
+    client.rate_limiter.limit = 1_000_000
+    latencies: list[float] = []
+    done = asyncio.Event()
+    streams = [asyncio.create_task(_stream(other, other_url, latencies, done)) for _ in range(args.streams)]
+    burst_times: list[float] = []
+    try:
+        for burst in range(args.bursts):
+            start = time.perf_counter()
+            ids = range(burst * args.burst_size + 1, (burst + 1) * args.burst_size + 1)
+            await asyncio.gather(*(Series.fetch(series_id, client) for series_id in ids))
+            burst_times.append(time.perf_counter() - start)
+    finally:
+        done.set()
+        await asyncio.gather(*streams)
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(  # noqa: T201
+        f"  other API: p50 {percentiles[49] * 1000:.1f} ms, p99 {percentiles[98] * 1000:.1f} ms"
+        f" ({len(latencies)} requests), TVDB bursts: {', '.join(f'{t:.2f}s' for t in burst_times)}"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    stand_in = StandIn(None, synthetic=SyntheticData(), faults=Faults(latency=args.tvdb_latency / 1000))
+    async with serve_stand_in(stand_in), serve_other_api(args.other_latency / 1000) as other_url:
+        print("Shared default session:")  # noqa: T201
+        async with aiohttp.ClientSession() as session:
+            client = TvdbClient(SimpleMemoryCache(), http_session=session, persist_token=False)
+            try:
+                await _load(args, client, session, other_url)
+            finally:
+                await client.close()
+
+        print("Dedicated TVDB pool:")  # noqa: T201
+        async with aiohttp.ClientSession() as session:
+            client = TvdbClient(SimpleMemoryCache(), persist_token=False)
+            try:
+                await _load(args, client, session, other_url)
+                stats = client.connection_stats
+                print(  # noqa: T201
+                    f"  TVDB pool: {stats.created} connections created, {stats.reused} reused"
+                    f" ({stats.reuse_ratio:.0%} reuse), {stats.queued} queued"
+                )
+            finally:
+                await client.close()
+
+
+def main() -> None:
+    """The main entry point for the script."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bursts", type=int, default=4)
+    parser.add_argument("--burst-size", type=int, default=150, help="Concurrent TVDB requests in each burst.")
+    parser.add_argument("--tvdb-latency", type=float, default=300, help="Latency of the TVDB API, in milliseconds.")
+    parser.add_argument("--streams", type=int, default=5, help="Concurrent streams of requests to the other API.")
+    parser.add_argument("--other-latency", type=float, default=5, help="Latency of the other API, in milliseconds.")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
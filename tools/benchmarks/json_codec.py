@@ -0,0 +1,77 @@
+"""Benchmark of decoding, validating and encoding the TVDB responses (see :mod:`src.utils.json_codec`).
+
+A large extended series response goes through the ways of turning it into the validated model, and of
+encoding it back (as when merging the cached records). The size of a cached response kept as the decoded
+objects and as the raw bytes is compared too, along with the time it takes to unpickle each of them
+(as when loading them from the persistent cache).
+"""
+
+import argparse
+import asyncio
+import json
+import pickle
+import sys
+import time
+from typing import Any
+
+from src.tvdb.client import CachedResponse
+from src.tvdb.generated_models import SeriesIdExtendedGetResponse
+from src.utils import json_codec
+from tools.benchmarks.common import best_of, extended_series_payload, report
+
+
+def _deep_size(obj: Any) -> int:
+    """Get the memory taken by given decoded JSON, including all of the objects it references."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(key) + _deep_size(value) for key, value in obj.items())
+    elif isinstance(obj, list):
+        size += sum(_deep_size(item) for item in obj)
+    return size
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    payload = extended_series_payload(1, episodes=args.episodes, characters=args.characters, artworks=args.artworks)
+    decoded = json.loads(payload)
+    print(f"Extended series payload: {len(payload) / 1_000_000:.2f} MB, JSON backend: {json_codec.BACKEND}")  # noqa: T201
+
+    report(
+        "response -> model, stdlib json + model_validate",
+        await best_of(lambda: SeriesIdExtendedGetResponse.model_validate(json.loads(payload))),
+    )
+    report(
+        "response -> model, model_validate_json",
+        await best_of(lambda: SeriesIdExtendedGetResponse.model_validate_json(payload)),
+    )
+    report(
+        f"response -> model, json_codec.validate ({json_codec.BACKEND})",
+        await best_of(lambda: json_codec.validate(SeriesIdExtendedGetResponse, payload)),
+    )
+    report(
+        "encoding, stdlib json",
+        await best_of(lambda: json.dumps(decoded, separators=(",", ":"), ensure_ascii=False).encode()),
+    )
+    report(f"encoding, json_codec.encode ({json_codec.BACKEND})", await best_of(lambda: json_codec.encode(decoded)))
+
+    pickled_decoded = pickle.dumps(decoded)
+    pickled_response = pickle.dumps(CachedResponse(payload, time.time()))
+    report("unpickling a cache entry, decoded objects", await best_of(lambda: pickle.loads(pickled_decoded)))  # noqa: S301
+    report("unpickling a cache entry, raw bytes", await best_of(lambda: pickle.loads(pickled_response)))  # noqa: S301
+    print(  # noqa: T201
+        f"In-memory cache entry: {_deep_size(decoded) / 1_000_000:.2f} MB decoded objects,"
+        f" {sys.getsizeof(payload) / 1_000_000:.2f} MB raw bytes"
+    )
+
+
+def main() -> None:
+    """The main entry point for the script."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--episodes", type=int, default=1400)
+    parser.add_argument("--characters", type=int, default=600)
+    parser.add_argument("--artworks", type=int, default=900)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
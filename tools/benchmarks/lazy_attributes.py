@@ -0,0 +1,62 @@
+"""Benchmark of constructing the TVDB media wrappers, with their derived attributes computed lazily.
+
+An already validated extended series with thousands of episodes is wrapped in a :class:`Series`, followed
+by increasingly more of its attributes being used, the same way as the views of the bot use them.
+"""
+
+import argparse
+import asyncio
+
+from aiocache import SimpleMemoryCache
+
+from src.tvdb import Series, TvdbClient
+from src.tvdb.generated_models import SeriesExtendedRecord, SeriesIdExtendedGetResponse
+from src.utils import json_codec
+from tools.benchmarks.common import best_of, extended_series_payload, report
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    payload = extended_series_payload(1, episodes=args.episodes, characters=0, artworks=0)
+    data = json_codec.validate(SeriesIdExtendedGetResponse, payload).data
+    if not isinstance(data, SeriesExtendedRecord):
+        raise TypeError("The payload isn't an extended series record.")
+    print(f"Series with {args.episodes} episodes")  # noqa: T201
+
+    client = TvdbClient(SimpleMemoryCache(), persist_token=False)
+    try:
+
+        def construct() -> None:
+            Series(client, data)
+
+        def bilingual_name() -> None:
+            _ = Series(client, data).bilingual_name
+
+        def last_aired_episode() -> None:
+            series = Series(client, data)
+            _ = series.bilingual_name
+            if series.episode_index is not None and (row := series.episode_index.last_aired()) is not None:
+                _ = series.episode_at(row).formatted_name
+
+        def all_episode_names() -> None:
+            series = Series(client, data)
+            _ = series.bilingual_name
+            _ = [episode.formatted_name for episode in series.episodes or ()]
+
+        report("Series() construction", await best_of(construct, number=50))
+        report("construction + bilingual_name", await best_of(bilingual_name, number=50))
+        report("+ last aired episode", await best_of(last_aired_episode, number=50))
+        report("+ formatted_name of all of the episodes", await best_of(all_episode_names, number=50))
+    finally:
+        await client.close()
+
+
+def main() -> None:
+    """The main entry point for the script."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--episodes", type=int, default=5000)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
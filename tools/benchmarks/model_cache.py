@@ -0,0 +1,62 @@
+"""Benchmark of the in-process cache of the validated TVDB responses (:attr:`TvdbClient.model_cache`).
+
+A large extended series is fetched through the (warm) response cache, once with its validated model
+kept in the model cache, and once with the model cache cleared before each fetch, as if there was none.
+"""
+
+import argparse
+import asyncio
+import tempfile
+from pathlib import Path
+
+from aiocache import SimpleMemoryCache
+
+from src.tvdb import FetchMeta, Series, TvdbClient
+from src.tvdb.generated_models import SeriesIdExtendedGetResponse
+from src.utils import json_codec
+from tools.benchmarks.common import best_of, extended_series_payload, report, serve_stand_in
+from tools.tvdb_stand_in import FixtureStore, StandIn
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    payload = extended_series_payload(1, episodes=args.episodes, characters=args.characters, artworks=args.artworks)
+    print(f"Extended series payload: {len(payload) / 1_000_000:.2f} MB, JSON backend: {json_codec.BACKEND}")  # noqa: T201
+
+    with tempfile.TemporaryDirectory() as directory:
+        fixtures = FixtureStore(Path(directory))
+        fixtures.save("/series/1/extended", {"meta": "episodes", "short": "false"}, 200, payload)
+        async with serve_stand_in(StandIn(fixtures)):
+            client = TvdbClient(SimpleMemoryCache(), persist_token=False)
+            try:
+
+                async def fetch() -> None:
+                    await Series.fetch(1, client, extended=True, meta=FetchMeta.EPISODES)
+
+                async def fetch_uncached_model() -> None:
+                    client.model_cache.clear()
+                    await fetch()
+
+                # Warm up the response cache
+                await fetch()
+                report(
+                    "validation of the cached response",
+                    await best_of(lambda: json_codec.validate(SeriesIdExtendedGetResponse, payload)),
+                )
+                report("warm Series.fetch, model validated again", await best_of(fetch_uncached_model))
+                report("warm Series.fetch, model cached", await best_of(fetch))
+            finally:
+                await client.close()
+
+
+def main() -> None:
+    """The main entry point for the script."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--episodes", type=int, default=500)
+    parser.add_argument("--characters", type=int, default=200)
+    parser.add_argument("--artworks", type=int, default=300)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
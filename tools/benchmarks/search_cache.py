@@ -0,0 +1,106 @@
+"""Benchmark of the hit ratio of the search cache, on a replayed log of search queries.
+
+The queries are replayed against the stand-in, through a client without a title index, so that only the
+caching of the API responses is measured. The result is compared with the hit ratio of caching the responses
+under the raw ``{query}_{type}_{limit}`` keys, which is computed from the log alone.
+
+By default, a log is generated: popular titles (Zipf distributed) typed with varying case and whitespace,
+searched with varying limits. A real log can be replayed instead, with one query per line, optionally
+followed by a tab and the limit.
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from aiocache import SimpleMemoryCache
+
+from src.tvdb import TvdbClient
+from tools.benchmarks.common import serve_stand_in
+from tools.tvdb_stand_in import FixtureStore, StandIn, SyntheticData
+
+LIMITS = (1, 1, 1, 5, 10)
+"""The limits of the generated searches (most of them are made by the /search command, with the default limit)."""
+
+
+def _spellings(title: str, rng: random.Random) -> Iterator[str]:
+    """Generate the ways the users type the title."""
+    yield title
+    yield title.lower()
+    yield title.upper()
+    yield f"{title.lower()} "
+    yield "  ".join(title.split())
+    yield "".join(char.upper() if rng.random() < 0.5 else char.lower() for char in title)
+
+
+def generate_log(size: int, titles: int, seed: int) -> list[tuple[str, int]]:
+    """Generate a log of `size` searches of `titles` distinct titles."""
+    rng = random.Random(seed)
+    names = [f"Title {index} of the log" for index in range(titles)]
+    weights = [1 / rank for rank in range(1, titles + 1)]
+    spellings = {name: list(_spellings(name, rng)) for name in names}
+    return [(rng.choice(spellings[name]), rng.choice(LIMITS)) for name in rng.choices(names, weights=weights, k=size)]
+
+
+def load_log(path: Path) -> list[tuple[str, int]]:
+    """Load a log of searches, with one query per line, optionally followed by a tab and the limit."""
+    searches: list[tuple[str, int]] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        query, _, limit = line.partition("\t")
+        if query.strip():
+            searches.append((query, int(limit) if limit else 1))
+    return searches
+
+
+def raw_key_misses(searches: list[tuple[str, int]]) -> int:
+    """Get the amount of the searches that would miss a cache keyed by the raw query and limit."""
+    return len({f"{query}_None_{limit}" for query, limit in searches})
+
+
+async def replay(searches: list[tuple[str, int]]) -> tuple[int, float]:
+    """Replay the searches through a client, returning the amount of the API requests and the total duration."""
+    with tempfile.TemporaryDirectory() as directory:
+        stand_in = StandIn(FixtureStore(Path(directory)), synthetic=SyntheticData())
+        async with serve_stand_in(stand_in):
+            client = TvdbClient(SimpleMemoryCache(), persist_token=False)
+            try:
+                start = time.perf_counter()
+                for query, limit in searches:
+                    await client.search(query, limit=limit)
+                duration = time.perf_counter() - start
+            finally:
+                await client.close()
+        return stand_in.stats.endpoints.get("search", 0), duration
+
+
+def _report_ratio(name: str, misses: int, total: int) -> None:
+    print(f"  {name:<50} {1 - misses / total:10.1%} ({misses} API requests)")  # noqa: T201
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    searches = load_log(args.log) if args.log else generate_log(args.size, args.titles, args.seed)
+    print(f"Replaying {len(searches)} searches")  # noqa: T201
+
+    requests, duration = await replay(searches)
+    _report_ratio("raw query cache keys", raw_key_misses(searches), len(searches))
+    _report_ratio("canonical queries, shared limits", requests, len(searches))
+    print(f"  {'mean search duration':<50} {duration / len(searches) * 1000:10.3f} ms")  # noqa: T201
+
+
+def main() -> None:
+    """The main entry point for the script."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--log", type=Path, help="Log of the searches to replay, instead of a generated one.")
+    parser.add_argument("--size", type=int, default=5000, help="Amount of the generated searches.")
+    parser.add_argument("--titles", type=int, default=500, help="Amount of the distinct titles in the generated log.")
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Benchmark of the startup time of the bot, with the extensions loaded eagerly and lazily (``LAZY_EXTENSIONS``).
+
+Each run starts a fresh process (so that nothing is imported yet), which goes through the startup of the bot
+up to the point where it would connect to Discord: setting up the database, creating the bot and loading its
+extensions. The time from starting the process until then is measured. In the lazy mode, the time it then takes
+to load the deferred extensions in the background is measured too (without the command sync, as that needs
+the connection to Discord).
+"""
+
+import argparse
+import asyncio
+import importlib
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+READY_MARKER = "BENCHMARK READY"
+DEFERRED_MARKER = "BENCHMARK DEFERRED"
+
+
+async def _start_bot() -> None:
+    """Go through the startup of the bot (in this process), reporting the progress on stdout."""
+    # Only imported in the benchmarked processes, the one running the benchmark doesn't need any of these
+    import aiohttp
+    import discord
+    from aiocache import SimpleMemoryCache
+
+    from src.bot import Bot
+    from src.settings import LAZY_EXTENSIONS
+    from src.utils.database import apply_db_migrations, engine, get_db_session, load_db_models
+
+    load_db_models()
+    async with engine.begin() as conn:
+        await conn.run_sync(apply_db_migrations)
+
+    async with aiohttp.ClientSession() as http_session, get_db_session() as db_session:
+        bot = Bot(
+            intents=discord.Intents.default(),
+            http_session=http_session,
+            db_session=db_session,
+            cache=SimpleMemoryCache(),
+            lazy_extensions=LAZY_EXTENSIONS,
+        )
+        bot.load_all_extensions()
+        print(READY_MARKER, flush=True)  # noqa: T201
+
+        if LAZY_EXTENSIONS:
+            started_at = time.perf_counter()
+            for extension in Bot.EXTENSIONS:
+                if extension in Bot.DEFERRED_EXTENSIONS:
+                    await asyncio.to_thread(importlib.import_module, extension)
+                    bot.load_extension(extension)
+            print(f"{DEFERRED_MARKER} {time.perf_counter() - started_at}", flush=True)  # noqa: T201
+        for extension in list(bot.extensions):
+            bot.unload_extension(extension)
+        # Let the cogs close their clients, which happens in the background on unload
+        await asyncio.sleep(0.1)
+
+
+def _measure(*, lazy: bool, directory: Path) -> tuple[float, float | None]:
+    """Start the bot in a new process, getting the time until it would connect, and the deferred loading time."""
+    env = os.environ | {
+        "LAZY_EXTENSIONS": "1" if lazy else "0",
+        "SQLITE_DATABASE_FILE": str(directory / "database.db"),
+        "TVDB_TITLE_INDEX_FILE": str(directory / "titles.db"),
+        "CACHE_BACKEND": "memory",
+        "TVDB_UPDATES_SYNC_INTERVAL": "0",
+    }
+    started_at = time.perf_counter()
+    with subprocess.Popen(
+        [sys.executable, "-m", __spec__.name, "--child"],  # noqa: S603
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    ) as process:
+        if process.stdout is None:
+            raise RuntimeError("The output of the benchmarked process isn't captured.")
+        ready_after: float | None = None
+        deferred: float | None = None
+        for line in process.stdout:
+            if line.startswith(READY_MARKER):
+                ready_after = time.perf_counter() - started_at
+            elif line.startswith(DEFERRED_MARKER):
+                deferred = float(line.removeprefix(DEFERRED_MARKER))
+    if process.returncode != 0 or ready_after is None:
+        raise RuntimeError(f"The benchmarked process failed (exit code {process.returncode}).")
+    return ready_after, deferred
+
+
+def _format(times: list[float]) -> str:
+    return f"{min(times) * 1000:.0f}-{max(times) * 1000:.0f} ms (median {statistics.median(times) * 1000:.0f} ms)"
+
+
+def main() -> None:
+    """The main entry point for the script."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        asyncio.run(_start_bot())
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        for lazy in (False, True):
+            results = [_measure(lazy=lazy, directory=Path(directory)) for _ in range(args.runs)]
+            line = f"{'lazy' if lazy else 'eager'}: {_format([ready for ready, _ in results])}"
+            deferred = [deferred for _, deferred in results if deferred is not None]
+            if deferred:
+                line += f", then {_format(deferred)} of deferred loading in the background"
+            print(line)  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
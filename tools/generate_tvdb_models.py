@@ -1,4 +1,7 @@
+import argparse
+import ast
 import subprocess
+from collections.abc import Collection, Mapping
 from pathlib import Path
 from urllib.parse import ParseResult, urlparse
 
@@ -7,9 +10,112 @@ from datamodel_code_generator import DataModelType, InputFileType, OpenAPIScope,
 HEADER: str = """# ruff: noqa: D101, ERA001, E501
 """
 
+# Models (and their fields) that are kept in the slim models module, `None` meaning all of the fields.
+# Only the endpoints that the bot actually uses are covered: search, series, movies, episodes (including
+# their translations) and updates. The other fields in the API responses are simply ignored by pydantic,
+# so e.g. the artworks, characters or companies of the extended records don't get validated at all.
+# The models referenced by the kept fields are kept too, even if they're not listed here (with all fields).
+SLIM_MODELS: Mapping[str, Collection[str] | None] = {
+    # Search
+    "SearchGetResponse": None,
+    "SearchResult": {
+        "aliases",
+        "id",
+        "image_url",
+        "name",
+        "overview",
+        "overviews",
+        "slug",
+        "translations",
+        "tvdb_id",
+        "type",
+    },
+    "Links": None,
+    # Series
+    "SeriesIdGetResponse": None,
+    "SeriesIdArtworksGetResponse": None,  # base class of SeriesIdExtendedGetResponse
+    "SeriesIdExtendedGetResponse": None,
+    "SeriesIdEpisodesSeasonTypeGetResponse": None,
+    "Data1": None,  # data of SeriesIdEpisodesSeasonTypeGetResponse
+    "SeriesBaseRecord": {
+        "aliases",
+        "episodes",
+        "id",
+        "image",
+        "last_aired",
+        "name",
+        "name_translations",
+        "overview_translations",
+        "slug",
+    },
+    "SeriesExtendedRecord": {
+        "aliases",
+        "episodes",
+        "id",
+        "image",
+        "last_aired",
+        "name",
+        "name_translations",
+        "overview",
+        "overview_translations",
+        "seasons",
+        "slug",
+        "translations",
+    },
+    "SeasonBaseRecord": {"id", "image", "name", "number", "series_id", "type"},
+    # Movies
+    "MoviesIdGetResponse": None,
+    "MoviesIdExtendedGetResponse": None,
+    "MovieBaseRecord": {"aliases", "id", "image", "name", "name_translations", "overview_translations", "slug"},
+    "MovieExtendedRecord": {
+        "aliases",
+        "id",
+        "image",
+        "name",
+        "name_translations",
+        "overview_translations",
+        "slug",
+        "translations",
+    },
+    # Episodes
+    "EpisodesIdGetResponse": None,
+    "EpisodesIdExtendedGetResponse": None,
+    "EpisodeBaseRecord": {
+        "aired",
+        "id",
+        "image",
+        "name",
+        "name_translations",
+        "number",
+        "overview",
+        "overview_translations",
+        "season_number",
+        "series_id",
+    },
+    "EpisodeExtendedRecord": {
+        "aired",
+        "id",
+        "image",
+        "name",
+        "name_translations",
+        "number",
+        "overview",
+        "overview_translations",
+        "season_number",
+        "series_id",
+        "translations",
+    },
+    # Translations
+    "TranslationExtended": {"name_translations", "overview_translations"},
+    "Translation": {"is_primary", "language", "name", "overview"},
+    # Updates
+    "UpdatesGetResponse": None,
+    "EntityUpdate": None,
+    "Action": None,
+}
 
-def _generate_models() -> Path:
-    output = Path("./src/tvdb/generated_models.py")
+
+def _generate_models(output: Path) -> None:
     url: ParseResult = urlparse("https://thetvdb.github.io/v4-api/swagger.yml")
     generate(
         url,
@@ -36,17 +142,104 @@ def _generate_models() -> Path:
     with output.open("w") as f:
         f.write(HEADER + contents)
         f.truncate()
-    return output
+
+
+def _field_name(statement: ast.stmt) -> str | None:
+    """Get the name of the model field defined by given class body statement, if it defines one."""
+    if isinstance(statement, ast.AnnAssign) and isinstance(statement.target, ast.Name):
+        return statement.target.id
+    return None
+
+
+def _slim_models(source: str, models: Mapping[str, Collection[str] | None]) -> str:
+    """Strip the generated models module down to given models and fields.
+
+    :param source: Source code of the full generated models module.
+    :param models: Names of the models to keep, with the names of their fields to keep (`None` for all).
+    :return: Source code of the slim models module.
+    """
+    module = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+    classes = {node.name: node for node in module.body if isinstance(node, ast.ClassDef)}
+    if unknown := set(models) - set(classes):
+        raise ValueError(f"Unknown models in the allow-list: {', '.join(sorted(unknown))}")
+
+    # Go through the kept fields (and the bases) of the kept models, to find all of the models these need
+    kept: dict[str, Collection[str] | None] = {}
+    pending = list(models)
+    while pending:
+        name = pending.pop()
+        if name in kept:
+            continue
+        fields = models.get(name)
+        kept[name] = fields
+        if name not in models:
+            print(f"Keeping {name}, as it's referenced by the kept models")  # noqa: T201
+
+        node = classes[name]
+        referencing = [*node.bases] + [
+            statement.annotation
+            for statement in node.body
+            if isinstance(statement, ast.AnnAssign) and (fields is None or _field_name(statement) in fields)
+        ]
+        pending.extend(
+            child.id
+            for expression in referencing
+            for child in ast.walk(expression)
+            if isinstance(child, ast.Name) and child.id in classes
+        )
+
+    # Cut out the lines of the dropped models and fields
+    removed_lines: set[int] = set()
+    replaced_lines: dict[int, str] = {}
+    for name, node in classes.items():
+        start = min([node.lineno, *(decorator.lineno for decorator in node.decorator_list)])
+        if name not in kept:
+            removed_lines.update(range(start, (node.end_lineno or start) + 3))  # including the 2 blank lines after
+            continue
+
+        fields = kept[name]
+        if fields is None:
+            continue
+        if missing := set(fields) - {_field_name(statement) for statement in node.body}:
+            raise ValueError(f"Unknown fields of {name} in the allow-list: {', '.join(sorted(missing))}")
+        dropped = [
+            statement
+            for statement in node.body
+            if (field := _field_name(statement)) is not None and field not in fields
+        ]
+        for statement in dropped:
+            removed_lines.update(range(statement.lineno, (statement.end_lineno or statement.lineno) + 1))
+        if len(dropped) == len(node.body):
+            replaced_lines[node.body[0].lineno] = "    pass\n"
+
+    return "".join(
+        replaced_lines.get(number, line)
+        for number, line in enumerate(lines, start=1)
+        if number in replaced_lines or number not in removed_lines
+    )
 
 
 def _run_ruff(file_path: Path) -> None:
     subprocess.run(["poetry", "run", "ruff", "check", "--fix", "--unsafe-fixes", str(file_path)], check=True)  # noqa: S603, S607
+    subprocess.run(["poetry", "run", "ruff", "format", str(file_path)], check=True)  # noqa: S603, S607
 
 
 def main() -> None:
     """The main entry point for the script."""
-    generated_file = _generate_models()
-    _run_ruff(generated_file)
+    parser = argparse.ArgumentParser(description="Generate the pydantic models for the TVDB API responses.")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Generate the models for the whole API, instead of just the models (and fields) that the bot uses.",
+    )
+    args = parser.parse_args()
+
+    output = Path("./src/tvdb/generated_models.py")
+    _generate_models(output)
+    if not args.full:
+        output.write_text(_slim_models(output.read_text(), SLIM_MODELS))
+    _run_ruff(output)
 
 
 if __name__ == "__main__":
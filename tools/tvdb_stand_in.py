@@ -0,0 +1,545 @@
+"""A local stand-in for the TVDB API, for running and benchmarking the bot offline.
+
+The server emulates the TVDB API endpoints that the bot uses. It replays the recorded responses (fixtures),
+which can be recorded from the real API through the stand-in itself (``--record``), and it can fill in the
+missing ones with generated records (``--synthetic``). Latency and errors can be injected into the responses,
+to see how the bot behaves with a slow or a failing API, and the issued tokens can be made to expire or to
+get revoked, to exercise the re-authentication.
+
+To point the bot to the stand-in, set the ``TVDB_BASE_URL`` setting, e.g.::
+
+    poetry run tvdb-stand-in --synthetic --latency 100 --error-rate 0.05
+    TVDB_BASE_URL=http://127.0.0.1:8081/ python -m src
+
+The stand-in can also be run in-process (e.g. from a benchmark), by serving the app from :func:`create_app`.
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import secrets
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Collection, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+import aiohttp
+from aiohttp import web
+from yarl import URL
+
+UPSTREAM_URL = URL("https://api4.thetvdb.com/v4/")
+
+VOLATILE_PARAMS: Mapping[str, Collection[str]] = {"updates": {"since"}}
+"""Query parameters ignored when matching the requests to the fixtures, per endpoint (first path segment)."""
+
+EPISODES_PAGE_SIZE = 500
+"""Amount of episodes in a single page of the (synthetic) episode lists, same as in the real API."""
+
+SEASON_TYPES = ("official", "dvd", "absolute", "alternate", "regional", "altdvd", "alttwo")
+
+type JSON = dict[str, Any]
+type Synthesizer = Callable[[web.Request], JSON | None]
+
+
+@dataclass
+class Faults:
+    """Faults injected into the responses of the stand-in."""
+
+    latency: float = 0
+    """Time in seconds by which each response is delayed."""
+    jitter: float = 0
+    """Maximum time in seconds randomly added to the latency."""
+    error_rate: float = 0
+    """Fraction (0 to 1) of the requests answered with an error, instead of the actual response."""
+    error_statuses: Sequence[int] = (429, 500, 502, 503)
+    """Statuses of the injected errors, picked randomly."""
+    token_lifetime: float = 30 * 24 * 60 * 60
+    """Time in seconds after which the issued tokens expire (a month, same as in the real API)."""
+    unauthorized_rate: float = 0
+    """Fraction (0 to 1) of the requests answered with 401, revoking the token they were sent with."""
+
+
+@dataclass
+class StandInStats:
+    """Counters of the requests handled by the stand-in."""
+
+    requests: int = 0
+    replayed: int = 0
+    """Requests answered with a recorded fixture."""
+    recorded: int = 0
+    """Requests forwarded to the real API (and recorded)."""
+    synthesized: int = 0
+    """Requests answered with a generated record."""
+    missing: int = 0
+    """Requests answered with 404, as there was neither a fixture nor a generated record for them."""
+    injected_errors: int = 0
+    cancelled: int = 0
+    """Requests abandoned by the client before they were answered (e.g. the losing copy of a hedged request)."""
+    logins: int = 0
+    """Tokens that were issued."""
+    unauthorized: int = 0
+    """Requests answered with 401, as their token was missing, expired or revoked (including the injected ones)."""
+    endpoints: dict[str, int] = field(default_factory=dict)
+    """Amount of requests per endpoint (first path segment)."""
+
+
+class FixtureStore:
+    """Recorded responses, stored as JSON files (one per request) in a directory."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    @staticmethod
+    def key(path: str, query: Mapping[str, str]) -> str:
+        """Get the file name of the fixture for given request, ignoring the volatile query parameters."""
+        segments = path.strip("/").split("/")
+        ignored = VOLATILE_PARAMS.get(segments[0], ())
+        params = sorted((name, value) for name, value in query.items() if name not in ignored)
+        name = "_".join(segments)
+        if params:
+            name += "@" + urlencode(params, safe="")
+        return f"{name}.json"
+
+    def load(self, path: str, query: Mapping[str, str]) -> tuple[int, bytes] | None:
+        """Get the recorded status and body of the response to given request, if it was recorded."""
+        file = self.directory / self.key(path, query)
+        if not file.exists():
+            return None
+        fixture = json.loads(file.read_bytes())
+        return fixture["status"], json.dumps(fixture["body"]).encode()
+
+    def save(self, path: str, query: Mapping[str, str], status: int, body: bytes) -> None:
+        """Record the response to given request."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fixture = {"status": status, "body": json.loads(body)}
+        (self.directory / self.key(path, query)).write_text(json.dumps(fixture, ensure_ascii=False, indent=2))
+
+
+def _page_link(request: web.Request, page: int) -> str:
+    """Get the absolute URL of given page of the requested list, for the pagination links."""
+    # Not using `request.url`, as it can't be built from a host header that includes the port, on some versions
+    url = URL(f"{request.scheme}://{request.host}").join(request.rel_url)
+    return str(url.update_query(page=page))
+
+
+class SyntheticData:
+    """Generator of deterministic, made-up TVDB records.
+
+    The same request always gets the same record (for the same seed), so that the runs using these are
+    reproducible. The series are generated with between a few and a few thousand episodes, so that the
+    pagination of the episode lists gets exercised as well (about a third of them has more than one page).
+    """
+
+    LANGUAGES = ("eng", "deu", "fra", "spa", "jpn")
+    EPISODES_PER_SEASON = 20
+
+    def __init__(self, seed: int = 0) -> None:
+        self.seed = seed
+
+    def _rng(self, *parts: object) -> random.Random:
+        return random.Random("/".join(map(str, (self.seed, *parts))))
+
+    def _translations(self, name: str, overview: str) -> JSON:
+        return {
+            "nameTranslations": [
+                {"language": lang, "name": f"{name} ({lang})", "isPrimary": lang == "eng"} for lang in self.LANGUAGES
+            ],
+            "overviewTranslations": [
+                {"language": lang, "overview": f"{overview} ({lang})", "isPrimary": lang == "eng"}
+                for lang in self.LANGUAGES
+            ],
+        }
+
+    def episode_count(self, series_id: int) -> int:
+        """Get the amount of episodes of the series."""
+        rng = self._rng("series", series_id)
+        return rng.choice([1, 2, 5, 10, 50, 100]) * rng.randint(1, 5) * self.EPISODES_PER_SEASON // 2
+
+    def _media(self, kind: str, media_id: int, *, extended: bool, meta: str | None) -> JSON:
+        name = f"{kind.capitalize()} {media_id}"
+        overview = f"Overview of {name.lower()}."
+        record: JSON = {
+            "id": media_id,
+            "name": name,
+            "slug": f"{kind}-{media_id}",
+            "image": f"https://artworks.thetvdb.com/banners/{kind}/{media_id}/posters/1.jpg",
+            "aliases": [{"language": "eng", "name": f"The {name}"}],
+            "nameTranslations": list(self.LANGUAGES),
+            "overviewTranslations": list(self.LANGUAGES),
+        }
+        if kind == "series":
+            record["lastAired"] = "2020-01-01"
+        if not extended:
+            return record
+
+        record["overview"] = overview
+        if meta == "translations":
+            record["translations"] = self._translations(name, overview)
+        if kind == "series":
+            count = self.episode_count(media_id)
+            seasons = range(1, (count - 1) // self.EPISODES_PER_SEASON + 2)
+            record["seasons"] = [
+                {"id": media_id * 100 + number, "seriesId": media_id, "number": number, "type": {"type": "official"}}
+                for number in seasons
+            ]
+            if meta == "episodes":
+                record["episodes"] = [self._episode(media_id, index, None) for index in range(count)]
+        return record
+
+    def _episode(self, series_id: int, index: int, language: str | None) -> JSON:
+        season, number = divmod(index, self.EPISODES_PER_SEASON)
+        name = f"Episode {season + 1}x{number + 1:02} of series {series_id}"
+        overview = f"Overview of episode {season + 1}x{number + 1:02}."
+        if language is not None:
+            name, overview = f"{name} ({language})", f"{overview} ({language})"
+        return {
+            "id": series_id * 10_000 + index,
+            "seriesId": series_id,
+            "name": name,
+            "overview": overview,
+            "seasonNumber": season + 1,
+            "number": number + 1,
+            "aired": f"{2000 + season % 25}-{number % 12 + 1:02}-{number % 28 + 1:02}",
+            "image": f"https://artworks.thetvdb.com/banners/episodes/{series_id}/{index}.jpg",
+            "nameTranslations": list(self.LANGUAGES),
+            "overviewTranslations": list(self.LANGUAGES),
+        }
+
+    def series(self, request: web.Request) -> JSON | None:
+        """Generate a response of `/series/{id}[/extended]`."""
+        extended = request.path.endswith("/extended")
+        record = self._media(
+            "series", int(request.match_info["id"]), extended=extended, meta=request.query.get("meta")
+        )
+        return {"status": "success", "data": record}
+
+    def movie(self, request: web.Request) -> JSON | None:
+        """Generate a response of `/movies/{id}[/extended]`."""
+        extended = request.path.endswith("/extended")
+        record = self._media("movie", int(request.match_info["id"]), extended=extended, meta=request.query.get("meta"))
+        return {"status": "success", "data": record}
+
+    def episodes(self, request: web.Request) -> JSON | None:
+        """Generate a response of `/series/{id}/episodes/{season_type}[/{lang}]`."""
+        if request.match_info["season_type"] not in SEASON_TYPES:
+            return None
+        series_id = int(request.match_info["id"])
+        page = int(request.query.get("page", "0"))
+        count = self.episode_count(series_id)
+        language = request.match_info.get("lang")
+        indices = range(page * EPISODES_PAGE_SIZE, min((page + 1) * EPISODES_PAGE_SIZE, count))
+        has_next = (page + 1) * EPISODES_PAGE_SIZE < count
+        return {
+            "status": "success",
+            "data": {
+                "series": self._media("series", series_id, extended=False, meta=None),
+                "episodes": [self._episode(series_id, index, language) for index in indices],
+            },
+            "links": {
+                "prev": _page_link(request, page - 1) if page else None,
+                "self": _page_link(request, page),
+                "next": _page_link(request, page + 1) if has_next else None,
+                "total_items": count,
+                "page_size": EPISODES_PAGE_SIZE,
+            },
+        }
+
+    def episode(self, request: web.Request) -> JSON | None:
+        """Generate a response of `/episodes/{id}[/extended]`."""
+        series_id, index = divmod(int(request.match_info["id"]), 10_000)
+        if not series_id or index >= self.episode_count(series_id):
+            return None
+        record = self._episode(series_id, index, None)
+        if request.path.endswith("/extended") and request.query.get("meta") == "translations":
+            record["translations"] = self._translations(record["name"], record["overview"])
+        return {"status": "success", "data": record}
+
+    def search(self, request: web.Request) -> JSON | None:
+        """Generate a response of `/search`.
+
+        About a tenth of the queries have no results, the rest get up to `limit` results.
+        """
+        query = request.query.get("query", "")
+        limit = int(request.query.get("limit", "50"))
+        rng = self._rng("search", query.casefold())
+        if rng.random() < 0.1:
+            return {"status": "success", "data": []}
+
+        results: list[JSON] = []
+        for position in range(min(limit, rng.randint(1, 20))):
+            kind = request.query.get("type") or rng.choice(["series", "movie"])
+            media_id = rng.randint(1, 400_000)
+            name = query.title() if position == 0 else f"{query.title()} {position + 1}"
+            results.append(
+                {
+                    "objectID": f"{kind}-{media_id}",
+                    "id": f"{kind}-{media_id}",
+                    "tvdb_id": str(media_id),
+                    "type": kind,
+                    "name": name,
+                    "slug": f"{kind}-{media_id}",
+                    "image_url": f"https://artworks.thetvdb.com/banners/{kind}/{media_id}/posters/1.jpg",
+                    "overview": f"Overview of {name}.",
+                    "overviews": {"eng": f"Overview of {name}."},
+                    "translations": {"eng": name},
+                    "aliases": [],
+                }
+            )
+        return {"status": "success", "data": results}
+
+    def updates(self, request: web.Request) -> JSON | None:
+        """Generate a response of `/updates` (nothing ever changes)."""
+        return {"status": "success", "data": [], "links": {"prev": None, "self": _page_link(request, 0), "next": None}}
+
+
+class StandIn:
+    """Request handlers of the stand-in server (see :func:`create_app`)."""
+
+    def __init__(
+        self,
+        fixtures: FixtureStore | None,
+        *,
+        synthetic: SyntheticData | None = None,
+        record: bool = False,
+        faults: Faults | None = None,
+        seed: int = 0,
+        upstream: URL = UPSTREAM_URL,
+    ) -> None:
+        """Initialize the stand-in.
+
+        :param fixtures: The recorded responses to replay (and to record the new responses into).
+        :param synthetic: If set, the requests without a fixture are answered with generated records.
+        :param record:
+            Forward the requests without a fixture to the real TVDB API, recording the responses. The login
+            is forwarded too, so the API key of the bot has to be valid. The faults aren't injected meanwhile.
+        :param faults: Faults to inject into the responses.
+        :param seed: Seed of the randomness of the injected faults.
+        :param upstream: The API to forward the requests to when recording, can be another stand-in.
+        """
+        if record and fixtures is None:
+            raise ValueError("Recording requires a fixtures directory.")
+
+        self.fixtures = fixtures
+        self.synthetic = synthetic
+        self.record = record
+        self.upstream = upstream
+        self.faults = faults or Faults()
+        self.stats = StandInStats()
+        self._random = random.Random(seed)
+        self._tokens: dict[str, float] = {}
+        """The issued tokens which weren't revoked, with the (epoch) times when they expire."""
+        self._upstream: aiohttp.ClientSession | None = None
+
+    async def _upstream_session(self) -> aiohttp.ClientSession:
+        if self._upstream is None:
+            self._upstream = aiohttp.ClientSession()
+        return self._upstream
+
+    async def close(self) -> None:
+        """Close the session used for recording, if it was opened."""
+        if self._upstream is not None:
+            await self._upstream.close()
+
+    async def login(self, request: web.Request) -> web.Response:
+        """Handle `/login`, issuing a token accepted by the other endpoints."""
+        if self.record:
+            session = await self._upstream_session()
+            async with session.post(self.upstream / "login", json=await request.json()) as response:
+                return web.Response(
+                    status=response.status, body=await response.read(), content_type="application/json"
+                )
+
+        body = await request.json()
+        if not isinstance(body, dict) or not body.get("apikey"):
+            return web.json_response({"status": "failure", "message": "InvalidAPIKey", "data": None}, status=401)
+        token = self._issue_token()
+        return web.json_response({"status": "success", "data": {"token": token}})
+
+    def _issue_token(self) -> str:
+        """Issue a new token, shaped like the JWTs of the real API, so that the clients can read its expiry."""
+        expires_at = time.time() + self.faults.token_lifetime
+        claims = {"exp": int(expires_at), "jti": secrets.token_hex(8)}
+        payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=").decode()
+        token = f"stand-in.{payload}.{secrets.token_hex(16)}"
+        self._tokens[token] = expires_at
+        self.stats.logins += 1
+        return token
+
+    def revoke_tokens(self) -> None:
+        """Revoke all of the issued tokens, so that the requests sent with them get rejected with 401."""
+        self._tokens.clear()
+
+    def _authorize(self, request: web.Request) -> bool:
+        """Check the token of the request, revoking it if it gets rejected by an injected fault."""
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        expires_at = self._tokens.get(token)
+        if expires_at is None or time.time() >= expires_at:
+            return False
+        if self._random.random() < self.faults.unauthorized_rate:
+            del self._tokens[token]
+            return False
+        return True
+
+    def handler(self, synthesize: Synthesizer) -> Callable[[web.Request], Awaitable[web.Response]]:
+        """Create a handler of an endpoint, generating the missing responses with given synthesizer."""
+
+        async def _handle(request: web.Request) -> web.Response:
+            try:
+                return await self._respond(request, synthesize)
+            except asyncio.CancelledError:
+                # The handlers only get cancelled if the server was set up with `handler_cancellation`
+                self.stats.cancelled += 1
+                raise
+
+        return _handle
+
+    async def _respond(self, request: web.Request, synthesize: Synthesizer) -> web.Response:
+        endpoint = request.path.strip("/").split("/", 1)[0]
+        self.stats.requests += 1
+        self.stats.endpoints[endpoint] = self.stats.endpoints.get(endpoint, 0) + 1
+
+        if self.record:
+            return await self._forward(request)
+
+        if not self._authorize(request):
+            self.stats.unauthorized += 1
+            return web.json_response({"status": "failure", "message": "Unauthorized", "data": None}, status=401)
+
+        await asyncio.sleep(self.faults.latency + self._random.uniform(0, self.faults.jitter))
+        if self._random.random() < self.faults.error_rate:
+            self.stats.injected_errors += 1
+            status = self._random.choice(self.faults.error_statuses)
+            headers = {"Retry-After": "1"} if status == 429 else None
+            return web.json_response(
+                {"status": "failure", "message": "Injected error"}, status=status, headers=headers
+            )
+
+        if self.fixtures is not None and (fixture := self.fixtures.load(request.path, request.query)) is not None:
+            self.stats.replayed += 1
+            status, body = fixture
+            return web.Response(status=status, body=body, content_type="application/json")
+
+        if self.synthetic is not None and (data := synthesize(request)) is not None:
+            self.stats.synthesized += 1
+            return web.json_response(data)
+
+        self.stats.missing += 1
+        return web.json_response({"status": "failure", "message": "NotFoundException", "data": None}, status=404)
+
+    async def _forward(self, request: web.Request) -> web.Response:
+        """Forward the request to the real TVDB API, recording the response (unless it's an error)."""
+        if self.fixtures is not None and (fixture := self.fixtures.load(request.path, request.query)) is not None:
+            self.stats.replayed += 1
+            status, body = fixture
+            return web.Response(status=status, body=body, content_type="application/json")
+
+        session = await self._upstream_session()
+        url = (self.upstream / request.path.lstrip("/")).with_query(request.query)
+        headers = {"Authorization": request.headers.get("Authorization", ""), "Accept": "application/json"}
+        async with session.get(url, headers=headers) as response:
+            body = await response.read()
+            if self.fixtures is not None and response.status in {200, 404}:
+                self.fixtures.save(request.path, request.query, response.status, body)
+                self.stats.recorded += 1
+            return web.Response(status=response.status, body=body, content_type="application/json")
+
+
+def create_app(stand_in: StandIn) -> web.Application:
+    """Create the app of the stand-in server, serving the emulated TVDB API endpoints at its root."""
+    synthetic = stand_in.synthetic or SyntheticData()
+    app = web.Application()
+    app.router.add_post("/login", stand_in.login)
+    routes: list[tuple[str, Synthesizer]] = [
+        ("/search", synthetic.search),
+        ("/series/{id:\\d+}", synthetic.series),
+        ("/series/{id:\\d+}/extended", synthetic.series),
+        ("/series/{id:\\d+}/episodes/{season_type}", synthetic.episodes),
+        ("/series/{id:\\d+}/episodes/{season_type}/{lang}", synthetic.episodes),
+        ("/movies/{id:\\d+}", synthetic.movie),
+        ("/movies/{id:\\d+}/extended", synthetic.movie),
+        ("/episodes/{id:\\d+}", synthetic.episode),
+        ("/episodes/{id:\\d+}/extended", synthetic.episode),
+        ("/updates", synthetic.updates),
+    ]
+    for path, synthesize in routes:
+        app.router.add_get(path, stand_in.handler(synthesize))
+
+    async def _cleanup(_: web.Application) -> AsyncIterator[None]:
+        yield
+        await stand_in.close()
+
+    app.cleanup_ctx.append(_cleanup)
+    return app
+
+
+def main() -> None:
+    """The main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Run a local stand-in for the TVDB API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--fixtures", type=Path, default=Path("./tvdb-fixtures"), help="Directory of the fixtures.")
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Forward the requests without a fixture to the real TVDB API, recording the responses.",
+    )
+    parser.add_argument(
+        "--synthetic",
+        action="store_true",
+        help="Answer the requests without a fixture with generated records, instead of 404.",
+    )
+    parser.add_argument("--latency", type=float, default=0, help="Latency of each response, in milliseconds.")
+    parser.add_argument("--jitter", type=float, default=0, help="Maximum random extra latency, in milliseconds.")
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0,
+        help="Fraction (0 to 1) of the requests answered with an error.",
+    )
+    parser.add_argument(
+        "--error-statuses",
+        default="429,500,502,503",
+        help="Comma separated statuses of the injected errors.",
+    )
+    parser.add_argument(
+        "--token-lifetime",
+        type=float,
+        default=Faults.token_lifetime,
+        help="Time in seconds after which the issued tokens expire.",
+    )
+    parser.add_argument(
+        "--unauthorized-rate",
+        type=float,
+        default=0,
+        help="Fraction (0 to 1) of the requests answered with 401, revoking their token.",
+    )
+    parser.add_argument("--upstream", type=URL, default=UPSTREAM_URL, help="The API to record the responses from.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated records and of the faults.")
+    args = parser.parse_args()
+
+    faults = Faults(
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        error_rate=args.error_rate,
+        error_statuses=[int(status) for status in args.error_statuses.split(",")],
+        token_lifetime=args.token_lifetime,
+        unauthorized_rate=args.unauthorized_rate,
+    )
+    stand_in = StandIn(
+        FixtureStore(args.fixtures),
+        synthetic=SyntheticData(args.seed) if args.synthetic else None,
+        record=args.record,
+        faults=faults,
+        seed=args.seed,
+        upstream=args.upstream,
+    )
+    print(f"Serving the TVDB stand-in at http://{args.host}:{args.port}/")  # noqa: T201
+    web.run_app(create_app(stand_in), host=args.host, port=args.port, print=None, handler_cancellation=True)
+
+
+if __name__ == "__main__":
+    main()